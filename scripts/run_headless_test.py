@@ -84,6 +84,13 @@ Examples:
         help="Path to output JSON file (default: stdout)",
     )
     
+    parser.add_argument(
+        "--max-workers",
+        dest="max_workers",
+        type=int,
+        help="Number of IPE extractions to run concurrently (default: 1, sequential)",
+    )
+    
     parser.add_argument(
         "--no-bridges",
         dest="no_bridges",
@@ -159,6 +166,9 @@ def build_params(args: argparse.Namespace) -> Dict[str, Any]:
     if args.ipes:
         params['required_ipes'] = [ipe.strip() for ipe in args.ipes.split(',')]
     
+    if args.max_workers:
+        params['max_workers'] = args.max_workers
+    
     if args.no_bridges:
         params['run_bridges'] = False
     
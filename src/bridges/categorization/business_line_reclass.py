@@ -30,6 +30,7 @@ Data Source:
 """
 
 from typing import Dict, Any, Optional
+import numpy as np
 import pandas as pd
 import logging
 
@@ -191,16 +192,11 @@ def identify_business_line_reclass_candidates(
         logger.info("No balances above minimum threshold. Returning empty candidates.")
         return _create_empty_result()
 
-    # Count number of business lines per customer
-    bl_counts = (
-        agg_df.groupby("customer_id")["business_line_code"]
-        .nunique()
-        .rename("num_business_lines_for_customer")
+    # Count number of business lines per customer (one row per customer + BL)
+    agg_df["num_business_lines_for_customer"] = (
+        agg_df.groupby("customer_id")["business_line_code"].transform("size")
     )
 
-    # Join count back to aggregated data
-    agg_df = agg_df.merge(bl_counts, on="customer_id", how="left")
-
     # Filter: Only customers with multiple business lines
     candidates_df = agg_df[agg_df["num_business_lines_for_customer"] > 1].copy()
 
@@ -218,61 +214,45 @@ def identify_business_line_reclass_candidates(
 
     # For each customer, determine proposed primary business line
     # Heuristic: Business line with largest absolute balance
-    def _compute_primary_bl(group: pd.DataFrame) -> pd.Series:
-        """
-        Compute proposed primary business line for a customer group.
-
-        Uses heuristic: largest absolute balance.
-        Tie-breaker: alphabetical order (deterministic).
-        """
-        # Find row with largest absolute balance
-        max_abs_idx = group["balance_lcy"].abs().idxmax()
-        primary_bl = group.loc[max_abs_idx, "business_line_code"]
-
-        # Handle tie-breaker: if multiple BLs have same abs balance, choose alphabetically
-        max_abs_value = group["balance_lcy"].abs().max()
-        tied_bls = group[group["balance_lcy"].abs() == max_abs_value][
-            "business_line_code"
-        ].sort_values()
-
-        if len(tied_bls) > 1:
-            primary_bl = tied_bls.iloc[0]  # First alphabetically
-
-        # Assign primary BL to all rows in group
-        group["proposed_primary_business_line"] = primary_bl
-        return group
-
-    # Apply primary BL computation per customer
-    candidates_df = (
-        candidates_df.groupby("customer_id", group_keys=False)
-        .apply(_compute_primary_bl)
-        .reset_index(drop=True)
+    # Tie-breaker: alphabetical order (deterministic)
+    primary_df = (
+        candidates_df.assign(abs_balance=candidates_df["balance_lcy"].abs())
+        .sort_values(
+            ["customer_id", "abs_balance", "business_line_code"],
+            ascending=[True, False, True],
+            kind="mergesort",
+        )
+        .drop_duplicates("customer_id")
+        [["customer_id", "business_line_code"]]
+        .rename(columns={"business_line_code": "proposed_primary_business_line"})
     )
+    candidates_df = candidates_df.merge(primary_df, on="customer_id", how="left")
 
     # Compute proposed reclass amount
     # Logic: If current BL is NOT primary, reclass FULL balance to primary
     # If current BL IS primary, no reclass needed (0.0)
-    candidates_df["proposed_reclass_amount_lcy"] = candidates_df.apply(
-        lambda row: row["balance_lcy"]
-        if row["business_line_code"] != row["proposed_primary_business_line"]
-        else 0.0,
-        axis=1,
+    is_primary = (
+        candidates_df["business_line_code"] == candidates_df["proposed_primary_business_line"]
+    ).to_numpy()
+    candidates_df["proposed_reclass_amount_lcy"] = np.where(
+        is_primary, 0.0, candidates_df["balance_lcy"]
     )
 
     # Generate reasoning column
-    candidates_df["reasoning"] = candidates_df.apply(
-        lambda row: (
-            f"Customer {row['customer_id']} has {row['num_business_lines_for_customer']} "
-            f"business lines. Proposed primary: {row['proposed_primary_business_line']} "
-            f"(largest absolute balance). "
-            + (
-                f"Reclass {row['balance_lcy']:.2f} from {row['business_line_code']} to "
-                f"{row['proposed_primary_business_line']}."
-                if row["business_line_code"] != row["proposed_primary_business_line"]
-                else f"Current BL is proposed primary. No reclass needed."
-            )
-        ),
-        axis=1,
+    customer = candidates_df["customer_id"].astype(str)
+    business_line = candidates_df["business_line_code"].astype(str)
+    primary = candidates_df["proposed_primary_business_line"].astype(str)
+    balance = pd.Series(
+        np.char.mod("%.2f", candidates_df["balance_lcy"].to_numpy()),
+        index=candidates_df.index,
+    )
+    reclass_text = "Reclass " + balance + " from " + business_line + " to " + primary + "."
+    candidates_df["reasoning"] = (
+        "Customer " + customer + " has "
+        + candidates_df["num_business_lines_for_customer"].astype(str)
+        + " business lines. Proposed primary: " + primary
+        + " (largest absolute balance). "
+        + reclass_text.where(~is_primary, "Current BL is proposed primary. No reclass needed.")
     )
 
     # All candidates require manual review
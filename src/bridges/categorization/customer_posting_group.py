@@ -40,28 +40,33 @@ def calculate_customer_posting_group_bridge(
     if missing_cols:
         raise ValueError(f"Missing required columns: {missing_cols}")
 
-    # Group by Customer No_ and get unique posting groups
-    customer_groups = (
-        ipe_07_df.groupby("Customer No_")
-        .agg(
-            {
-                "Customer Name": "first",  # Get the first name (they should all be the same)
-                "Customer Posting Group": lambda x: list(x.dropna().unique()),
-            }
-        )
-        .reset_index()
-    )
+    # Count unique posting groups per customer; only customers with more
+    # than one are materialized further
+    posting_group_counts = ipe_07_df.groupby("Customer No_")["Customer Posting Group"].nunique()
+    problem_ids = posting_group_counts.index[posting_group_counts > 1]
+
+    problem_rows = ipe_07_df.loc[
+        ipe_07_df["Customer No_"].isin(problem_ids), required_cols
+    ]
 
-    # Filter to only customers with more than one unique posting group
-    problem_customers = customer_groups[
-        customer_groups["Customer Posting Group"].apply(lambda x: len(x) > 1)
-    ].copy()
+    # Get the first name (they should all be the same)
+    customer_names = problem_rows.groupby("Customer No_")["Customer Name"].first()
+
+    # Sorted unique posting groups as a comma-separated string
+    posting_groups = (
+        problem_rows[["Customer No_", "Customer Posting Group"]]
+        .dropna(subset=["Customer Posting Group"])
+        .drop_duplicates()
+    )
+    posting_groups = posting_groups.assign(
+        **{"Customer Posting Group": posting_groups["Customer Posting Group"].astype(str)}
+    ).sort_values(["Customer No_", "Customer Posting Group"], kind="mergesort")
+    joined_groups = posting_groups.groupby("Customer No_")["Customer Posting Group"].agg(", ".join)
 
-    # Convert list of posting groups to comma-separated string for output
-    if not problem_customers.empty:
-        problem_customers["Customer Posting Group"] = problem_customers[
-            "Customer Posting Group"
-        ].apply(lambda x: ", ".join(sorted(str(pg) for pg in x)))
+    problem_customers = pd.DataFrame({
+        "Customer Name": customer_names,
+        "Customer Posting Group": joined_groups,
+    }).rename_axis("Customer No_").reset_index()
 
     # Bridge amount is always 0 for identification tasks
     bridge_amount = 0.0
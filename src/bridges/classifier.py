@@ -14,24 +14,58 @@ For NAV voucher categorization, use the modular pipeline from src.bridges.catego
 """
 
 from __future__ import annotations
-from typing import List
+from typing import Dict, FrozenSet, List
+import numpy as np
 import pandas as pd
 
 from src.bridges.catalog import BridgeRule
 
 
-def _row_matches_rule(row: pd.Series, rule: BridgeRule) -> bool:
-    for col, values in rule.triggers.items():
-        if col not in row.index:
-            # If the column isn't present, this rule can't fire on this row
-            return False
-        val = row[col]
-        if pd.isna(val):
-            return False
-        sval = str(val)
-        if not any(sval == v or sval.lower() == str(v).lower() for v in values):
-            return False
-    return True
+_OUTPUT_COLUMNS = [
+    "bridge_key",
+    "bridge_title",
+    "dr_gl_accounts",
+    "cr_gl_accounts",
+    "required_enrichments",
+]
+
+
+def _compile_triggers(rule: BridgeRule) -> Dict[str, FrozenSet[str]]:
+    """Lower-cased lookup set of trigger values per column."""
+    return {
+        col: frozenset(str(v).lower() for v in values)
+        for col, values in rule.triggers.items()
+    }
+
+
+def _rule_mask(
+    df: pd.DataFrame,
+    triggers: Dict[str, FrozenSet[str]],
+    lowered: Dict[str, pd.Series],
+) -> np.ndarray:
+    """Boolean mask of rows matching every trigger column of a rule.
+
+    A row matches a column when its non-null value, as a string, equals one of
+    the trigger values ignoring case. A missing column never matches.
+    """
+    mask = np.ones(len(df), dtype=bool)
+    for col, values in triggers.items():
+        if col not in df.columns:
+            return np.zeros(len(df), dtype=bool)
+        if col not in lowered:
+            series = df[col]
+            lowered[col] = series.astype(str).str.lower().where(series.notna())
+        mask &= lowered[col].isin(values).to_numpy()
+    return mask
+
+
+def _output_value(rule: BridgeRule, col: str) -> str:
+    if col == "bridge_key":
+        return rule.key
+    if col == "bridge_title":
+        return rule.title
+    # GL accounts and enrichments are stored as lists, output as comma strings
+    return ",".join(getattr(rule, col))
 
 
 def classify_bridges(df: pd.DataFrame, rules: List[BridgeRule]) -> pd.DataFrame:
@@ -43,31 +77,28 @@ def classify_bridges(df: pd.DataFrame, rules: List[BridgeRule]) -> pd.DataFrame:
     - required_enrichments (comma string)
 
     If multiple rules match, the first in the list wins (order defines priority).
+    Triggers are evaluated as one vectorized mask per rule, and the outputs are
+    assigned with np.select in priority order.
     """
     if df is None or df.empty:
         return df.copy()
 
     out = df.copy()
-    out["bridge_key"] = None
-    out["bridge_title"] = None
-    out["dr_gl_accounts"] = None
-    out["cr_gl_accounts"] = None
-    out["required_enrichments"] = None
 
     # Sort rules by explicit priority rank (lower is higher priority)
     rules_sorted = sorted(rules, key=lambda r: getattr(r, "priority_rank", 2))
 
-    for idx, row in out.iterrows():
-        for rule in rules_sorted:
-            if _row_matches_rule(row, rule):
-                out.at[idx, "bridge_key"] = rule.key
-                out.at[idx, "bridge_title"] = rule.title
-                out.at[idx, "dr_gl_accounts"] = ",".join(rule.dr_gl_accounts)
-                out.at[idx, "cr_gl_accounts"] = ",".join(rule.cr_gl_accounts)
-                out.at[idx, "required_enrichments"] = ",".join(
-                    rule.required_enrichments
-                )
-                break
+    lowered: Dict[str, pd.Series] = {}
+    masks = [_rule_mask(out, _compile_triggers(rule), lowered) for rule in rules_sorted]
+
+    # Index of the first matching rule per row; -1 (no match) maps to None
+    if masks:
+        rule_index = np.select(masks, list(range(len(masks))), default=-1)
+    else:
+        rule_index = np.full(len(out), -1)
+    for col in _OUTPUT_COLUMNS:
+        lookup = np.array([_output_value(rule, col) for rule in rules_sorted] + [None], dtype=object)
+        out[col] = lookup[rule_index]
 
     return out
 
@@ -0,0 +1,316 @@
+"""
+Dataset Cache Module
+
+Local columnar cache for extracted IPE datasets, stored as Arrow IPC files and
+loaded through memory mapping.
+
+Entries are keyed by (item_id, SQL hash, params hash, schema contract hash):
+re-running a period with unchanged SQL, parameters and contract loads the
+previous extraction in seconds instead of re-querying SQL Server or
+re-parsing fixture CSVs. Any change to one of the key parts misses the cache.
+
+The cache is opt-in because a hit skips the live database: enable it with the
+``use_dataset_cache`` / ``dataset_cache_dir`` params or the
+``SOX_DATASET_CACHE_DIR`` environment variable.
+
+Example:
+    >>> cache = DatasetCache("/tmp/sox_cache")
+    >>> key = build_cache_key("IPE_07", sql=final_query, params={"cutoff_date": "2025-09-30"})
+    >>> df = cache.get(key)
+    >>> if df is None:
+    ...     df = extract()
+    ...     cache.put(key, df)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "DatasetCacheKey",
+    "DatasetCache",
+    "build_cache_key",
+    "file_fingerprint",
+    "read_csv_cached",
+]
+
+# Repository root path
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
+
+DEFAULT_CACHE_DIR = os.path.join(REPO_ROOT, ".cache", "datasets")
+CACHE_DIR_ENV_VAR = "SOX_DATASET_CACHE_DIR"
+
+_METADATA_KEY = b"sox_dataset_cache"
+
+
+@dataclass(frozen=True)
+class DatasetCacheKey:
+    """Identity of a cached extraction."""
+    item_id: str
+    sql_hash: str
+    params_hash: str
+    contract_hash: str
+
+    @property
+    def digest(self) -> str:
+        """Stable file name component derived from all key parts."""
+        raw = "|".join([self.item_id, self.sql_hash, self.params_hash, self.contract_hash])
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def to_dict(self) -> Dict[str, str]:
+        return {
+            "item_id": self.item_id,
+            "sql_hash": self.sql_hash,
+            "params_hash": self.params_hash,
+            "contract_hash": self.contract_hash,
+        }
+
+
+def _sha256_text(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _contract_hash(item_id: str) -> str:
+    """Hash of the active schema contract, or '' when the item has none."""
+    from src.core.schema.contract_registry import get_active_contract
+
+    try:
+        return get_active_contract(item_id).contract_hash or ""
+    except Exception:
+        return ""
+
+
+def file_fingerprint(path: str) -> str:
+    """
+    Cheap identity of a source file (absolute path, size, modification time).
+
+    Used as the "SQL hash" of file-backed datasets such as fixture CSVs so an
+    edited file misses the cache without hashing its full content.
+    """
+    stat = os.stat(path)
+    return _sha256_text(f"{os.path.abspath(path)}|{stat.st_size}|{stat.st_mtime_ns}")
+
+
+def build_cache_key(
+    item_id: str,
+    sql: Optional[str] = None,
+    params: Optional[Dict[str, Any]] = None,
+    contract_hash: Optional[str] = None,
+) -> DatasetCacheKey:
+    """
+    Build the cache key of a dataset.
+
+    Args:
+        item_id: IPE or CR identifier
+        sql: Rendered SQL text (or a source fingerprint for file-backed data)
+        params: Parameters bound at execution time that are not already
+            rendered into the SQL text
+        contract_hash: Schema contract hash (default: active contract of item_id)
+
+    Returns:
+        DatasetCacheKey
+    """
+    if contract_hash is None:
+        contract_hash = _contract_hash(item_id)
+    return DatasetCacheKey(
+        item_id=item_id,
+        sql_hash=_sha256_text(sql or ""),
+        params_hash=_sha256_text(json.dumps(params or {}, sort_keys=True, default=str)),
+        contract_hash=contract_hash,
+    )
+
+
+class DatasetCache:
+    """
+    Arrow IPC dataset cache rooted at a local directory.
+
+    Files are laid out as ``<cache_dir>/<item_id>/<key digest>.arrow`` and are
+    written atomically. Reads memory-map the file, so loading a cached
+    extraction costs little more than the final pandas conversion.
+
+    Args:
+        cache_dir: Root directory of the cache
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR):
+        self.cache_dir = Path(cache_dir)
+
+    @classmethod
+    def from_params(cls, params: Optional[Dict[str, Any]]) -> Optional["DatasetCache"]:
+        """
+        Create the cache configured by run params or environment, if enabled.
+
+        Enabled when params contain ``dataset_cache_dir`` or a truthy
+        ``use_dataset_cache``, or when SOX_DATASET_CACHE_DIR is set.
+        ``use_dataset_cache=False`` disables it explicitly.
+
+        Returns:
+            DatasetCache instance, or None when caching is disabled
+        """
+        params = params or {}
+        if params.get("use_dataset_cache") is False:
+            return None
+        cache_dir = params.get("dataset_cache_dir") or os.getenv(CACHE_DIR_ENV_VAR)
+        if cache_dir:
+            return cls(cache_dir)
+        if params.get("use_dataset_cache"):
+            return cls()
+        return None
+
+    def path_for(self, key: DatasetCacheKey) -> Path:
+        """Location of the cache file for a key."""
+        return self.cache_dir / key.item_id / f"{key.digest}.arrow"
+
+    def get(self, key: DatasetCacheKey) -> Optional[pd.DataFrame]:
+        """
+        Load a cached dataset.
+
+        Returns:
+            DataFrame, or None on a miss or an unreadable entry
+        """
+        path = self.path_for(key)
+        if not path.exists():
+            logger.debug(f"Dataset cache miss for {key.item_id}")
+            return None
+        try:
+            with pa.memory_map(str(path), "r") as source:
+                table = pa.ipc.open_file(source).read_all()
+            df = table.to_pandas()
+            entry_metadata = json.loads((table.schema.metadata or {}).get(_METADATA_KEY, b"{}"))
+            _restore_nan_columns(df, entry_metadata.get("nan_columns", []))
+            logger.info(f"Dataset cache hit for {key.item_id}: {len(df)} rows from {path}")
+            return df
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable dataset cache entry {path}: {e}")
+            return None
+
+    def get_metadata(self, key: DatasetCacheKey) -> Dict[str, Any]:
+        """Metadata stored alongside a cached dataset ({} on a miss)."""
+        path = self.path_for(key)
+        if not path.exists():
+            return {}
+        try:
+            with pa.memory_map(str(path), "r") as source:
+                schema_metadata = pa.ipc.open_file(source).schema.metadata or {}
+            return json.loads(schema_metadata.get(_METADATA_KEY, b"{}"))
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable dataset cache metadata {path}: {e}")
+            return {}
+
+    def put(self, key: DatasetCacheKey, df: pd.DataFrame,
+            metadata: Optional[Dict[str, Any]] = None) -> Optional[Path]:
+        """
+        Store a dataset under a key.
+
+        Caching is best effort: datasets Arrow cannot represent (e.g. object
+        columns mixing strings and numbers) are logged and skipped.
+
+        Args:
+            key: Cache key
+            df: Dataset to store
+            metadata: JSON-serializable metadata (e.g. evidence ZIP path)
+
+        Returns:
+            Path of the written file, or None if the dataset was not cached
+        """
+        path = self.path_for(key)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            entry_metadata = {
+                "key": key.to_dict(),
+                "rows": len(df),
+                "nan_columns": _nan_columns(df),
+                **(metadata or {}),
+            }
+            table = table.replace_schema_metadata({
+                **(table.schema.metadata or {}),
+                _METADATA_KEY: json.dumps(entry_metadata, default=str).encode("utf-8"),
+            })
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with pa.OSFile(str(tmp_path), "wb") as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+            os.replace(tmp_path, path)
+            logger.info(f"Cached {key.item_id} dataset ({len(df)} rows) at {path}")
+            return path
+        except Exception as e:
+            logger.warning(f"Could not cache dataset for {key.item_id}: {e}")
+            if tmp_path.exists():
+                tmp_path.unlink()
+            return None
+
+    def invalidate(self, item_id: Optional[str] = None) -> None:
+        """Remove cached entries for one item, or the whole cache."""
+        target = self.cache_dir / item_id if item_id else self.cache_dir
+        if target.exists():
+            shutil.rmtree(target)
+            logger.info(f"Dataset cache invalidated: {target}")
+
+
+def _nan_columns(df: pd.DataFrame) -> list:
+    """
+    Object columns whose missing values are all float NaN.
+
+    Arrow stores every missing value as null and to_pandas() returns None in
+    object columns, while pd.read_csv yields NaN. These column names are kept
+    in the entry metadata so get() restores the NaN marker.
+    """
+    columns = []
+    for position, column in enumerate(df.columns):
+        series = df.iloc[:, position]
+        if series.dtype != object:
+            continue
+        missing = series.to_numpy()[series.isna().to_numpy()]
+        if missing.size and all(isinstance(value, float) for value in missing):
+            columns.append(str(column))
+    return columns
+
+
+def _restore_nan_columns(df: pd.DataFrame, columns: list) -> None:
+    """Replace the None values Arrow returns with NaN in the given columns."""
+    for column in columns:
+        if column not in df.columns:
+            continue
+        values = df[column].to_numpy(dtype=object, copy=True)
+        values[pd.isna(values)] = np.nan
+        df[column] = values
+
+
+def read_csv_cached(path: str, item_id: str, cache: Optional[DatasetCache] = None,
+                    **read_csv_kwargs) -> pd.DataFrame:
+    """
+    Read a CSV file through the dataset cache.
+
+    The key combines the file fingerprint, the read options and the item's
+    schema contract hash, so editing the file misses the cache.
+
+    Args:
+        path: CSV file path
+        item_id: Dataset identifier used for the cache layout and contract hash
+        cache: DatasetCache, or None to read the CSV directly
+        **read_csv_kwargs: Options forwarded to pd.read_csv
+
+    Returns:
+        DataFrame with the CSV content
+    """
+    if cache is None:
+        return pd.read_csv(path, **read_csv_kwargs)
+
+    key = build_cache_key(item_id, sql=file_fingerprint(path), params=read_csv_kwargs)
+    df = cache.get(key)
+    if df is None:
+        df = pd.read_csv(path, **read_csv_kwargs)
+        cache.put(key, df, metadata={"source_file": os.path.abspath(path)})
+    return df
@@ -9,6 +9,16 @@ from src.core.evidence.manager import (
     IPEEvidenceGenerator,
     EvidenceValidator,
 )
+from src.core.evidence.integrity import (
+    DEFAULT_HASH_ALGORITHM,
+    HASH_ALGORITHM_LEGACY,
+    compute_integrity_hash,
+    verify_integrity_hash,
+)
+from src.core.evidence.streaming import (
+    ChunkedDatasetWriter,
+    StreamedDataset,
+)
 from src.core.evidence.evidence_locator import (
     get_latest_evidence_zip,
     find_evidence_packages,
@@ -18,6 +28,12 @@ __all__ = [
     'DigitalEvidenceManager',
     'IPEEvidenceGenerator',
     'EvidenceValidator',
+    'DEFAULT_HASH_ALGORITHM',
+    'HASH_ALGORITHM_LEGACY',
+    'compute_integrity_hash',
+    'verify_integrity_hash',
+    'ChunkedDatasetWriter',
+    'StreamedDataset',
     'get_latest_evidence_zip',
     'find_evidence_packages',
 ]
@@ -0,0 +1,294 @@
+"""
+Integrity Hash Schemes
+
+Versioned algorithms used to compute the ``05_integrity_hash.json`` digest of
+an extracted dataset. Every scheme is exposed as an incremental hasher with
+``update(chunk)`` / ``hexdigest()`` so it can be fed chunk by chunk, and is
+registered under the algorithm id written to the evidence package.
+
+Schemes:
+    - ``SHA-256`` (legacy): sort by all columns, export to CSV, SHA-256.
+      Needs the full dataset in memory; kept to verify existing packages.
+    - ``SHA-256/sorted-row-digests/v2`` (default): 128-bit row hashes of the
+      canonical column text, computed in bulk with
+      ``pandas.util.hash_pandas_object`` and combined with SHA-256 after
+      sorting. Independent of row order, needs no DataFrame sort and keeps
+      16 bytes per row.
+
+Example:
+    >>> hasher = get_hasher()
+    >>> for chunk in chunks:
+    ...     hasher.update(chunk)
+    >>> hash_value = hasher.hexdigest()
+"""
+
+import datetime as dt
+import decimal
+import hashlib
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "HASH_ALGORITHM_LEGACY",
+    "HASH_ALGORITHM_ROW_DIGESTS_V2",
+    "DEFAULT_HASH_ALGORITHM",
+    "LegacySortedCsvHasher",
+    "SortedRowDigestHasher",
+    "get_hasher",
+    "compute_integrity_hash",
+    "verify_integrity_hash",
+]
+
+HASH_ALGORITHM_LEGACY = "SHA-256"
+HASH_ALGORITHM_ROW_DIGESTS_V2 = "SHA-256/sorted-row-digests/v2"
+DEFAULT_HASH_ALGORITHM = HASH_ALGORITHM_ROW_DIGESTS_V2
+
+# Floats with an integral value below this bound are encoded as integers, so
+# that an int64 column and the same column read back as float64 hash equally.
+_MAX_EXACT_FLOAT_INT = 2 ** 53
+# hash_pandas_object keys (16 UTF-8 bytes each) giving the two 64-bit halves
+# of every row hash. Part of the v2 scheme: changing them needs a new id.
+_ROW_HASH_KEYS = ("sox-integrity-k1", "sox-integrity-k2")
+
+
+class LegacySortedCsvHasher:
+    """
+    Original evidence hash: SHA-256 of the CSV export sorted by all columns.
+
+    Chunks are buffered because the sort needs the whole dataset; use only to
+    verify packages whose 05_integrity_hash.json records ``SHA-256``.
+    """
+
+    algorithm = HASH_ALGORITHM_LEGACY
+    verification_instructions = [
+        "1. Sort data by all columns",
+        "2. Export to CSV without index with UTF-8 encoding",
+        "3. Calculate SHA-256 of resulting string",
+        "4. Compare with hash_value"
+    ]
+
+    def __init__(self):
+        self._chunks: List[pd.DataFrame] = []
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        """Buffer one chunk."""
+        self._chunks.append(chunk)
+
+    def hexdigest(self) -> str:
+        """Sort the buffered dataset and return its SHA-256."""
+        dataframe = pd.concat(self._chunks, ignore_index=True) if self._chunks else pd.DataFrame()
+        df_sorted = dataframe.sort_values(by=list(dataframe.columns)).reset_index(drop=True)
+        data_string = df_sorted.to_csv(index=False, encoding='utf-8')
+        return hashlib.sha256(data_string.encode('utf-8')).hexdigest()
+
+
+class SortedRowDigestHasher:
+    """
+    Order-independent hash built from per-row 128-bit hashes.
+
+    Every column is rendered to canonical text (integral floats as integers,
+    datetimes in ISO format, nulls kept as nulls) and the rows of a chunk are
+    hashed in bulk by ``hash_pandas_object``, once per key. The final value is
+    the SHA-256 of the scheme id, the column header, the row count and the
+    sorted row hashes, so duplicate rows are counted and row order does not
+    matter.
+    """
+
+    algorithm = HASH_ALGORITHM_ROW_DIGESTS_V2
+    verification_instructions = [
+        "1. Convert each column to canonical text: nulls stay null, booleans as "
+        "'true'/'false', integral floats as integers, other floats as Python repr, "
+        "datetimes as ISO 8601 with microseconds (tz-aware values in UTC with '+0000')",
+        "2. Hash the rows of the converted DataFrame with "
+        "pandas.util.hash_pandas_object(df, index=False, hash_key=key) for key "
+        f"'{_ROW_HASH_KEYS[0]}' (h1) and '{_ROW_HASH_KEYS[1]}' (h2), "
+        "then sort the rows by (h1, h2)",
+        "3. Calculate SHA-256 of: algorithm id + newline, SHA-256 of the column names "
+        "written as '<len>:<name>', row count as 8-byte big-endian, h1 and h2 of each "
+        "sorted row as 8-byte big-endian",
+        "4. Compare with hash_value "
+        "(src.core.evidence.integrity.compute_integrity_hash implements these steps)"
+    ]
+
+    def __init__(self):
+        self._columns: Optional[List[str]] = None
+        self._row_hashes: List[np.ndarray] = []
+        self.row_count = 0
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        """Hash the rows of one chunk."""
+        columns = [str(column) for column in chunk.columns]
+        if self._columns is None:
+            self._columns = columns
+        elif columns != self._columns:
+            raise ValueError(
+                f"Chunk columns {columns} do not match the first chunk {self._columns}"
+            )
+
+        if chunk.empty:
+            return
+        canonical = pd.DataFrame(
+            {i: _canonical_column(chunk.iloc[:, i]) for i in range(chunk.shape[1])},
+            copy=False,
+        )
+        self._row_hashes.append(np.column_stack([
+            pd.util.hash_pandas_object(canonical, index=False, hash_key=key).to_numpy()
+            for key in _ROW_HASH_KEYS
+        ]))
+        self.row_count += len(chunk)
+
+    def hexdigest(self) -> str:
+        """Combine the sorted row hashes into the dataset hash."""
+        if self._row_hashes:
+            row_hashes = np.concatenate(self._row_hashes)
+        else:
+            row_hashes = np.empty((0, len(_ROW_HASH_KEYS)), dtype=np.uint64)
+        order = np.lexsort(row_hashes.T[::-1])
+        header = "".join(_encode_text(column) for column in self._columns or [])
+
+        hasher = hashlib.sha256()
+        hasher.update(f"{self.algorithm}\n".encode('utf-8'))
+        hasher.update(hashlib.sha256(header.encode('utf-8')).digest())
+        hasher.update(self.row_count.to_bytes(8, 'big'))
+        hasher.update(row_hashes[order].astype('>u8').tobytes())
+        return hasher.hexdigest()
+
+
+_HASHERS = {
+    HASH_ALGORITHM_LEGACY: LegacySortedCsvHasher,
+    HASH_ALGORITHM_ROW_DIGESTS_V2: SortedRowDigestHasher,
+}
+
+
+def get_hasher(algorithm: str = DEFAULT_HASH_ALGORITHM) -> Any:
+    """
+    Create an incremental hasher for a registered algorithm id.
+
+    Args:
+        algorithm: Algorithm id as recorded in 05_integrity_hash.json
+
+    Returns:
+        Hasher exposing update(chunk) and hexdigest()
+
+    Raises:
+        ValueError: If the algorithm id is unknown
+    """
+    try:
+        return _HASHERS[algorithm]()
+    except KeyError:
+        raise ValueError(
+            f"Unknown integrity hash algorithm '{algorithm}'. "
+            f"Available: {sorted(_HASHERS)}"
+        )
+
+
+def compute_integrity_hash(data: Union[pd.DataFrame, Iterable[pd.DataFrame]],
+                           algorithm: str = DEFAULT_HASH_ALGORITHM) -> str:
+    """
+    Compute the integrity hash of a DataFrame or an iterable of chunks.
+
+    Args:
+        data: Complete DataFrame, or chunks of the dataset in any order
+        algorithm: Algorithm id (default: sorted row digests v2)
+
+    Returns:
+        Hex digest
+    """
+    hasher = get_hasher(algorithm)
+    chunks = [data] if isinstance(data, pd.DataFrame) else data
+    for chunk in chunks:
+        hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def verify_integrity_hash(data: Union[pd.DataFrame, Iterable[pd.DataFrame]],
+                          hash_info: Dict[str, Any]) -> bool:
+    """
+    Recompute a dataset hash with the algorithm recorded in its evidence.
+
+    Packages written before the algorithm id was versioned record ``SHA-256``
+    and are verified with the legacy sorted-CSV scheme.
+
+    Args:
+        data: Dataset (or its chunks) to verify
+        hash_info: Content of 05_integrity_hash.json
+
+    Returns:
+        True if the recomputed hash matches hash_value
+    """
+    algorithm = hash_info.get('algorithm') or HASH_ALGORITHM_LEGACY
+    expected = hash_info.get('hash_value')
+    actual = compute_integrity_hash(data, algorithm)
+    if actual != expected:
+        logger.warning(f"Integrity hash mismatch ({algorithm}): expected {expected}, got {actual}")
+    return actual == expected
+
+
+def _encode_text(value: str) -> str:
+    return f"{len(value)}:{value}"
+
+
+def _canonical_column(series: pd.Series) -> np.ndarray:
+    """Canonical text of one column (None for nulls), vectorized per dtype."""
+    na_mask = series.isna().to_numpy()
+    dtype = series.dtype
+
+    if pd.api.types.is_bool_dtype(dtype):
+        values = np.where(series.fillna(False).to_numpy(dtype=bool), "true", "false")
+    elif pd.api.types.is_integer_dtype(dtype):
+        values = series.astype(str).to_numpy()
+    elif pd.api.types.is_float_dtype(dtype):
+        values = _format_floats(series.to_numpy(dtype=float, na_value=np.nan))
+    elif pd.api.types.is_datetime64_any_dtype(dtype):
+        values = _format_datetimes(series)
+    elif pd.api.types.infer_dtype(series, skipna=True) == "string":
+        values = series.to_numpy(dtype=object)
+    else:
+        values = [None if is_na else _canonical_scalar(value)
+                  for value, is_na in zip(series.to_numpy(dtype=object), na_mask)]
+
+    values = np.array(values, dtype=object)
+    values[na_mask] = None
+    return values
+
+
+def _format_floats(values: np.ndarray) -> np.ndarray:
+    """Format floats, writing exact integral values without a decimal part."""
+    finite = np.isfinite(values)
+    integral = finite & (np.abs(values) < _MAX_EXACT_FLOAT_INT)
+    integral[integral] = values[integral] == np.floor(values[integral])
+
+    formatted = np.array([repr(value) for value in values.tolist()], dtype=object)
+    if integral.any():
+        formatted[integral] = values[integral].astype(np.int64).astype(str)
+    return formatted
+
+
+def _format_datetimes(series: pd.Series) -> np.ndarray:
+    """ISO 8601 with microseconds; tz-aware values are written in UTC."""
+    suffix = ""
+    if getattr(series.dt, "tz", None) is not None:
+        series = series.dt.tz_convert("UTC").dt.tz_localize(None)
+        suffix = "+0000"
+    values = np.datetime_as_string(series.to_numpy(dtype="datetime64[us]"), unit="us")
+    return np.char.add(values, suffix) if suffix else values
+
+
+def _canonical_scalar(value: Any) -> str:
+    """Canonical text of a single non-null value from an object column."""
+    if isinstance(value, (bool, np.bool_)):
+        return "true" if value else "false"
+    if isinstance(value, (int, np.integer)):
+        return str(int(value))
+    if isinstance(value, (float, np.floating, decimal.Decimal)):
+        return str(_format_floats(np.array([float(value)]))[0])
+    if isinstance(value, (pd.Timestamp, dt.datetime, dt.date, np.datetime64)):
+        return str(_format_datetimes(pd.Series([pd.Timestamp(value)]))[0])
+    if isinstance(value, bytes):
+        return value.hex()
+    return str(value)
@@ -14,6 +14,7 @@ import pandas as pd
 import logging
 from pathlib import Path
 from src.utils.system_utils import get_system_context
+from src.core.evidence.integrity import DEFAULT_HASH_ALGORITHM, get_hasher, verify_integrity_hash
 
 logger = logging.getLogger(__name__)
 
@@ -144,98 +145,132 @@ class IPEEvidenceGenerator:
             snapshot_df.attrs['snapshot_rows'] = len(snapshot_df)
             snapshot_df.attrs['extraction_timestamp'] = datetime.now().isoformat()
             
-            # Save to CSV with metadata
-            snapshot_file = self.evidence_dir / "03_data_snapshot.csv"
-            with open(snapshot_file, 'w', encoding='utf-8') as f:
-                f.write(f"# IPE Data Snapshot - {self.ipe_id}\n")
-                f.write(f"# Total Rows: {len(dataframe)}\n")
-                f.write(f"# Snapshot Rows (TAIL): {len(snapshot_df)}\n")
-                f.write(f"# Extraction Time: {datetime.now().isoformat()}\n")
-                f.write(f"# Columns: {list(dataframe.columns)}\n")
-                f.write("#" + "="*80 + "\n")
-            
-            # Add data
-            snapshot_df.to_csv(snapshot_file, mode='a', index=False, encoding='utf-8')
-            
-            # Also create a statistical summary
-            summary_file = self.evidence_dir / "04_data_summary.json"
-            summary = {
-                'total_rows': len(dataframe),
-                'total_columns': len(dataframe.columns),
-                'columns': list(dataframe.columns),
-                'data_types': dataframe.dtypes.astype(str).to_dict(),
-                'memory_usage_mb': round(dataframe.memory_usage(deep=True).sum() / 1024 / 1024, 2),
-                'snapshot_rows': len(snapshot_df),
-                'snapshot_type': 'tail',
-                'extraction_timestamp': datetime.now().isoformat()
-            }
-            
             # Add descriptive statistics for numeric columns
+            numeric_statistics = None
             numeric_columns = dataframe.select_dtypes(include=['number']).columns
             if len(numeric_columns) > 0:
-                summary['numeric_statistics'] = dataframe[numeric_columns].describe().to_dict()
+                numeric_statistics = dataframe[numeric_columns].describe().to_dict()
             
-            with open(summary_file, 'w', encoding='utf-8') as f:
-                json.dump(summary, f, indent=2, ensure_ascii=False, default=str)
+            self._write_snapshot_files(
+                snapshot_df,
+                total_rows=len(dataframe),
+                columns=list(dataframe.columns),
+                data_types=dataframe.dtypes.astype(str).to_dict(),
+                memory_usage_bytes=dataframe.memory_usage(deep=True).sum(),
+                numeric_statistics=numeric_statistics,
+            )
             
-            self._log_action("SNAPSHOT_SAVED", f"Snapshot (tail) saved: {len(snapshot_df)} rows out of {len(dataframe)}")
-            logger.info(f"[{self.ipe_id}] Data snapshot (tail) saved")
+        except Exception as e:
+            self._log_action("ERROR", f"Error saving snapshot: {e}")
+            logger.error(f"[{self.ipe_id}] Error saving snapshot: {e}")
+            raise
+    
+    def save_streamed_data_snapshot(self, writer: Any, snapshot_rows: int = 100) -> None:
+        """
+        Saves the data snapshot of a chunked extraction without materializing it.
+        
+        Uses the tail and running statistics kept by a ChunkedDatasetWriter. Numeric
+        statistics are limited to count/mean/min/max since quantiles need the full data.
+        Columns the writer had to spool as strings are listed under
+        ``stringified_columns``.
+        
+        Args:
+            writer: ChunkedDatasetWriter that received every extracted chunk
+            snapshot_rows: Number of rows to include in snapshot
+        """
+        try:
+            if writer.row_count >= 1000:
+                snapshot_df = writer.tail(1000)
+            else:
+                snapshot_df = writer.tail(snapshot_rows)
+            
+            extra = {'extraction_mode': 'streamed', 'chunks': len(writer.part_files)}
+            if writer.stringified_columns:
+                extra['stringified_columns'] = writer.stringified_columns
+            
+            self._write_snapshot_files(
+                snapshot_df,
+                total_rows=writer.row_count,
+                columns=writer.columns,
+                data_types=writer.data_types,
+                memory_usage_bytes=writer.memory_usage_bytes,
+                numeric_statistics=writer.numeric_statistics or None,
+                extra=extra,
+            )
             
         except Exception as e:
             self._log_action("ERROR", f"Error saving snapshot: {e}")
             logger.error(f"[{self.ipe_id}] Error saving snapshot: {e}")
             raise
     
-    def generate_integrity_hash(self, dataframe: pd.DataFrame) -> str:
+    def _write_snapshot_files(self, snapshot_df: pd.DataFrame, total_rows: int, columns: list,
+                              data_types: Dict[str, str], memory_usage_bytes: int,
+                              numeric_statistics: Optional[Dict[str, Any]] = None,
+                              extra: Optional[Dict[str, Any]] = None) -> None:
+        """Writes 03_data_snapshot.csv and 04_data_summary.json."""
+        # Save to CSV with metadata
+        snapshot_file = self.evidence_dir / "03_data_snapshot.csv"
+        with open(snapshot_file, 'w', encoding='utf-8') as f:
+            f.write(f"# IPE Data Snapshot - {self.ipe_id}\n")
+            f.write(f"# Total Rows: {total_rows}\n")
+            f.write(f"# Snapshot Rows (TAIL): {len(snapshot_df)}\n")
+            f.write(f"# Extraction Time: {datetime.now().isoformat()}\n")
+            f.write(f"# Columns: {columns}\n")
+            f.write("#" + "="*80 + "\n")
+        
+        # Add data
+        snapshot_df.to_csv(snapshot_file, mode='a', index=False, encoding='utf-8')
+        
+        # Also create a statistical summary
+        summary_file = self.evidence_dir / "04_data_summary.json"
+        summary = {
+            'total_rows': total_rows,
+            'total_columns': len(columns),
+            'columns': columns,
+            'data_types': data_types,
+            'memory_usage_mb': round(memory_usage_bytes / 1024 / 1024, 2),
+            'snapshot_rows': len(snapshot_df),
+            'snapshot_type': 'tail',
+            'extraction_timestamp': datetime.now().isoformat()
+        }
+        if extra:
+            summary.update(extra)
+        if numeric_statistics:
+            summary['numeric_statistics'] = numeric_statistics
+        
+        with open(summary_file, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=2, ensure_ascii=False, default=str)
+        
+        self._log_action("SNAPSHOT_SAVED", f"Snapshot (tail) saved: {len(snapshot_df)} rows out of {total_rows}")
+        logger.info(f"[{self.ipe_id}] Data snapshot (tail) saved")
+    
+    def generate_integrity_hash(self, dataframe: pd.DataFrame,
+                                algorithm: str = DEFAULT_HASH_ALGORITHM) -> str:
         """
         Generates a cryptographic hash of the complete dataset.
         This hash proves data integrity and detects any tampering.
         
         Args:
             dataframe: Complete DataFrame of extracted data
+            algorithm: Hash scheme id from src.core.evidence.integrity
+                (default: order-independent sorted row digests; pass
+                HASH_ALGORITHM_LEGACY for the original sorted-CSV hash)
             
         Returns:
             SHA-256 hash of the data
         """
         try:
-            # Create a deterministic hash of the complete DataFrame
-            # Sort by all columns to guarantee reproducibility
-            df_sorted = dataframe.sort_values(by=list(dataframe.columns)).reset_index(drop=True)
-            
-            # Convert to string with standardized format
-            data_string = df_sorted.to_csv(index=False, encoding='utf-8')
-            
-            # Calculate SHA-256 hash
-            data_hash = hashlib.sha256(data_string.encode('utf-8')).hexdigest()
-            
-            # Additional information for verification
-            hash_info = {
-                'algorithm': 'SHA-256',
-                'hash_value': data_hash,
-                'data_rows': len(dataframe),
-                'data_columns': len(dataframe.columns),
-                'generation_timestamp': datetime.now().isoformat(),
-                'python_pandas_version': pd.__version__,
-                'verification_instructions': [
-                    "1. Sort data by all columns",
-                    "2. Export to CSV without index with UTF-8 encoding",
-                    "3. Calculate SHA-256 of resulting string",
-                    "4. Compare with hash_value"
-                ]
-            }
-            
-            # Save hash and verification instructions
-            hash_file = self.evidence_dir / "05_integrity_hash.json"
-            with open(hash_file, 'w', encoding='utf-8') as f:
-                json.dump(hash_info, f, indent=2, ensure_ascii=False)
-            
-            # Also save just the hash in a text file for convenience
-            hash_txt_file = self.evidence_dir / "05_integrity_hash.sha256"
-            with open(hash_txt_file, 'w') as f:
-                f.write(data_hash)
-            
-            self._log_action("HASH_GENERATED", f"Integrity hash generated: {data_hash[:16]}...")
-            logger.info(f"[{self.ipe_id}] Integrity hash generated: {data_hash[:16]}...")
+            hasher = get_hasher(algorithm)
+            hasher.update(dataframe)
+            data_hash = hasher.hexdigest()
+            
+            self.save_integrity_hash(
+                data_hash,
+                data_rows=len(dataframe),
+                data_columns=len(dataframe.columns),
+                algorithm=hasher.algorithm,
+                verification_instructions=hasher.verification_instructions
+            )
             
             return data_hash
             
@@ -244,6 +279,42 @@ class IPEEvidenceGenerator:
             logger.error(f"[{self.ipe_id}] Error generating hash: {e}")
             raise
     
+    def save_integrity_hash(self, data_hash: str, data_rows: int, data_columns: int,
+                            algorithm: str, verification_instructions: list) -> None:
+        """
+        Saves an integrity hash computed by any supported algorithm.
+        
+        Args:
+            data_hash: Hex digest of the dataset
+            data_rows: Number of rows covered by the hash
+            data_columns: Number of columns covered by the hash
+            algorithm: Algorithm identifier recorded in the evidence
+            verification_instructions: Steps an auditor follows to recompute the hash
+        """
+        # Additional information for verification
+        hash_info = {
+            'algorithm': algorithm,
+            'hash_value': data_hash,
+            'data_rows': data_rows,
+            'data_columns': data_columns,
+            'generation_timestamp': datetime.now().isoformat(),
+            'python_pandas_version': pd.__version__,
+            'verification_instructions': verification_instructions
+        }
+        
+        # Save hash and verification instructions
+        hash_file = self.evidence_dir / "05_integrity_hash.json"
+        with open(hash_file, 'w', encoding='utf-8') as f:
+            json.dump(hash_info, f, indent=2, ensure_ascii=False)
+        
+        # Also save just the hash in a text file for convenience
+        hash_txt_file = self.evidence_dir / "05_integrity_hash.sha256"
+        with open(hash_txt_file, 'w') as f:
+            f.write(data_hash)
+        
+        self._log_action("HASH_GENERATED", f"Integrity hash generated: {data_hash[:16]}...")
+        logger.info(f"[{self.ipe_id}] Integrity hash generated: {data_hash[:16]}...")
+    
     def save_validation_results(self, validation_results: Dict[str, Any]) -> None:
         """
         Saves detailed SOX validation results.
@@ -430,12 +501,15 @@ class EvidenceValidator:
     """
     
     @staticmethod
-    def verify_package_integrity(evidence_dir: str) -> Dict[str, Any]:
+    def verify_package_integrity(evidence_dir: str, data: Optional[pd.DataFrame] = None) -> Dict[str, Any]:
         """
         Verifies the integrity of an evidence package.
         
         Args:
             evidence_dir: Evidence package directory
+            data: Optional dataset to check against the recorded hash, using the
+                algorithm stored in 05_integrity_hash.json (legacy 'SHA-256'
+                packages are verified with the original sorted-CSV scheme)
             
         Returns:
             Verification results
@@ -476,6 +550,11 @@ class EvidenceValidator:
                     hash_info = json.load(f)
                 verification_results['original_hash'] = hash_info.get('hash_value')
                 verification_results['hash_algorithm'] = hash_info.get('algorithm')
+                if data is not None:
+                    data_hash_verified = verify_integrity_hash(data, hash_info)
+                    verification_results['data_hash_verified'] = data_hash_verified
+                    if not data_hash_verified:
+                        verification_results['issues_found'].append("Data hash mismatch")
             except Exception as e:
                 verification_results['issues_found'].append(f"Error reading hash: {e}")
         
@@ -0,0 +1,237 @@
+"""
+Chunked Dataset Spooling
+
+Bounded-memory helpers for IPE extractions that are streamed from the
+database in chunks instead of being loaded with a single ``pd.read_sql``.
+
+Each chunk is written to disk as a Parquet part file, folded into a running
+integrity hash and into the statistics needed for the evidence snapshot, and
+then released. The full DataFrame is only built when explicitly requested
+through :meth:`StreamedDataset.to_dataframe`. The spool directory belongs to
+the dataset handle and is removed by :meth:`StreamedDataset.cleanup` (or on
+leaving its ``with`` block) once the caller has consumed the data.
+"""
+
+import logging
+import shutil
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from src.core.evidence.integrity import DEFAULT_HASH_ALGORITHM, get_hasher
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "ChunkedDatasetWriter",
+    "StreamedDataset",
+]
+
+# Rows kept in memory for the evidence snapshot (matches save_data_snapshot).
+SNAPSHOT_TAIL_ROWS = 1000
+
+
+class StreamedDataset:
+    """
+    Handle to an extraction spooled to disk as Parquet part files.
+
+    The part files stay on disk until cleanup() is called; using the handle
+    as a context manager removes them on exit.
+
+    Example:
+        >>> with runner.run_streaming() as dataset:
+        ...     for chunk in dataset.iter_chunks():
+        ...         process(chunk)
+    """
+
+    def __init__(self, data_dir: Path, part_files: List[Path], row_count: int,
+                 columns: List[str], integrity_hash: Optional[str] = None):
+        self.data_dir = Path(data_dir)
+        self.part_files = list(part_files)
+        self.row_count = row_count
+        self.columns = list(columns)
+        self.integrity_hash = integrity_hash
+
+    def __len__(self) -> int:
+        return self.row_count
+
+    def __enter__(self) -> "StreamedDataset":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.cleanup()
+
+    def iter_chunks(self) -> Iterator[pd.DataFrame]:
+        """Yield the spooled chunks one at a time, in extraction order."""
+        for part_file in self.part_files:
+            yield pd.read_parquet(part_file)
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Load the complete dataset into a single DataFrame."""
+        if not self.part_files:
+            return pd.DataFrame(columns=self.columns)
+        return pd.concat(list(self.iter_chunks()), ignore_index=True)
+
+    def cleanup(self) -> None:
+        """Delete the spooled part files and their directory."""
+        _remove_spool(self.data_dir)
+        self.part_files = []
+
+
+class ChunkedDatasetWriter:
+    """
+    Spools DataFrame chunks to disk while accumulating evidence statistics.
+
+    Keeps only the snapshot tail, per-column numeric aggregates and the hash
+    state in memory, so peak usage stays proportional to the chunk size.
+
+    Object columns Arrow cannot store (e.g. mixed str and int values) are
+    spooled as strings, so the data read back differs from the hashed data.
+    Their names are collected in ``stringified_columns`` for the evidence
+    summary.
+
+    Args:
+        data_dir: Directory receiving the ``part-NNNNN.parquet`` files
+        hasher: Incremental hasher from src.core.evidence.integrity
+            (default: the DEFAULT_HASH_ALGORITHM scheme)
+        tail_rows: Number of trailing rows retained for the snapshot
+    """
+
+    def __init__(self, data_dir: Path, hasher: Optional[Any] = None,
+                 tail_rows: int = SNAPSHOT_TAIL_ROWS):
+        self.data_dir = Path(data_dir)
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        self.hasher = hasher or get_hasher(DEFAULT_HASH_ALGORITHM)
+        self.tail_rows = tail_rows
+
+        self.part_files: List[Path] = []
+        self.row_count = 0
+        self.columns: List[str] = []
+        self.data_types: Dict[str, str] = {}
+        self.memory_usage_bytes = 0
+        self._tail: Optional[pd.DataFrame] = None
+        self._numeric_stats: Dict[str, Dict[str, float]] = {}
+        self.stringified_columns: List[str] = []
+
+    def write(self, chunk: pd.DataFrame) -> None:
+        """Spool one chunk and fold it into the hash and statistics."""
+        if not self.columns:
+            self.columns = list(chunk.columns)
+            self.data_types = chunk.dtypes.astype(str).to_dict()
+
+        part_file = self.data_dir / f"part-{len(self.part_files):05d}.parquet"
+        stringified = _write_parquet_part(chunk, part_file)
+        self.part_files.append(part_file)
+        new_columns = [c for c in stringified if c not in self.stringified_columns]
+        if new_columns:
+            logger.warning(
+                f"Columns {new_columns} mix value types Arrow cannot store; "
+                f"spooled as strings from {part_file.name} on"
+            )
+            self.stringified_columns.extend(new_columns)
+
+        self.hasher.update(chunk)
+        self.row_count += len(chunk)
+        self.memory_usage_bytes += int(chunk.memory_usage(deep=True).sum())
+        self._update_numeric_stats(chunk)
+
+        tail = chunk.tail(self.tail_rows)
+        if self._tail is not None:
+            tail = pd.concat([self._tail, tail], ignore_index=True).tail(self.tail_rows)
+        self._tail = tail.reset_index(drop=True)
+
+    def tail(self, n: int) -> pd.DataFrame:
+        """Return the last ``n`` rows written (``n`` <= tail_rows)."""
+        if self._tail is None:
+            return pd.DataFrame(columns=self.columns)
+        return self._tail.tail(n)
+
+    @property
+    def numeric_statistics(self) -> Dict[str, Dict[str, float]]:
+        """Per-column count/mean/min/max of the numeric columns."""
+        statistics = {}
+        for column, stats in self._numeric_stats.items():
+            count = stats['count']
+            statistics[column] = {
+                'count': count,
+                'mean': stats['sum'] / count if count else None,
+                'min': stats['min'] if count else None,
+                'max': stats['max'] if count else None,
+            }
+        return statistics
+
+    def close(self) -> StreamedDataset:
+        """Finish spooling and return a handle on the written dataset."""
+        logger.info(
+            f"Spooled {self.row_count} rows in {len(self.part_files)} chunks to {self.data_dir}"
+        )
+        return StreamedDataset(
+            data_dir=self.data_dir,
+            part_files=self.part_files,
+            row_count=self.row_count,
+            columns=self.columns,
+            integrity_hash=self.hasher.hexdigest(),
+        )
+
+    def discard(self) -> None:
+        """Delete everything spooled so far (used when the extraction fails)."""
+        _remove_spool(self.data_dir)
+        self.part_files = []
+
+    def _update_numeric_stats(self, chunk: pd.DataFrame) -> None:
+        numeric = chunk.select_dtypes(include=['number'])
+        for column in numeric.columns:
+            values = numeric[column].to_numpy(dtype=float, na_value=np.nan)
+            values = values[~np.isnan(values)]
+            stats = self._numeric_stats.setdefault(
+                column, {'count': 0, 'sum': 0.0, 'min': np.inf, 'max': -np.inf}
+            )
+            if values.size == 0:
+                continue
+            stats['count'] += int(values.size)
+            stats['sum'] += float(values.sum())
+            stats['min'] = min(stats['min'], float(values.min()))
+            stats['max'] = max(stats['max'], float(values.max()))
+
+
+def _remove_spool(data_dir: Path) -> None:
+    if data_dir.exists():
+        shutil.rmtree(data_dir, ignore_errors=True)
+        logger.debug(f"Removed spool directory {data_dir}")
+
+
+def _write_parquet_part(chunk: pd.DataFrame, part_file: Path) -> List[str]:
+    """
+    Write a chunk as Parquet, stringifying only the object columns Arrow rejects.
+
+    Returns:
+        Names of the columns stored as strings (empty when none were)
+    """
+    try:
+        chunk.to_parquet(part_file, index=False)
+        return []
+    except (TypeError, ValueError):
+        pass
+
+    # Mixed-type object columns (e.g. str and int) cannot be mapped to a
+    # single Arrow type; store those as strings and report them.
+    rejected = [column for column in chunk.select_dtypes(include=['object']).columns
+                if not _arrow_accepts(chunk[column])]
+    fallback = chunk.copy()
+    for column in rejected:
+        fallback[column] = fallback[column].map(
+            lambda value: None if pd.isna(value) else str(value)
+        )
+    fallback.to_parquet(part_file, index=False)
+    return rejected
+
+
+def _arrow_accepts(series: pd.Series) -> bool:
+    try:
+        pa.array(series, from_pandas=True)
+        return True
+    except (TypeError, ValueError):
+        return False
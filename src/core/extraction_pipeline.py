@@ -8,18 +8,25 @@ This module is independent of Streamlit and returns standard Pandas DataFrames.
 
 import os
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, Any, Optional, Tuple, Callable
 from unittest.mock import MagicMock
 
 import pandas as pd
 
 from src.core.runners.mssql_runner import IPERunner
+from src.core.runners.connection_pool import (
+    ConnectionPool,
+    connection_pool_name,
+    get_connection_pool,
+)
 from src.core.catalog.cpg1 import get_item_by_id
 from src.utils.aws_utils import AWSSecretsManager
 from src.utils.sql_template import render_sql
 from src.utils.query_params_builder import build_complete_query_params
 from src.core.evidence.evidence_locator import get_latest_evidence_zip
 from src.core.jdash_loader import load_jdash_data
+from src.core.dataset_cache import DatasetCache, build_cache_key, read_csv_cached
 
 logger = logging.getLogger(__name__)
 
@@ -51,6 +58,7 @@ class ExtractionPipeline:
     This class provides a unified interface for extracting data from various
     IPE sources, with support for:
     - Live database extraction via IPERunner
+    - Local dataset cache (opt-in) taking priority over live SQL
     - Fixture fallback for development/testing
     - Evidence package generation
     
@@ -71,11 +79,20 @@ class ExtractionPipeline:
         
         Args:
             params: Dictionary of SQL parameters including 'cutoff_date', 
-                    'id_companies_active', etc.
+                    'id_companies_active', etc. 'use_dataset_cache' /
+                    'dataset_cache_dir' enable the local dataset cache.
+                    'use_connection_pool' (default True) shares pooled DB
+                    connections across all pipelines of the process, with
+                    one pool per credential set.
+                    'chunk_size' fetches each IPE in chunks of that many rows;
+                    it bounds memory during fetch and hashing only, as the
+                    pipeline still returns complete DataFrames.
             country_code: Optional country code. If not provided, extracted from params.
             period_str: Optional period string (YYYYMM). If not provided, derived from cutoff_date.
         """
         self.params = params
+        self.dataset_cache = DatasetCache.from_params(params)
+        self.use_connection_pool = params.get("use_connection_pool", True)
         
         # QA VERIFIED: Country code extraction logic supports both direct 'company' parameter
         # and extraction from 'id_companies_active' SQL format
@@ -107,6 +124,10 @@ class ExtractionPipeline:
         """
         Executes extraction via IPERunner.run() with evidence generation.
         
+        When the dataset cache is enabled, a cached extraction with the same
+        rendered SQL, cutoff date and schema contract is returned instead of
+        querying the database (last_extraction_source == "cache").
+        
         Args:
             item_id: The IPE or CR identifier (e.g., 'IPE_07', 'CR_05')
         
@@ -133,6 +154,22 @@ class ExtractionPipeline:
             sql_params = _build_sql_params(self.params)
             final_query = render_sql(item.sql_query, sql_params, strict=True)
 
+            cache_key = None
+            if self.dataset_cache is not None:
+                # '?' placeholders are bound to the cutoff date at execution time
+                cache_key = build_cache_key(
+                    item.item_id,
+                    sql=final_query,
+                    params={"cutoff_date": self.params.get("cutoff_date")},
+                )
+                cached_df = self.dataset_cache.get(cache_key)
+                if cached_df is not None:
+                    zip_path = self.dataset_cache.get_metadata(cache_key).get("evidence_zip")
+                    if zip_path and not os.path.exists(zip_path):
+                        zip_path = None
+                    self.last_extraction_source = "cache"
+                    return cached_df, zip_path
+
             ipe_config = {
                 "id": item.item_id,
                 "description": getattr(item, "description", ""),
@@ -148,11 +185,15 @@ class ExtractionPipeline:
                 country=self.country_code,
                 period=self.period_str,
                 full_params=sql_params,
+                chunk_size=self.params.get("chunk_size"),
+                connection_pool=self._connection_pool_for(ipe_config),
             )
 
             df = runner.run()
             zip_path = get_latest_evidence_zip(item_id)
             self.last_extraction_source = "live"
+            if cache_key is not None:
+                self.dataset_cache.put(cache_key, df, metadata={"evidence_zip": zip_path})
             return df, zip_path
         except Exception as e:
             logger.error(f"Extraction failed for {item_id}: {e}")
@@ -161,6 +202,21 @@ class ExtractionPipeline:
             self.last_extraction_source = "fixture" if not fixture_df.empty else "none"
             return fixture_df, None
     
+    def _connection_pool_for(self, ipe_config: Dict[str, Any]) -> Optional[ConnectionPool]:
+        """
+        Shared pool for the credentials the runner will connect with.
+
+        Follows the runner's fallback order (DB_CONNECTION_STRING, then the
+        secret), so IPEs using different credentials never share connections.
+        Returns None when pooling is disabled.
+        """
+        if not self.use_connection_pool:
+            return None
+        return get_connection_pool(connection_pool_name(
+            secret_name=ipe_config["secret_name"],
+            connection_string=os.getenv("DB_CONNECTION_STRING"),
+        ))
+
     def _load_fixture(self, item_id: str) -> pd.DataFrame:
         """
         Load data from fixture file (fallback for development/testing).
@@ -182,7 +238,7 @@ class ExtractionPipeline:
         def read_fixture_csv(path: str) -> pd.DataFrame:
             """Read fixture CSV with tolerant fallback for malformed lines."""
             try:
-                return pd.read_csv(path, low_memory=False)
+                return read_csv_cached(path, item_id, self.dataset_cache, low_memory=False)
             except pd.errors.ParserError as exc:
                 logger.warning(
                     "Malformed CSV fixture for %s at %s (%s). Retrying with tolerant parser.",
@@ -190,8 +246,10 @@ class ExtractionPipeline:
                     path,
                     exc,
                 )
-                return pd.read_csv(
+                return read_csv_cached(
                     path,
+                    item_id,
+                    self.dataset_cache,
                     engine="python",
                     on_bad_lines="skip",
                 )
@@ -263,11 +321,116 @@ async def run_extraction_with_evidence(
     return await pipeline.run_extraction_with_evidence(item_id)
 
 
+def _load_single_item(
+    pipeline: ExtractionPipeline,
+    item_id: str,
+    uploaded_files: Dict[str, Any],
+    country_code: str,
+) -> Tuple[pd.DataFrame, Optional[str], str]:
+    """
+    Load one item: uploaded file, then dataset cache or live SQL extraction,
+    then local fixture.
+    
+    Args:
+        pipeline: ExtractionPipeline used for live extraction and fixture loading.
+                  Concurrent loads must pass one pipeline per item, since the
+                  pipeline records last_extraction_source.
+        item_id: The IPE or CR identifier
+        uploaded_files: Dictionary of {item_id: file_path_or_object} overrides
+        country_code: Company code used for JDASH and fixture lookups
+    
+    Returns:
+        Tuple of (DataFrame, zip_path, source)
+    """
+    import asyncio
+    
+    df = None
+    zip_path = None
+    source = None
+    
+    # Priority 1: Check for uploaded file
+    if item_id in uploaded_files and uploaded_files[item_id] is not None:
+        try:
+            uploaded = uploaded_files[item_id]
+            if isinstance(uploaded, str):
+                # File path
+                df = pd.read_csv(uploaded, low_memory=False)
+            elif hasattr(uploaded, 'read'):
+                # File-like object
+                df = pd.read_csv(uploaded, low_memory=False)
+            else:
+                # Assume it's already a DataFrame
+                df = uploaded
+            
+            source = "Uploaded File"
+            logger.info(f"{item_id}: Loaded from uploaded file ({len(df)} rows)")
+        except Exception as e:
+            logger.warning(f"Error reading uploaded file for {item_id}: {e}")
+            df = None
+    
+    # Priority 2: Try live SQL extraction (JDASH uses dedicated loader only)
+    if df is None and item_id != "JDASH":
+        try:
+            df, zip_path = asyncio.run(
+                pipeline.run_extraction_with_evidence(item_id)
+            )
+            if pipeline.last_extraction_source == "live":
+                # Keep successful live extractions even when 0 rows are returned.
+                source = "Live Database"
+                logger.info(f"{item_id}: Loaded from {source} ({len(df)} rows)")
+            elif pipeline.last_extraction_source == "cache":
+                source = "Dataset Cache"
+                logger.info(f"{item_id}: Loaded from {source} ({len(df)} rows)")
+            elif pipeline.last_extraction_source == "fixture":
+                if not df.empty:
+                    source = "Local Fixture"
+                    logger.info(f"{item_id}: Loaded from {source} ({len(df)} rows)")
+                else:
+                    df = None
+            else:
+                df = None
+        except Exception as e:
+            logger.warning(f"Live extraction failed for {item_id}: {e}")
+            df = None
+            zip_path = None
+    
+    # Priority 3: Fallback to local fixture
+    if df is None:
+        # Special handling for JDASH - use dedicated loader with company parameter
+        if item_id == "JDASH":
+            df, jdash_source = load_jdash_data(
+                company=country_code,
+                fixture_fallback=True,
+                cache=pipeline.dataset_cache,
+            )
+            if not df.empty:
+                source = f"Local Fixture - {jdash_source}"
+                logger.info(f"{item_id}: Loaded via jdash_loader ({len(df)} rows)")
+            else:
+                source = "No Data"
+                df = pd.DataFrame()
+        else:
+            # Use standard fixture loading for other items
+            df = pipeline._load_fixture(item_id)
+            if not df.empty:
+                source = "Local Fixture"
+                logger.info(f"{item_id}: Loaded from fixture ({len(df)} rows)")
+            else:
+                source = "No Data"
+                df = pd.DataFrame()
+    
+    # Apply country filter for display purposes
+    df = pipeline.filter_by_country(df)
+    
+    return df, zip_path, source or "No Data"
+
+
 def load_all_data(
     params: Dict[str, Any],
     uploaded_files: Optional[Dict[str, Any]] = None,
     required_ipes: Optional[list] = None,
-    progress_callback: Optional[Callable[[str, float, str], None]] = None
+    progress_callback: Optional[Callable[[str, float, str], None]] = None,
+    max_workers: int = 1,
 ) -> Tuple[Dict[str, pd.DataFrame], Dict[str, Optional[str]], Dict[str, str]]:
     """
     Orchestrates loading and evidence collection for multiple IPEs.
@@ -279,22 +442,28 @@ def load_all_data(
         params: SQL parameters dictionary including:
             - cutoff_date: Cutoff date in YYYY-MM-DD format
             - id_companies_active: Company filter in SQL format
+            - use_dataset_cache / dataset_cache_dir: Optional local dataset cache
+              (see src.core.dataset_cache), checked before live SQL
             - Other SQL parameters
         uploaded_files: Optional dictionary of {item_id: file_path_or_object} 
                         for manual CSV overrides
         required_ipes: Optional list of IPE IDs to load. Defaults to standard set.
         progress_callback: Optional callback function(item_id, progress_pct, message)
-                           for progress reporting
+                           for progress reporting. Always invoked from the calling
+                           thread, with progress_pct increasing up to 1.0.
+        max_workers: Number of items extracted concurrently. IPERunner extractions
+                     do blocking pyodbc I/O, so items run in a bounded thread pool
+                     when max_workers > 1. Default 1 keeps sequential extraction.
     
     Returns:
         Tuple of (data_store, evidence_store, source_store) where:
             - data_store: Dict mapping item_id to DataFrame
             - evidence_store: Dict mapping item_id to ZIP path (or None)
             - source_store: Dict mapping item_id to source type 
-                           ("Uploaded File", "Live Database", "Local Fixture", "No Data")
+                           ("Uploaded File", "Dataset Cache", "Live Database",
+                            "Local Fixture", "No Data")
+        Keys follow the order of required_ipes regardless of completion order.
     """
-    import asyncio
-    
     if required_ipes is None:
         required_ipes = [
             "CR_04",
@@ -339,88 +508,51 @@ def load_all_data(
         country_code = params.get("id_companies_active", "").strip("()'")
     period_str = params.get("cutoff_date", "").replace("-", "")[:6]
     
-    pipeline = ExtractionPipeline(params, country_code, period_str)
+    results: Dict[str, Tuple[pd.DataFrame, Optional[str], str]] = {}
     
-    for i, item_id in enumerate(required_ipes):
-        progress_pct = (i + 1) / len(required_ipes)
-        
-        if progress_callback:
-            progress_callback(item_id, progress_pct, f"Processing {item_id}...")
-        
-        df = None
-        zip_path = None
-        source = None
-        
-        # Priority 1: Check for uploaded file
-        if item_id in uploaded_files and uploaded_files[item_id] is not None:
-            try:
-                uploaded = uploaded_files[item_id]
-                if isinstance(uploaded, str):
-                    # File path
-                    df = pd.read_csv(uploaded, low_memory=False)
-                elif hasattr(uploaded, 'read'):
-                    # File-like object
-                    df = pd.read_csv(uploaded, low_memory=False)
-                else:
-                    # Assume it's already a DataFrame
-                    df = uploaded
-                
-                source = "Uploaded File"
-                logger.info(f"{item_id}: Loaded from uploaded file ({len(df)} rows)")
-            except Exception as e:
-                logger.warning(f"Error reading uploaded file for {item_id}: {e}")
-                df = None
-        
-        # Priority 2: Try live SQL extraction (JDASH uses dedicated loader only)
-        if df is None and item_id != "JDASH":
-            try:
-                df, zip_path = asyncio.run(
-                    pipeline.run_extraction_with_evidence(item_id)
-                )
-                if pipeline.last_extraction_source == "live":
-                    # Keep successful live extractions even when 0 rows are returned.
-                    source = "Live Database"
-                    logger.info(f"{item_id}: Loaded from {source} ({len(df)} rows)")
-                elif pipeline.last_extraction_source == "fixture":
-                    if not df.empty:
-                        source = "Local Fixture"
-                        logger.info(f"{item_id}: Loaded from {source} ({len(df)} rows)")
-                    else:
-                        df = None
-                else:
-                    df = None
-            except Exception as e:
-                logger.warning(f"Live extraction failed for {item_id}: {e}")
-                df = None
-                zip_path = None
+    if max_workers is None or max_workers <= 1 or len(required_ipes) <= 1:
+        pipeline = ExtractionPipeline(params, country_code, period_str)
         
-        # Priority 3: Fallback to local fixture
-        if df is None:
-            # Special handling for JDASH - use dedicated loader with company parameter
-            if item_id == "JDASH":
-                df, jdash_source = load_jdash_data(company=country_code, fixture_fallback=True)
-                if not df.empty:
-                    source = f"Local Fixture - {jdash_source}"
-                    logger.info(f"{item_id}: Loaded via jdash_loader ({len(df)} rows)")
-                else:
-                    source = "No Data"
-                    df = pd.DataFrame()
-            else:
-                # Use standard fixture loading for other items
-                df = pipeline._load_fixture(item_id)
-                if not df.empty:
-                    source = "Local Fixture"
-                    logger.info(f"{item_id}: Loaded from fixture ({len(df)} rows)")
-                else:
-                    source = "No Data"
-                    df = pd.DataFrame()
-        
-        # Apply country filter for display purposes
-        df = pipeline.filter_by_country(df)
+        for i, item_id in enumerate(required_ipes):
+            progress_pct = (i + 1) / len(required_ipes)
+            
+            if progress_callback:
+                progress_callback(item_id, progress_pct, f"Processing {item_id}...")
+            
+            results[item_id] = _load_single_item(pipeline, item_id, uploaded_files, country_code)
+    else:
+        # Each item gets its own pipeline: last_extraction_source is per-extraction state
+        unique_items = list(dict.fromkeys(required_ipes))
+        workers = min(max_workers, len(unique_items))
+        logger.info(f"Extracting {len(unique_items)} items with {workers} concurrent workers")
         
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ipe-extract") as executor:
+            futures = {
+                executor.submit(
+                    _load_single_item,
+                    ExtractionPipeline(params, country_code, period_str),
+                    item_id,
+                    uploaded_files,
+                    country_code,
+                ): item_id
+                for item_id in unique_items
+            }
+            for completed, future in enumerate(as_completed(futures), start=1):
+                item_id = futures[future]
+                results[item_id] = future.result()
+                if progress_callback:
+                    progress_callback(
+                        item_id,
+                        completed / len(unique_items),
+                        f"Processed {item_id} ({results[item_id][2]})",
+                    )
+    
+    # Deterministic ordering: follow required_ipes, not completion order
+    for item_id in required_ipes:
+        df, zip_path, source = results[item_id]
         data_store[item_id] = df
         evidence_store[item_id] = zip_path
-        source_store[item_id] = source or "No Data"
+        source_store[item_id] = source
 
     # Backward/forward-compatible aliases for split IPE_08 package
     # Issuance alias: IPE_08 <-> IPE_08_ISSUANCE
@@ -11,6 +11,8 @@ from typing import Tuple, Optional, Union, Any
 
 import pandas as pd
 
+from src.core.dataset_cache import DatasetCache, read_csv_cached
+
 logger = logging.getLogger(__name__)
 
 # Repository root path
@@ -20,7 +22,8 @@ REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
 def load_jdash_data(
     source: Optional[Union[str, Any]] = None,
     fixture_fallback: bool = True,
-    company: Optional[str] = None
+    company: Optional[str] = None,
+    cache: Optional[DatasetCache] = None
 ) -> Tuple[pd.DataFrame, str]:
     """
     Load and normalize JDASH (voucher usage) data.
@@ -39,6 +42,8 @@ def load_jdash_data(
         source: Data source - can be file path, file-like object, DataFrame, or None
         fixture_fallback: If True, falls back to local fixture when source is None
         company: Optional company code (e.g., 'EC_NG', 'JD_GH') for company-specific fixtures
+        cache: Optional DatasetCache; CSV files given by path (including fixtures)
+            are then parsed once and reloaded from the cache while unchanged
     
     Returns:
         Tuple of (DataFrame, source_description) where:
@@ -58,7 +63,7 @@ def load_jdash_data(
     # Case 2: File path
     if isinstance(source, str) and os.path.exists(source):
         try:
-            df = pd.read_csv(source, low_memory=False)
+            df = read_csv_cached(source, "JDASH", cache, low_memory=False)
             return _normalize_jdash_columns(df), f"File: {os.path.basename(source)}"
         except Exception as e:
             logger.warning(f"Failed to load JDASH from path {source}: {e}")
@@ -79,7 +84,7 @@ def load_jdash_data(
             company_fixture_path = os.path.join(REPO_ROOT, "tests", "fixtures", company, "fixture_JDASH.csv")
             if os.path.exists(company_fixture_path):
                 try:
-                    df = pd.read_csv(company_fixture_path, low_memory=False)
+                    df = read_csv_cached(company_fixture_path, "JDASH", cache, low_memory=False)
                     return _normalize_jdash_columns(df), f"Local Fixture ({company})"
                 except Exception as e:
                     logger.warning(f"Failed to load JDASH fixture from company subfolder: {e}")
@@ -88,7 +93,7 @@ def load_jdash_data(
         root_fixture_path = os.path.join(REPO_ROOT, "tests", "fixtures", "fixture_JDASH.csv")
         if os.path.exists(root_fixture_path):
             try:
-                df = pd.read_csv(root_fixture_path, low_memory=False)
+                df = read_csv_cached(root_fixture_path, "JDASH", cache, low_memory=False)
                 return _normalize_jdash_columns(df), "Local Fixture"
             except Exception as e:
                 logger.warning(f"Failed to load JDASH fixture: {e}")
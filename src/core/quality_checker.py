@@ -7,13 +7,134 @@ This implements the CFO's request for standardized "Data Checks" across all proc
 New: Integrates with schema contract system to auto-generate quality rules from contracts.
 """
 
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import List, Optional, Any
+from typing import Dict, FrozenSet, Iterable, List, Optional, Any
 from abc import ABC, abstractmethod
 from datetime import datetime
+from statistics import NormalDist
 import pandas as pd
 
 
+# Column statistics a rule can request from the profile pass (the dtype and
+# row count are part of every profile)
+DTYPE = "dtype"
+NULLS = "nulls"
+NUMERIC = "numeric"
+DATES = "dates"
+NUNIQUE = "nunique"
+
+
+@dataclass
+class ColumnProfile:
+    """
+    Statistics of one column, computed once and shared by all rules on it.
+
+    Only the requested statistics are computed; the others stay None.
+    Parse failures are kept (numeric_error, date_error) so each rule can
+    report them in its own words.
+    """
+    column_name: str
+    dtype: str
+    row_count: int
+    null_count: Optional[int] = None
+    numeric_valid_count: Optional[int] = None
+    numeric_error: Optional[Exception] = None
+    valid_dates: Optional[pd.Series] = None
+    date_min: Optional[pd.Timestamp] = None
+    date_max: Optional[pd.Timestamp] = None
+    date_error: Optional[Exception] = None
+    nunique: Optional[int] = None
+
+    @classmethod
+    def build(cls, series: pd.Series, stats: Iterable[str]) -> "ColumnProfile":
+        """
+        Profile a column.
+
+        Args:
+            series: Column values
+            stats: Statistics to compute (NULLS, NUMERIC, DATES, NUNIQUE)
+
+        Returns:
+            ColumnProfile
+        """
+        stats = set(stats)
+        profile = cls(column_name=series.name, dtype=str(series.dtype), row_count=len(series))
+
+        if NULLS in stats:
+            profile.null_count = series.isnull().sum()
+
+        if NUMERIC in stats:
+            try:
+                profile.numeric_valid_count = pd.to_numeric(series, errors='coerce').notna().sum()
+            except Exception as e:
+                profile.numeric_error = e
+
+        if DATES in stats:
+            try:
+                valid_dates = pd.to_datetime(series, errors='coerce').dropna()
+                profile.valid_dates = valid_dates
+                if len(valid_dates) > 0:
+                    profile.date_min = valid_dates.min()
+                    profile.date_max = valid_dates.max()
+            except Exception as e:
+                profile.date_error = e
+
+        if NUNIQUE in stats:
+            profile.nunique = series.nunique()
+
+        return profile
+
+
+@dataclass
+class SamplingConfig:
+    """
+    Sampled mode of DataQualityEngine for very large extracts.
+
+    Rules with statistical thresholds (SemanticValidityCheck) are first
+    evaluated on a uniform random sample of rows. A PASS is accepted when the
+    one-sided confidence bound of the sampled proportion clears the
+    threshold; otherwise (a FAIL, or too close to call) the rule is re-run
+    on the full column, so every FAIL comes from an exact scan.
+
+    Args:
+        sample_size: Number of rows sampled (without replacement)
+        confidence: Confidence level of the bound, in (0.5, 1)
+        min_rows: Extracts with fewer rows are always fully scanned
+        random_state: Sampling seed, recorded in the report
+    """
+    sample_size: int = 100_000
+    confidence: float = 0.999
+    min_rows: int = 1_000_000
+    random_state: int = 0
+
+    def __post_init__(self):
+        if self.sample_size < 1:
+            raise ValueError(f"Invalid sample_size: {self.sample_size} (must be >= 1)")
+        if not 0.5 < self.confidence < 1:
+            raise ValueError(f"Invalid confidence: {self.confidence} (must be in (0.5, 1))")
+
+    @property
+    def z_score(self) -> float:
+        """One-sided normal quantile of the confidence level."""
+        return NormalDist().inv_cdf(self.confidence)
+
+    def applies_to(self, row_count: int) -> bool:
+        """Whether an extract of row_count rows is checked on a sample."""
+        return row_count >= self.min_rows and row_count > self.sample_size
+
+
+def _wilson_bounds(successes: int, n: int, z: float) -> tuple[float, float]:
+    """Wilson score bounds of a proportion observed on n samples."""
+    p = successes / n
+    denominator = 1 + z * z / n
+    center = (p + z * z / (2 * n)) / denominator
+    half_width = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denominator
+    return max(center - half_width, 0.0), min(center + half_width, 1.0)
+
+
 @dataclass
 class QualityRule(ABC):
     """Base class for data quality rules."""
@@ -37,6 +158,64 @@ class QualityRule(ABC):
         pass
 
 
+@dataclass
+class ColumnProfileRule(QualityRule):
+    """
+    Base class for rules on one column that are decided from its statistics.
+
+    Subclasses declare the statistics they need in profile_stats() and
+    implement check_profile(); DataQualityEngine then evaluates them against
+    a ColumnProfile shared with the other rules on the same column. check()
+    profiles the column for the rule alone.
+    """
+
+    column_name: str
+
+    @abstractmethod
+    def profile_stats(self) -> FrozenSet[str]:
+        """Column statistics used by check_profile."""
+        pass
+
+    @abstractmethod
+    def check_profile(self, profile: ColumnProfile) -> tuple[bool, str]:
+        """
+        Execute the quality check on the profile of an existing column.
+
+        Args:
+            profile: Profile of column_name with at least profile_stats()
+
+        Returns:
+            Tuple of (pass/fail bool, detail message string)
+        """
+        pass
+
+    def check(self, df: pd.DataFrame) -> tuple[bool, str]:
+        if self.column_name not in df.columns:
+            return False, f"{self.get_name()}: FAIL (column '{self.column_name}' not found)"
+        return self.check_profile(ColumnProfile.build(df[self.column_name], self.profile_stats()))
+
+    def supports_sampling(self) -> bool:
+        """Whether check_sample() can decide this rule on a sample of rows."""
+        return False
+
+    def check_sample(
+        self, profile: ColumnProfile, sampling: SamplingConfig, population_rows: int
+    ) -> Optional[tuple[bool, str]]:
+        """
+        Decide the check from the profile of a row sample, if confident enough.
+
+        Args:
+            profile: Profile of column_name over the sampled rows
+            sampling: Sampling configuration (confidence level)
+            population_rows: Number of rows of the full DataFrame
+
+        Returns:
+            Tuple of (pass/fail bool, detail message string), or None when the
+            full column must be scanned
+        """
+        return None
+
+
 @dataclass
 class RowCountCheck(QualityRule):
     """Check that DataFrame has a row count within specified bounds."""
@@ -119,20 +298,20 @@ class NumericSumCheck(QualityRule):
 
 
 @dataclass
-class NoNullsCheck(QualityRule):
+class NoNullsCheck(ColumnProfileRule):
     """Check that a column contains no null values."""
     column_name: str
 
-    def check(self, df: pd.DataFrame) -> tuple[bool, str]:
-        if self.column_name not in df.columns:
-            return False, f"NoNullsCheck: FAIL (column '{self.column_name}' not found)"
+    def profile_stats(self) -> FrozenSet[str]:
+        return frozenset({NULLS})
 
-        null_count = df[self.column_name].isnull().sum()
+    def check_profile(self, profile: ColumnProfile) -> tuple[bool, str]:
+        null_count = profile.null_count
 
         if null_count == 0:
             return True, f"NoNullsCheck: PASS (column '{self.column_name}' has no nulls)"
         else:
-            total_rows = len(df)
+            total_rows = profile.row_count
             return (
                 False,
                 f"NoNullsCheck: FAIL (column '{self.column_name}' has {null_count} null values "
@@ -144,16 +323,16 @@ class NoNullsCheck(QualityRule):
 
 
 @dataclass
-class DTypeCheck(QualityRule):
+class DTypeCheck(ColumnProfileRule):
     """Check that a column has the expected data type."""
     column_name: str
     expected_dtype: str  # "int64", "float64", "object", "datetime64[ns]", etc.
     
-    def check(self, df: pd.DataFrame) -> tuple[bool, str]:
-        if self.column_name not in df.columns:
-            return False, f"DTypeCheck: FAIL (column '{self.column_name}' not found)"
-        
-        actual_dtype = str(df[self.column_name].dtype)
+    def profile_stats(self) -> FrozenSet[str]:
+        return frozenset({DTYPE})
+    
+    def check_profile(self, profile: ColumnProfile) -> tuple[bool, str]:
+        actual_dtype = profile.dtype
         
         # Normalize dtype strings for comparison
         expected_normalized = self._normalize_dtype(self.expected_dtype)
@@ -190,24 +369,24 @@ class DTypeCheck(QualityRule):
 
 
 @dataclass
-class DateRangeCheck(QualityRule):
+class DateRangeCheck(ColumnProfileRule):
     """Check that date column values fall within specified range."""
     column_name: str
     min_date: Optional[datetime] = None
     max_date: Optional[datetime] = None
     
-    def check(self, df: pd.DataFrame) -> tuple[bool, str]:
-        if self.column_name not in df.columns:
-            return False, f"DateRangeCheck: FAIL (column '{self.column_name}' not found)"
-        
-        # Convert to datetime if not already
-        try:
-            col = pd.to_datetime(df[self.column_name], errors='coerce')
-        except Exception as e:
-            return False, f"DateRangeCheck: FAIL (cannot convert '{self.column_name}' to datetime: {e})"
+    def profile_stats(self) -> FrozenSet[str]:
+        return frozenset({DATES})
+    
+    def check_profile(self, profile: ColumnProfile) -> tuple[bool, str]:
+        if profile.date_error is not None:
+            return False, (
+                f"DateRangeCheck: FAIL (cannot convert '{self.column_name}' to datetime: "
+                f"{profile.date_error})"
+            )
         
-        # Filter out NaT (missing dates)
-        valid_dates = col.dropna()
+        # Parsed dates without NaT (missing dates)
+        valid_dates = profile.valid_dates
         
         if len(valid_dates) == 0:
             return False, f"DateRangeCheck: FAIL (column '{self.column_name}' has no valid dates)"
@@ -217,7 +396,7 @@ class DateRangeCheck(QualityRule):
             min_date_pd = pd.Timestamp(self.min_date)
             violations_min = (valid_dates < min_date_pd).sum()
             if violations_min > 0:
-                earliest = valid_dates.min()
+                earliest = profile.date_min
                 return False, (
                     f"DateRangeCheck: FAIL (column '{self.column_name}' has {violations_min} "
                     f"dates before {self.min_date.date()}, earliest: {earliest.date()})"
@@ -228,14 +407,14 @@ class DateRangeCheck(QualityRule):
             max_date_pd = pd.Timestamp(self.max_date)
             violations_max = (valid_dates > max_date_pd).sum()
             if violations_max > 0:
-                latest = valid_dates.max()
+                latest = profile.date_max
                 return False, (
                     f"DateRangeCheck: FAIL (column '{self.column_name}' has {violations_max} "
                     f"dates after {self.max_date.date()}, latest: {latest.date()})"
                 )
         
         # All checks passed
-        date_range_str = f"{valid_dates.min().date()} to {valid_dates.max().date()}"
+        date_range_str = f"{profile.date_min.date()} to {profile.date_max.date()}"
         constraint_str = ""
         if self.min_date:
             constraint_str += f" >= {self.min_date.date()}"
@@ -252,23 +431,75 @@ class DateRangeCheck(QualityRule):
 
 
 @dataclass
-class SemanticValidityCheck(QualityRule):
+class SemanticValidityCheck(ColumnProfileRule):
     """Check that a column conforms to its semantic type (amount, id, code, etc.)."""
     column_name: str
     semantic_tag: str  # "amount", "id", "code", "date", etc.
     
-    def check(self, df: pd.DataFrame) -> tuple[bool, str]:
-        if self.column_name not in df.columns:
-            return False, f"SemanticValidityCheck: FAIL (column '{self.column_name}' not found)"
+    def profile_stats(self) -> FrozenSet[str]:
+        if self.semantic_tag == "amount":
+            return frozenset({NUMERIC})
+        elif self.semantic_tag == "id" or self.semantic_tag == "key":
+            return frozenset({NULLS, NUNIQUE})
+        elif self.semantic_tag == "date":
+            return frozenset({DATES})
+        return frozenset({NULLS})
+    
+    def supports_sampling(self) -> bool:
+        return True
+    
+    def check_sample(
+        self, profile: ColumnProfile, sampling: SamplingConfig, population_rows: int
+    ) -> Optional[tuple[bool, str]]:
+        n = profile.row_count
+        if n == 0:
+            return None
+        z = sampling.z_score
+        sampled = (
+            f"sampled {n} of {population_rows} rows, "
+            f"{sampling.confidence:.1%} one-sided confidence"
+        )
+        
+        if self.semantic_tag in ("amount", "date"):
+            valid_count = profile.numeric_valid_count if self.semantic_tag == "amount" else (
+                None if profile.valid_dates is None else len(profile.valid_dates)
+            )
+            if valid_count is None:
+                return None  # Parse error: report it from the full scan
+            lower, _ = _wilson_bounds(valid_count, n, z)
+            if lower < 0.95:
+                return None
+            kind = "valid numeric amounts" if self.semantic_tag == "amount" else "valid dates"
+            return True, (
+                f"SemanticValidityCheck: PASS ('{self.column_name}' is {valid_count / n * 100:.1f}% "
+                f"{kind}, >= {lower * 100:.1f}% {sampled})"
+            )
         
-        col = df[self.column_name]
+        if self.semantic_tag == "id" or self.semantic_tag == "key":
+            _, upper = _wilson_bounds(profile.null_count, n, z)
+            if upper > 0.05:
+                return None
+            return True, (
+                f"SemanticValidityCheck: PASS ('{self.column_name}' has {profile.null_count / n * 100:.1f}% "
+                f"null IDs, <= {upper * 100:.1f}% {sampled})"
+            )
         
+        # Generic check: a single non-null sampled value rules out an all-null column
+        if profile.null_count >= n:
+            return None
+        return True, (
+            f"SemanticValidityCheck: PASS ('{self.column_name}' semantic:{self.semantic_tag}, "
+            f"{profile.null_count / n * 100:.1f}% null, {sampled})"
+        )
+    
+    def check_profile(self, profile: ColumnProfile) -> tuple[bool, str]:
         if self.semantic_tag == "amount":
             # Check that numeric amounts are reasonable
             try:
-                numeric_col = pd.to_numeric(col, errors='coerce')
-                valid_count = numeric_col.notna().sum()
-                total_count = len(col)
+                if profile.numeric_error is not None:
+                    raise profile.numeric_error
+                valid_count = profile.numeric_valid_count
+                total_count = profile.row_count
                 
                 if valid_count == 0:
                     return False, f"SemanticValidityCheck: FAIL ('{self.column_name}' has no valid numeric amounts)"
@@ -289,8 +520,8 @@ class SemanticValidityCheck(QualityRule):
         
         elif self.semantic_tag == "id" or self.semantic_tag == "key":
             # Check that IDs/keys are non-null and mostly unique
-            null_count = col.isnull().sum()
-            total_count = len(col)
+            null_count = profile.null_count
+            total_count = profile.row_count
             
             if null_count > 0:
                 null_pct = (null_count / total_count) * 100
@@ -301,7 +532,7 @@ class SemanticValidityCheck(QualityRule):
                     )
             
             # Check uniqueness
-            unique_count = col.nunique()
+            unique_count = profile.nunique
             uniqueness_pct = (unique_count / total_count) * 100 if total_count > 0 else 0
             
             return True, (
@@ -312,9 +543,10 @@ class SemanticValidityCheck(QualityRule):
         elif self.semantic_tag == "date":
             # Check that dates are parseable
             try:
-                date_col = pd.to_datetime(col, errors='coerce')
-                valid_count = date_col.notna().sum()
-                total_count = len(col)
+                if profile.date_error is not None:
+                    raise profile.date_error
+                valid_count = len(profile.valid_dates)
+                total_count = profile.row_count
                 
                 if valid_count == 0:
                     return False, f"SemanticValidityCheck: FAIL ('{self.column_name}' has no valid dates)"
@@ -334,8 +566,8 @@ class SemanticValidityCheck(QualityRule):
         
         else:
             # Generic check - just ensure column is not entirely null
-            null_count = col.isnull().sum()
-            total_count = len(col)
+            null_count = profile.null_count
+            total_count = profile.row_count
             null_pct = (null_count / total_count) * 100 if total_count > 0 else 0
             
             if null_pct >= 100:
@@ -355,10 +587,17 @@ class QualityReport:
     """Container for quality check results."""
     status: str  # "PASS" or "FAIL"
     details: List[str] = field(default_factory=list)
+    sampling: Optional[Dict[str, Any]] = None  # Sampling parameters and decisions, if sampled
 
     def __str__(self) -> str:
         """Return a human-readable report."""
         lines = [f"Quality Report: {self.status}"]
+        if self.sampling:
+            lines.append(
+                f"Sampled: {self.sampling['sample_size']} of {self.sampling['population_rows']} rows "
+                f"(confidence {self.sampling['confidence']}, seed {self.sampling['random_state']}), "
+                f"{len(self.sampling['decided_on_sample'])} rule(s) decided on the sample"
+            )
         lines.append("-" * 50)
         for detail in self.details:
             lines.append(f"  {detail}")
@@ -366,7 +605,94 @@ class QualityReport:
 
 
 class DataQualityEngine:
-    """Engine for running data quality checks on DataFrames."""
+    """
+    Engine for running data quality checks on DataFrames.
+
+    Rules on the same column share one ColumnProfile: null counts, numeric
+    and date parsing and nunique are computed once per column for all the
+    rules that need them, and independent columns are profiled in parallel.
+
+    With a SamplingConfig, extracts of at least sampling.min_rows rows are
+    first checked on a row sample: rules confidently passing on the sample
+    skip the full scan, the others fall back to it (see SamplingConfig).
+
+    Args:
+        max_workers: Threads used to profile columns (default: up to 8,
+            bounded by the CPU count; 1 profiles sequentially)
+        sampling: Optional sampled mode for very large extracts
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, sampling: Optional[SamplingConfig] = None):
+        self.max_workers = max_workers or min(8, os.cpu_count() or 1)
+        self.sampling = sampling
+
+    def profile_columns(self, df: pd.DataFrame, rules: List[QualityRule]) -> Dict[str, ColumnProfile]:
+        """
+        Profile every existing column used by profile-based rules.
+
+        Args:
+            df: DataFrame to profile
+            rules: Rules; the profile_stats() of ColumnProfileRules are merged per column
+
+        Returns:
+            Mapping of column name to ColumnProfile
+        """
+        stats_by_column: Dict[str, set] = {}
+        for rule in rules:
+            if isinstance(rule, ColumnProfileRule) and rule.column_name in df.columns:
+                stats_by_column.setdefault(rule.column_name, set()).update(rule.profile_stats())
+
+        def build(column: str) -> ColumnProfile:
+            return ColumnProfile.build(df[column], stats_by_column[column])
+
+        columns = list(stats_by_column)
+        workers = min(self.max_workers, len(columns))
+        if workers <= 1:
+            profiles = [build(column) for column in columns]
+        else:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="quality-profile") as executor:
+                profiles = list(executor.map(build, columns))
+        return dict(zip(columns, profiles))
+
+    def _check_on_sample(
+        self, df: pd.DataFrame, rules: List[QualityRule]
+    ) -> tuple[Dict[int, tuple[bool, str]], Dict[str, Any]]:
+        """
+        Decide what can be decided on a row sample.
+
+        Returns:
+            Tuple of (results by rule position, sampling record for the report)
+        """
+        sampling = self.sampling
+        sample = df.sample(n=sampling.sample_size, random_state=sampling.random_state)
+        candidates = [
+            (position, rule) for position, rule in enumerate(rules)
+            if isinstance(rule, ColumnProfileRule) and rule.supports_sampling()
+            and rule.column_name in df.columns
+        ]
+        profiles = self.profile_columns(sample, [rule for _, rule in candidates])
+
+        decided: Dict[int, tuple[bool, str]] = {}
+        fallback = []
+        for position, rule in candidates:
+            result = rule.check_sample(profiles[rule.column_name], sampling, len(df))
+            if result is None:
+                fallback.append(f"{rule.get_name()}({rule.column_name})")
+            else:
+                decided[position] = result
+
+        record = {
+            "method": "uniform_without_replacement",
+            "population_rows": len(df),
+            "sample_size": sampling.sample_size,
+            "confidence": sampling.confidence,
+            "random_state": sampling.random_state,
+            "decided_on_sample": [
+                f"{rules[position].get_name()}({rules[position].column_name})" for position in decided
+            ],
+            "full_scan_fallback": fallback,
+        }
+        return decided, record
 
     def run_checks(self, df: pd.DataFrame, rules: List[QualityRule]) -> QualityReport:
         """
@@ -382,17 +708,31 @@ class DataQualityEngine:
         if not rules:
             return QualityReport(status="PASS", details=["No rules to check"])
 
+        decided: Dict[int, tuple[bool, str]] = {}
+        sampling_record = None
+        if self.sampling is not None and self.sampling.applies_to(len(df)):
+            decided, sampling_record = self._check_on_sample(df, rules)
+
+        profiles = self.profile_columns(
+            df, [rule for position, rule in enumerate(rules) if position not in decided]
+        )
         details = []
         all_passed = True
 
-        for rule in rules:
-            passed, message = rule.check(df)
+        for position, rule in enumerate(rules):
+            profile = profiles.get(rule.column_name) if isinstance(rule, ColumnProfileRule) else None
+            if position in decided:
+                passed, message = decided[position]
+            elif profile is not None:
+                passed, message = rule.check_profile(profile)
+            else:
+                passed, message = rule.check(df)
             details.append(message)
             if not passed:
                 all_passed = False
 
         status = "PASS" if all_passed else "FAIL"
-        return QualityReport(status=status, details=details)
+        return QualityReport(status=status, details=details, sampling=sampling_record)
 
 
 def build_quality_rules_from_schema(contract: Any, include_semantic: bool = True) -> List[QualityRule]:
@@ -8,11 +8,13 @@ with threshold-based materiality evaluation.
 Key Functions:
     - extract_nav_line_items: Extract NAV line items with LINE_ITEM_USD threshold evaluation
     - extract_tv_line_items: Extract Target Value line items with threshold evaluation
+    - extract_nav_line_items_frame / extract_tv_line_items_frame: Same for many
+      buckets at once, returning a DataFrame
     - generate_drilldown_view: Generate voucher-level view for category (placeholder)
     - get_voucher_details: Get detailed voucher information (placeholder)
 
 Line-Item Drilldown Features:
-    - Filters source data to specific bucket (country_code, category, voucher_type)
+    - Filters source data to specific buckets (country_code, category, voucher_type)
     - Converts local currency amounts to USD
     - Applies LINE_ITEM_USD thresholds to mark material items
     - Supports filtering to material items only
@@ -56,10 +58,15 @@ Usage Example:
     >>> print(f"Material line items: {material_count}/{len(nav_items)}")
 """
 
+import logging
 from typing import Optional
+
+import numpy as np
 import pandas as pd
 from src.utils.fx_utils import FXConverter
 
+logger = logging.getLogger(__name__)
+
 
 def generate_drilldown_view(
     nav_df: pd.DataFrame,
@@ -173,6 +180,32 @@ def get_voucher_details(
     return matches.iloc[0]
 
 
+# Columns of a line-item row, in review table order
+LINE_ITEM_COLUMNS = [
+    "country_code", "gl_account", "category", "voucher_type", "row_type",
+    "voucher_id", "document_no",
+    "nav_amount_local", "tv_amount_local", "variance_amount_local",
+    "nav_amount_usd", "tv_amount_usd", "variance_amount_usd",
+    "bucket_threshold_usd", "bucket_status",
+    "line_item_threshold_usd", "line_item_material",
+    "threshold_contract_version", "threshold_contract_hash",
+    "threshold_rule_description",
+]
+
+# Columns of the bucket frame passed to the *_line_items_frame functions
+BUCKET_COLUMNS = [
+    "country_code", "category", "voucher_type",
+    "bucket_threshold_usd", "threshold_contract_version", "threshold_contract_hash",
+    "line_item_threshold_usd", "threshold_rule_description",
+]
+
+NAV_AMOUNT_COLUMNS = ["amount_local", "amount_lcy", "amount"]
+TV_AMOUNT_COLUMNS = [
+    "remaining_amount", "Remaining Amount", "Remaining_Amount",
+    "TotalAmountUsed", "Total Amount Used", "amount_local", "amount",
+]
+
+
 def extract_nav_line_items(
     nav_source_df: pd.DataFrame,
     country_code: str,
@@ -190,7 +223,9 @@ def extract_nav_line_items(
     Extract NAV line items for a specific bucket with threshold evaluation.
     
     Drills down from bucket-level variance to individual NAV voucher line items.
-    Applies LINE_ITEM_USD threshold to mark material items.
+    Applies LINE_ITEM_USD threshold to mark material items. To drill down
+    several buckets, use extract_nav_line_items_frame(), which scans the
+    source once for all of them.
     
     Args:
         nav_source_df: Source DataFrame for NAV data (enriched CR_03 with categorization).
@@ -221,123 +256,17 @@ def extract_nav_line_items(
     Notes:
         - Filters nav_source_df to matching bucket (country_code, category, voucher_type)
         - Converts amounts from local currency to USD using FXConverter
-        - Compares abs(amount_usd) >= line_item_threshold.threshold_usd
+        - Compares abs(amount_usd) >= line_item_threshold.value_usd
         - Sets line_item_material flag
         - Optionally filters to material items only if filter_non_material=True
     """
-    import logging
-    from src.utils.pandas_utils import ensure_required_numeric
-    
-    logger = logging.getLogger(__name__)
-    
-    # Validate required columns
-    required_cols = ["category", "voucher_type"]
-    missing_cols = [col for col in required_cols if col not in nav_source_df.columns]
-    if missing_cols:
-        logger.warning(f"Missing columns in nav_source_df: {missing_cols}. Returning empty list.")
-        return []
-    
-    # Filter to matching bucket
-    mask = (
-        (nav_source_df["category"] == category) &
-        (nav_source_df["voucher_type"] == voucher_type)
-    )
-    
-    # Add country_code filter if column exists
-    if "country_code" in nav_source_df.columns:
-        mask = mask & (nav_source_df["country_code"] == country_code)
-    elif "id_company" in nav_source_df.columns:
-        # Fallback to id_company if country_code not present
-        mask = mask & (nav_source_df["id_company"] == country_code)
-    
-    bucket_df = nav_source_df[mask].copy()
-    
-    if bucket_df.empty:
-        logger.debug(
-            f"No NAV line items found for {country_code}/{category}/{voucher_type}"
-        )
-        return []
-    
-    # Find amount column (local currency)
-    amount_col = None
-    for col in ["amount_local", "amount_lcy", "amount"]:
-        if col in bucket_df.columns:
-            amount_col = col
-            break
-    
-    if amount_col is None:
-        logger.warning(
-            f"No amount column found in nav_source_df. "
-            f"Expected: amount_local, amount_lcy, or amount. "
-            f"Returning empty list."
-        )
-        return []
-    
-    # Ensure amount is numeric
-    bucket_df = ensure_required_numeric(bucket_df, [amount_col], force_numeric=True)
-    
-    # Find company code column for FX conversion
-    company_col = None
-    for col in ["country_code", "id_company", "Company_Code"]:
-        if col in bucket_df.columns:
-            company_col = col
-            break
-    
-    if company_col is None:
-        company_series = pd.Series([country_code] * len(bucket_df), index=bucket_df.index)
-    else:
-        company_series = bucket_df[company_col]
-    
-    bucket_df["amount_usd"] = fx_converter.convert_series_to_usd(
-        bucket_df[amount_col].abs(),
-        company_series,
+    buckets = _single_bucket(
+        country_code, category, voucher_type, line_item_threshold,
+        bucket_threshold_usd, bucket_contract_version, bucket_contract_hash,
     )
-    
-    # Extract line items
-    line_items = []
-    
-    for _, row in bucket_df.iterrows():
-        # Determine if line item is material
-        amount_usd = abs(row["amount_usd"])
-        is_material = amount_usd >= line_item_threshold.threshold_usd
-        
-        # Skip non-material items if filtering
-        if filter_non_material and not is_material:
-            continue
-        
-        # Build line item dict
-        line_item = {
-            "country_code": row.get(company_col, country_code),
-            "gl_account": gl_account,
-            "category": category,
-            "voucher_type": voucher_type,
-            "row_type": "line_item",
-            "voucher_id": row.get("voucher_no", None),
-            "document_no": row.get("document_no", None),
-            "nav_amount_local": row[amount_col],
-            "tv_amount_local": None,
-            "variance_amount_local": row[amount_col],  # NAV only, no TV match
-            "nav_amount_usd": row["amount_usd"] if row[amount_col] >= 0 else -row["amount_usd"],
-            "tv_amount_usd": None,
-            "variance_amount_usd": row["amount_usd"] if row[amount_col] >= 0 else -row["amount_usd"],
-            "bucket_threshold_usd": bucket_threshold_usd,
-            "bucket_status": "INVESTIGATE",
-            "line_item_threshold_usd": line_item_threshold.threshold_usd,
-            "line_item_material": is_material,
-            "threshold_contract_version": bucket_contract_version,
-            "threshold_contract_hash": bucket_contract_hash,
-            "threshold_rule_description": line_item_threshold.matched_rule_description,
-        }
-        
-        line_items.append(line_item)
-    
-    logger.info(
-        f"Extracted {len(line_items)} NAV line items for "
-        f"{country_code}/{category}/{voucher_type} "
-        f"({sum(1 for item in line_items if item['line_item_material'])} material)"
-    )
-    
-    return line_items
+    return _to_records(extract_nav_line_items_frame(
+        nav_source_df, buckets, gl_account, fx_converter, filter_non_material,
+    ))
 
 
 def extract_tv_line_items(
@@ -357,7 +286,9 @@ def extract_tv_line_items(
     Extract TV line items for a specific bucket with threshold evaluation.
     
     Drills down from bucket-level variance to individual Target Value voucher line items.
-    Applies LINE_ITEM_USD threshold to mark material items.
+    Applies LINE_ITEM_USD threshold to mark material items. To drill down
+    several buckets, use extract_tv_line_items_frame(), which scans the
+    source once for all of them.
     
     Args:
         tv_source_df: Source DataFrame for Target Values data (e.g., IPE_08, DOC_VOUCHER_USAGE).
@@ -388,15 +319,113 @@ def extract_tv_line_items(
     Notes:
         - Filters tv_source_df to matching bucket (country_code, category, voucher_type)
         - Converts amounts from local currency to USD using FXConverter
-        - Compares abs(amount_usd) >= line_item_threshold.threshold_usd
+        - Compares abs(amount_usd) >= line_item_threshold.value_usd
         - Sets line_item_material flag
         - Optionally filters to material items only if filter_non_material=True
     """
-    import logging
-    from src.utils.pandas_utils import ensure_required_numeric
+    buckets = _single_bucket(
+        country_code, category, voucher_type, line_item_threshold,
+        bucket_threshold_usd, bucket_contract_version, bucket_contract_hash,
+    )
+    return _to_records(extract_tv_line_items_frame(
+        tv_source_df, buckets, gl_account, fx_converter, filter_non_material,
+    ))
+
+
+def extract_nav_line_items_frame(
+    nav_source_df: pd.DataFrame,
+    buckets: pd.DataFrame,
+    gl_account: str,
+    fx_converter: FXConverter,
+    filter_non_material: bool = False,
+) -> pd.DataFrame:
+    """
+    Extract the NAV line items of several buckets in one pass.
     
-    logger = logging.getLogger(__name__)
+    Source rows are joined to the buckets on (country_code, category,
+    voucher_type) once, then converted to USD and evaluated against each
+    bucket's LINE_ITEM_USD threshold as whole columns.
     
+    Args:
+        nav_source_df: Source DataFrame for NAV data (see extract_nav_line_items)
+        buckets: One row per bucket with BUCKET_COLUMNS (country_code,
+            category, voucher_type, bucket_threshold_usd,
+            threshold_contract_version, threshold_contract_hash,
+            line_item_threshold_usd, threshold_rule_description)
+        gl_account: GL account number (e.g., "18412")
+        fx_converter: FXConverter instance for local-to-USD conversion
+        filter_non_material: If True, return only material line items
+    
+    Returns:
+        DataFrame with LINE_ITEM_COLUMNS, grouped by bucket in the order of
+        buckets and in source order within a bucket
+    """
+    # Validate required columns
+    required_cols = ["category", "voucher_type"]
+    missing_cols = [col for col in required_cols if col not in nav_source_df.columns]
+    if missing_cols:
+        logger.warning(f"Missing columns in nav_source_df: {missing_cols}. Returning no line items.")
+        return _empty_line_items()
+    
+    # Find amount column (local currency)
+    amount_col = _first_column(nav_source_df, NAV_AMOUNT_COLUMNS)
+    if amount_col is None:
+        logger.warning(
+            f"No amount column found in nav_source_df. "
+            f"Expected: amount_local, amount_lcy, or amount. "
+            f"Returning no line items."
+        )
+        return _empty_line_items()
+    
+    # Match on country_code, falling back to id_company if country_code not present
+    source_keys = nav_source_df[required_cols]
+    country_col = _first_column(nav_source_df, ["country_code", "id_company"])
+    if country_col is not None:
+        source_keys = source_keys.assign(country_code=nav_source_df[country_col])
+    
+    matched = _match_buckets(source_keys, buckets[list(source_keys.columns)])
+    line_items = _build_line_items(
+        nav_source_df, matched, buckets,
+        amount_col=amount_col,
+        company_col=_first_column(nav_source_df, ["country_code", "id_company", "Company_Code"]),
+        voucher_id_col="voucher_no" if "voucher_no" in nav_source_df.columns else None,
+        document_no_col="document_no" if "document_no" in nav_source_df.columns else None,
+        side="nav",
+        gl_account=gl_account,
+        fx_converter=fx_converter,
+        filter_non_material=filter_non_material,
+    )
+    
+    logger.info(
+        f"Extracted {len(line_items)} NAV line items for {len(buckets)} bucket(s) "
+        f"({int(line_items['line_item_material'].sum())} material)"
+    )
+    return line_items
+
+
+def extract_tv_line_items_frame(
+    tv_source_df: pd.DataFrame,
+    buckets: pd.DataFrame,
+    gl_account: str,
+    fx_converter: FXConverter,
+    filter_non_material: bool = False,
+) -> pd.DataFrame:
+    """
+    Extract the TV line items of several buckets in one pass.
+    
+    Same as extract_nav_line_items_frame() for Target Values sources, whose
+    voucher type may be given as business_use (compared case-insensitively).
+    
+    Args:
+        tv_source_df: Source DataFrame for TV data (see extract_tv_line_items)
+        buckets: One row per bucket with BUCKET_COLUMNS
+        gl_account: GL account number (e.g., "18412")
+        fx_converter: FXConverter instance for local-to-USD conversion
+        filter_non_material: If True, return only material line items
+    
+    Returns:
+        DataFrame with LINE_ITEM_COLUMNS
+    """
     # Validate required columns (flexible for different TV sources)
     # TV data may have different column structures depending on source
     has_category = "category" in tv_source_df.columns
@@ -406,137 +435,177 @@ def extract_tv_line_items(
         logger.warning(
             f"TV source missing categorization columns. "
             f"Expected 'category' and 'voucher_type' or 'business_use'. "
-            f"Returning empty list."
-        )
-        return []
-    
-    # Filter to matching bucket
-    mask = pd.Series([True] * len(tv_source_df), index=tv_source_df.index)
-    
-    # Filter by category if available
-    if "category" in tv_source_df.columns:
-        mask = mask & (tv_source_df["category"] == category)
-    
-    # Filter by voucher_type (may be called business_use in some TV sources)
-    if "voucher_type" in tv_source_df.columns:
-        mask = mask & (tv_source_df["voucher_type"] == voucher_type)
-    elif "business_use" in tv_source_df.columns:
-        # Map voucher_type to business_use values
-        # This requires understanding the mapping, for now use direct match
-        mask = mask & (tv_source_df["business_use"].str.lower() == voucher_type.lower())
-    elif "business_use_formatted" in tv_source_df.columns:
-        mask = mask & (tv_source_df["business_use_formatted"].str.lower() == voucher_type.lower())
-    
-    # Filter by country_code if available
-    if "country_code" in tv_source_df.columns:
-        mask = mask & (tv_source_df["country_code"] == country_code)
-    elif "ID_COMPANY" in tv_source_df.columns:
-        mask = mask & (tv_source_df["ID_COMPANY"] == country_code)
-    elif "id_company" in tv_source_df.columns:
-        mask = mask & (tv_source_df["id_company"] == country_code)
-    
-    bucket_df = tv_source_df[mask].copy()
-    
-    if bucket_df.empty:
-        logger.debug(
-            f"No TV line items found for {country_code}/{category}/{voucher_type}"
+            f"Returning no line items."
         )
-        return []
+        return _empty_line_items()
     
     # Find amount column (local currency)
     # Different TV sources use different column names
-    amount_col = None
-    for col in ["remaining_amount", "Remaining Amount", "Remaining_Amount", 
-                "TotalAmountUsed", "Total Amount Used", "amount_local", "amount"]:
-        if col in bucket_df.columns:
-            amount_col = col
-            break
-    
+    amount_col = _first_column(tv_source_df, TV_AMOUNT_COLUMNS)
     if amount_col is None:
         logger.warning(
             f"No amount column found in tv_source_df. "
             f"Expected: remaining_amount, TotalAmountUsed, amount_local, or amount. "
-            f"Returning empty list."
+            f"Returning no line items."
         )
-        return []
-    
-    # Ensure amount is numeric
-    bucket_df = ensure_required_numeric(bucket_df, [amount_col], force_numeric=True)
+        return _empty_line_items()
     
-    # Find company code column for FX conversion
-    company_col = None
-    for col in ["ID_COMPANY", "id_company", "country_code", "Company_Code"]:
-        if col in bucket_df.columns:
-            company_col = col
-            break
+    source_keys = pd.DataFrame(index=tv_source_df.index)
+    bucket_keys = pd.DataFrame(index=buckets.index)
+    if has_category:
+        source_keys["category"] = tv_source_df["category"]
+        bucket_keys["category"] = buckets["category"]
     
-    if company_col is None:
-        company_series = pd.Series([country_code] * len(bucket_df), index=bucket_df.index)
-    else:
-        company_series = bucket_df[company_col]
-    
-    bucket_df["amount_usd"] = fx_converter.convert_series_to_usd(
-        bucket_df[amount_col].abs(),
-        company_series,
+    # voucher_type may be called business_use in some TV sources (matched case-insensitively)
+    business_use_col = _first_column(tv_source_df, ["business_use", "business_use_formatted"])
+    if "voucher_type" in tv_source_df.columns:
+        source_keys["voucher_type"] = tv_source_df["voucher_type"]
+        bucket_keys["voucher_type"] = buckets["voucher_type"]
+    elif business_use_col is not None:
+        source_keys["voucher_type"] = tv_source_df[business_use_col].str.lower()
+        bucket_keys["voucher_type"] = buckets["voucher_type"].str.lower()
+    
+    country_col = _first_column(tv_source_df, ["country_code", "ID_COMPANY", "id_company"])
+    if country_col is not None:
+        source_keys["country_code"] = tv_source_df[country_col]
+        bucket_keys["country_code"] = buckets["country_code"]
+    
+    matched = _match_buckets(source_keys, bucket_keys)
+    line_items = _build_line_items(
+        tv_source_df, matched, buckets,
+        amount_col=amount_col,
+        company_col=_first_column(tv_source_df, ["ID_COMPANY", "id_company", "country_code", "Company_Code"]),
+        voucher_id_col=_first_column(tv_source_df, ["id", "voucher_id", "Voucher_ID", "voucher_no"]),
+        # TV sources typically don't have NAV document numbers
+        document_no_col=None,
+        side="tv",
+        gl_account=gl_account,
+        fx_converter=fx_converter,
+        filter_non_material=filter_non_material,
     )
     
-    # Find voucher ID column
-    voucher_id_col = None
-    for col in ["id", "voucher_id", "Voucher_ID", "voucher_no"]:
-        if col in bucket_df.columns:
-            voucher_id_col = col
-            break
+    logger.info(
+        f"Extracted {len(line_items)} TV line items for {len(buckets)} bucket(s) "
+        f"({int(line_items['line_item_material'].sum())} material)"
+    )
+    return line_items
+
+
+def _first_column(df: pd.DataFrame, candidates: list) -> Optional[str]:
+    for col in candidates:
+        if col in df.columns:
+            return col
+    return None
+
+
+def _empty_line_items() -> pd.DataFrame:
+    return pd.DataFrame(columns=LINE_ITEM_COLUMNS)
+
+
+def _single_bucket(
+    country_code, category, voucher_type, line_item_threshold,
+    bucket_threshold_usd, bucket_contract_version, bucket_contract_hash,
+) -> pd.DataFrame:
+    return pd.DataFrame([{
+        "country_code": country_code,
+        "category": category,
+        "voucher_type": voucher_type,
+        "bucket_threshold_usd": bucket_threshold_usd,
+        "threshold_contract_version": bucket_contract_version,
+        "threshold_contract_hash": bucket_contract_hash,
+        "line_item_threshold_usd": line_item_threshold.value_usd,
+        "threshold_rule_description": line_item_threshold.matched_rule_description,
+    }], columns=BUCKET_COLUMNS)
+
+
+def _to_records(line_items: pd.DataFrame) -> list:
+    """Line-item rows as dicts, with None for missing values."""
+    return line_items.astype(object).where(line_items.notna(), None).to_dict("records")
+
+
+def _match_buckets(source_keys: pd.DataFrame, bucket_keys: pd.DataFrame) -> pd.DataFrame:
+    """
+    Join source rows to buckets on equal key columns.
     
-    # Extract line items
-    line_items = []
+    Returns a frame of (_row, _bucket) positions, ordered by bucket then
+    source row. Missing keys never match (as with ==).
+    """
+    left = source_keys.astype(object).reset_index(drop=True).dropna()
+    right = bucket_keys.astype(object).reset_index(drop=True).dropna()
+    matched = left.reset_index(names="_row").merge(
+        right.reset_index(names="_bucket"),
+        on=list(source_keys.columns),
+    )
+    return matched[["_row", "_bucket"]].sort_values(["_bucket", "_row"], kind="mergesort")
+
+
+def _build_line_items(
+    source_df: pd.DataFrame,
+    matched: pd.DataFrame,
+    buckets: pd.DataFrame,
+    amount_col: str,
+    company_col: Optional[str],
+    voucher_id_col: Optional[str],
+    document_no_col: Optional[str],
+    side: str,
+    gl_account: str,
+    fx_converter: FXConverter,
+    filter_non_material: bool,
+) -> pd.DataFrame:
+    """Build the line-item columns of the matched (source row, bucket) pairs."""
+    from src.utils.pandas_utils import ensure_required_numeric
     
-    for _, row in bucket_df.iterrows():
-        # Determine if line item is material
-        amount_usd = abs(row["amount_usd"])
-        is_material = amount_usd >= line_item_threshold.threshold_usd
-        
-        # Skip non-material items if filtering
-        if filter_non_material and not is_material:
-            continue
-        
-        # Build line item dict
-        line_item = {
-            "country_code": row.get(company_col, country_code) if company_col else country_code,
-            "gl_account": gl_account,
-            "category": category,
-            "voucher_type": voucher_type,
-            "row_type": "line_item",
-            "voucher_id": row.get(voucher_id_col, None) if voucher_id_col else None,
-            "document_no": None,  # TV sources typically don't have NAV document numbers
-            "nav_amount_local": None,
-            "tv_amount_local": row[amount_col],
-            "variance_amount_local": row[amount_col],  # TV only, no NAV match
-            "nav_amount_usd": None,
-            "tv_amount_usd": row["amount_usd"] if row[amount_col] >= 0 else -row["amount_usd"],
-            "variance_amount_usd": row["amount_usd"] if row[amount_col] >= 0 else -row["amount_usd"],
-            "bucket_threshold_usd": bucket_threshold_usd,
-            "bucket_status": "INVESTIGATE",
-            "line_item_threshold_usd": line_item_threshold.threshold_usd,
-            "line_item_material": is_material,
-            "threshold_contract_version": bucket_contract_version,
-            "threshold_contract_hash": bucket_contract_hash,
-            "threshold_rule_description": line_item_threshold.matched_rule_description,
-        }
-        
-        line_items.append(line_item)
+    if matched.empty:
+        return _empty_line_items()
     
-    logger.info(
-        f"Extracted {len(line_items)} TV line items for "
-        f"{country_code}/{category}/{voucher_type} "
-        f"({sum(1 for item in line_items if item['line_item_material'])} material)"
-    )
+    rows = source_df.iloc[matched["_row"].to_numpy()].reset_index(drop=True)
+    bucket = buckets.iloc[matched["_bucket"].to_numpy()].reset_index(drop=True)
     
+    # Ensure amount is numeric
+    amount = ensure_required_numeric(rows[[amount_col]], [amount_col])[amount_col]
+    
+    # Company code for FX conversion, else the bucket's country
+    country = rows[company_col] if company_col is not None else bucket["country_code"]
+    amount_usd = fx_converter.convert_series_to_usd(amount.abs(), country)
+    signed_usd = amount_usd.where(amount >= 0, -amount_usd)
+    is_material = amount_usd.abs() >= bucket["line_item_threshold_usd"]
+    
+    missing = pd.Series(np.nan, index=rows.index)
+    line_items = pd.DataFrame({
+        "country_code": country,
+        "gl_account": gl_account,
+        "category": bucket["category"],
+        "voucher_type": bucket["voucher_type"],
+        "row_type": "line_item",
+        "voucher_id": rows[voucher_id_col] if voucher_id_col else None,
+        "document_no": rows[document_no_col] if document_no_col else None,
+        "nav_amount_local": amount if side == "nav" else missing,
+        "tv_amount_local": amount if side == "tv" else missing,
+        "variance_amount_local": amount,  # One side only, no match on the other
+        "nav_amount_usd": signed_usd if side == "nav" else missing,
+        "tv_amount_usd": signed_usd if side == "tv" else missing,
+        "variance_amount_usd": signed_usd,
+        "bucket_threshold_usd": bucket["bucket_threshold_usd"],
+        "bucket_status": "INVESTIGATE",
+        "line_item_threshold_usd": bucket["line_item_threshold_usd"],
+        "line_item_material": is_material,
+        "threshold_contract_version": bucket["threshold_contract_version"],
+        "threshold_contract_hash": bucket["threshold_contract_hash"],
+        "threshold_rule_description": bucket["threshold_rule_description"],
+    }, columns=LINE_ITEM_COLUMNS)
+    
+    # Skip non-material items if filtering
+    if filter_non_material:
+        line_items = line_items[is_material].reset_index(drop=True)
     return line_items
 
 
 __all__ = [
+    "LINE_ITEM_COLUMNS",
     "generate_drilldown_view",
     "get_voucher_details",
     "extract_nav_line_items",
     "extract_tv_line_items",
+    "extract_nav_line_items_frame",
+    "extract_tv_line_items_frame",
 ]
@@ -18,7 +18,11 @@ import pandas as pd
 import logging
 
 from src.utils.pandas_utils import require_columns, ensure_required_numeric
-from src.core.reconciliation.voucher_classification.voucher_utils import harmonize_voucher_type
+from src.core.reconciliation.voucher_classification.voucher_utils import (
+    BRIDGE_CATEGORIES,
+    harmonize_voucher_types,
+    to_categorical,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -145,19 +149,21 @@ def build_target_values_pivot_local(
         df["category"] = default_category
         logger.debug(f"Added missing 'category' column with default value: {default_category}")
     
-    # Harmonize voucher_type to canonical enum
+    # Harmonize voucher_type to canonical enum (once per distinct label)
     if "voucher_type" in df.columns:
-        df["voucher_type"] = df["voucher_type"].apply(harmonize_voucher_type)
+        df["voucher_type"] = harmonize_voucher_types(df["voucher_type"])
     
     # Ensure amount column is numeric (fillna=0.0 for aggregation safety)
     df = ensure_required_numeric(df, required=[amount_col], fillna=0.0)
     
     # Aggregate by grouping columns
     pivot_df = (
-        df.groupby(group_cols, as_index=False, dropna=False)
+        df.groupby(group_cols, as_index=False, dropna=False, observed=True)
         .agg({amount_col: "sum"})
         .rename(columns={amount_col: "tv_amount_local"})
     )
+    if "voucher_type" in pivot_df.columns:
+        pivot_df["voucher_type"] = pivot_df["voucher_type"].astype(object)
     
     # Deterministic sorting for reproducible results
     pivot_df = pivot_df.sort_values(by=group_cols, ignore_index=True)
@@ -287,17 +293,20 @@ def build_nav_pivot(
         df = df.rename(columns={"amount": currency_col})
     
     # Harmonize voucher_type to canonical enum (for NAV vouchers)
-    # This handles None/NaN values by returning "Unknown"
-    df["voucher_type"] = df["voucher_type"].apply(harmonize_voucher_type)
+    # This handles None/NaN values by returning "Unknown"; each distinct label
+    # (or category, as emitted by categorize_nav_vouchers) is mapped once.
+    df["voucher_type"] = harmonize_voucher_types(df["voucher_type"])
     
     # Handle missing bridge_category: fill with "Uncategorized"
-    df["bridge_category"] = df["bridge_category"].fillna("Uncategorized")
+    category = df["bridge_category"]
+    if not isinstance(category.dtype, pd.CategoricalDtype):
+        category = to_categorical(category, BRIDGE_CATEGORIES)
+    if "Uncategorized" not in category.cat.categories:
+        category = category.cat.add_categories("Uncategorized")
+    df["bridge_category"] = category.fillna("Uncategorized")
     
-    # Normalize category and voucher_type to strings for grouping.
-    # Note: harmonize_voucher_type already returns strings and handles missing values,
-    # but we still cast to str as defensive programming to ensure consistent string types.
-    df["category"] = df["bridge_category"].astype(str)
-    df["voucher_type"] = df["voucher_type"].astype(str)
+    # category and voucher_type stay categorical so the groupby works on codes
+    df["category"] = df["bridge_category"]
     
     # Build enriched lines DataFrame for drilldown
     # Include key columns for later analysis
@@ -317,12 +326,18 @@ def build_nav_pivot(
     pivot_data = df.groupby(
         ["category", "voucher_type"], 
         as_index=True,
-        dropna=False
+        dropna=False,
+        observed=True,
     ).agg(
         **{currency_col: (currency_col, "sum")},
         row_count=(currency_col, "count")
     )
     
+    # Pivot labels are plain strings (only observed combinations are kept)
+    pivot_data.index = pivot_data.index.set_levels(
+        [level.astype(str) for level in pivot_data.index.levels]
+    )
+    
     # Sort index for deterministic ordering
     # Primary sort: category (alphabetical)
     # Secondary sort: voucher_type (alphabetical)
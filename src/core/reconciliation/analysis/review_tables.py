@@ -25,11 +25,37 @@ Example:
 """
 
 from typing import Dict, Any, Optional
+import numpy as np
 import pandas as pd
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Review table columns and dtypes (bucket summaries and line items share them)
+REVIEW_TABLE_DTYPES = {
+    "country_code": object,
+    "gl_account": object,
+    "category": object,
+    "voucher_type": object,
+    "row_type": object,
+    "voucher_id": object,
+    "document_no": object,
+    "nav_amount_local": "float64",
+    "tv_amount_local": "float64",
+    "variance_amount_local": "float64",
+    "nav_amount_usd": "float64",
+    "tv_amount_usd": "float64",
+    "variance_amount_usd": "float64",
+    "bucket_threshold_usd": "float64",
+    "bucket_status": object,
+    "line_item_threshold_usd": "float64",
+    "line_item_material": "boolean",
+    "threshold_contract_version": "Int64",
+    "threshold_contract_hash": object,
+    "threshold_rule_description": object,
+}
+REVIEW_TABLE_COLUMNS = list(REVIEW_TABLE_DTYPES)
+
 
 def build_review_table(
     variance_pivot_with_status: pd.DataFrame,
@@ -98,6 +124,10 @@ def build_review_table(
         - threshold_contract_hash: Contract hash for evidence
         - threshold_rule_description: Matched rule description
         
+        Columns are typed per REVIEW_TABLE_DTYPES: amounts and thresholds are
+        float64, line_item_material is nullable boolean and
+        threshold_contract_version is Int64 (missing on rows without a value).
+        
         If no drilldown sources provided, returns bucket-level summaries only.
         If drilldown available, includes both bucket summaries and line items.
     
@@ -129,9 +159,6 @@ def build_review_table(
         - All threshold metadata included for complete audit trail
         - Non-material line items are included by default (filter_non_material_lines=False)
     """
-    # Import here to avoid circular dependency
-    from src.core.reconciliation.thresholds import resolve_line_item_threshold
-    
     # Validate required columns (thresholds applied to USD amounts post-FX conversion)
     required_cols = [
         "country_code", "category", "voucher_type", "status",
@@ -155,51 +182,37 @@ def build_review_table(
     
     if investigate_df.empty:
         logger.info("No INVESTIGATE buckets found. Returning empty review table.")
-        return pd.DataFrame(columns=[
-            "country_code", "gl_account", "category", "voucher_type", "row_type",
-            "voucher_id", "document_no",
-            "nav_amount_local", "tv_amount_local", "variance_amount_local",
-            "nav_amount_usd", "tv_amount_usd", "variance_amount_usd",
-            "bucket_threshold_usd", "bucket_status",
-            "line_item_threshold_usd", "line_item_material",
-            "threshold_contract_version", "threshold_contract_hash",
-            "threshold_rule_description",
-        ])
+        return _typed_review_table(pd.DataFrame(columns=REVIEW_TABLE_COLUMNS))
     
     logger.info(
         f"Building review table for {len(investigate_df)} INVESTIGATE buckets "
         f"(GL {gl_account})"
     )
     
-    # Build bucket-level summaries
-    bucket_summaries = []
-    
-    for _, row in investigate_df.iterrows():
-        bucket_summary = {
-            "country_code": row["country_code"],
-            "gl_account": gl_account,
-            "category": row["category"],
-            "voucher_type": row["voucher_type"],
-            "row_type": "bucket_summary",
-            "voucher_id": None,
-            "document_no": None,
-            "nav_amount_local": row["nav_amount_local"],
-            "tv_amount_local": row["tv_amount_local"],
-            "variance_amount_local": row["variance_amount_local"],
-            "nav_amount_usd": row["nav_amount_usd"],
-            "tv_amount_usd": row["tv_amount_usd"],
-            "variance_amount_usd": row["variance_amount_usd"],
-            "bucket_threshold_usd": row["threshold_usd"],
-            "bucket_status": "INVESTIGATE",
-            "line_item_threshold_usd": None,
-            "line_item_material": None,
-            "threshold_contract_version": row["threshold_contract_version"],
-            "threshold_contract_hash": row["threshold_contract_hash"],
-            "threshold_rule_description": row["threshold_rule_description"],
-        }
-        bucket_summaries.append(bucket_summary)
-    
-    review_rows = bucket_summaries
+    # Build bucket-level summaries (projection of the variance pivot)
+    bucket_summaries = pd.DataFrame({
+        "country_code": investigate_df["country_code"],
+        "gl_account": gl_account,
+        "category": investigate_df["category"],
+        "voucher_type": investigate_df["voucher_type"],
+        "row_type": "bucket_summary",
+        "voucher_id": None,
+        "document_no": None,
+        "nav_amount_local": investigate_df["nav_amount_local"],
+        "tv_amount_local": investigate_df["tv_amount_local"],
+        "variance_amount_local": investigate_df["variance_amount_local"],
+        "nav_amount_usd": investigate_df["nav_amount_usd"],
+        "tv_amount_usd": investigate_df["tv_amount_usd"],
+        "variance_amount_usd": investigate_df["variance_amount_usd"],
+        "bucket_threshold_usd": investigate_df["threshold_usd"],
+        "bucket_status": "INVESTIGATE",
+        "line_item_threshold_usd": np.nan,
+        "line_item_material": pd.NA,
+        "threshold_contract_version": investigate_df["threshold_contract_version"],
+        "threshold_contract_hash": investigate_df["threshold_contract_hash"],
+        "threshold_rule_description": investigate_df["threshold_rule_description"],
+    }, columns=REVIEW_TABLE_COLUMNS)
+    review_parts = [_typed_review_table(bucket_summaries)]
     
     # Add line-item drilldown if source data available
     if (nav_source_df is not None or tv_source_df is not None) and fx_converter is None:
@@ -215,10 +228,11 @@ def build_review_table(
             fx_converter=fx_converter,
             filter_non_material_lines=filter_non_material_lines,
         )
-        review_rows.extend(line_items)
+        if not line_items.empty:
+            review_parts.append(_typed_review_table(line_items))
     
     # Create final DataFrame
-    review_df = pd.DataFrame(review_rows)
+    review_df = pd.concat(review_parts, ignore_index=True)
     
     # Sort for consistent output
     sort_cols = ["country_code", "category", "voucher_type", "row_type"]
@@ -242,71 +256,67 @@ def _build_line_item_drilldown(
     tv_source_df: Optional[pd.DataFrame],
     fx_converter,
     filter_non_material_lines: bool,
-) -> list:
+) -> pd.DataFrame:
     """
     Build line-item drilldown rows for INVESTIGATE buckets.
     
     Internal helper function for build_review_table().
     
-    Returns list of line-item dictionaries with LINE_ITEM_USD threshold evaluation.
+    LINE_ITEM_USD thresholds are resolved for all buckets at once, and each
+    source frame is scanned once for all buckets.
+    
+    Returns DataFrame of line items with LINE_ITEM_USD threshold evaluation.
     """
-    from src.core.reconciliation.thresholds import resolve_line_item_threshold
+    from src.core.reconciliation.thresholds import ThresholdType, get_threshold_index
     from src.core.reconciliation.analysis.drilldown import (
-        extract_nav_line_items,
-        extract_tv_line_items,
+        LINE_ITEM_COLUMNS,
+        extract_nav_line_items_frame,
+        extract_tv_line_items_frame,
     )
     
-    line_items = []
+    # Resolve LINE_ITEM_USD threshold for every bucket
+    keys = pd.DataFrame({
+        "country_code": investigate_df["country_code"],
+        "gl_account": gl_account,
+        "category": investigate_df["category"],
+        "voucher_type": investigate_df["voucher_type"],
+        "threshold_type": ThresholdType.LINE_ITEM_USD,
+    }, index=investigate_df.index)
+    line_item_thresholds = get_threshold_index().resolve_frame(keys)
     
-    # Process each INVESTIGATE bucket
-    for _, bucket_row in investigate_df.iterrows():
-        country_code = bucket_row["country_code"]
-        category = bucket_row["category"]
-        voucher_type = bucket_row["voucher_type"]
-        
-        # Resolve LINE_ITEM_USD threshold for this bucket
-        line_item_threshold_resolved = resolve_line_item_threshold(
-            country_code=country_code,
-            gl_account=gl_account,
-            category=category,
-            voucher_type=voucher_type,
-        )
-        
-        # Extract NAV line items
-        if nav_source_df is not None:
-            nav_items = extract_nav_line_items(
-                nav_source_df=nav_source_df,
-                country_code=country_code,
-                category=category,
-                voucher_type=voucher_type,
-                gl_account=gl_account,
-                line_item_threshold=line_item_threshold_resolved,
-                fx_converter=fx_converter,
-                bucket_threshold_usd=bucket_row["threshold_usd"],
-                bucket_contract_version=bucket_row["threshold_contract_version"],
-                bucket_contract_hash=bucket_row["threshold_contract_hash"],
-                filter_non_material=filter_non_material_lines,
-            )
-            line_items.extend(nav_items)
-        
-        # Extract TV line items
-        if tv_source_df is not None:
-            tv_items = extract_tv_line_items(
-                tv_source_df=tv_source_df,
-                country_code=country_code,
-                category=category,
-                voucher_type=voucher_type,
-                gl_account=gl_account,
-                line_item_threshold=line_item_threshold_resolved,
-                fx_converter=fx_converter,
-                bucket_threshold_usd=bucket_row["threshold_usd"],
-                bucket_contract_version=bucket_row["threshold_contract_version"],
-                bucket_contract_hash=bucket_row["threshold_contract_hash"],
-                filter_non_material=filter_non_material_lines,
-            )
-            line_items.extend(tv_items)
+    buckets = pd.DataFrame({
+        "country_code": investigate_df["country_code"],
+        "category": investigate_df["category"],
+        "voucher_type": investigate_df["voucher_type"],
+        "bucket_threshold_usd": investigate_df["threshold_usd"],
+        "threshold_contract_version": investigate_df["threshold_contract_version"],
+        "threshold_contract_hash": investigate_df["threshold_contract_hash"],
+        "line_item_threshold_usd": line_item_thresholds["value_usd"],
+        "threshold_rule_description": line_item_thresholds["matched_rule_description"],
+    }).reset_index(drop=True)
     
-    return line_items
+    frames = []
+    # Extract NAV line items
+    if nav_source_df is not None:
+        frames.append(extract_nav_line_items_frame(
+            nav_source_df, buckets, gl_account, fx_converter, filter_non_material_lines,
+        ))
+    
+    # Extract TV line items
+    if tv_source_df is not None:
+        frames.append(extract_tv_line_items_frame(
+            tv_source_df, buckets, gl_account, fx_converter, filter_non_material_lines,
+        ))
+    
+    frames = [frame for frame in frames if not frame.empty]
+    if not frames:
+        return pd.DataFrame(columns=LINE_ITEM_COLUMNS)
+    return pd.concat(frames, ignore_index=True)
+
+
+def _typed_review_table(df: pd.DataFrame) -> pd.DataFrame:
+    """Review table columns in order, cast to REVIEW_TABLE_DTYPES."""
+    return df[REVIEW_TABLE_COLUMNS].astype(REVIEW_TABLE_DTYPES)
 
 
 def flag_for_manual_review(
@@ -331,6 +341,7 @@ def flag_for_manual_review(
 
 
 __all__ = [
+    "REVIEW_TABLE_COLUMNS",
     "build_review_table",
     "flag_for_manual_review",
 ]
@@ -30,6 +30,7 @@ Example:
 """
 
 from typing import Optional
+import numpy as np
 import pandas as pd
 import logging
 
@@ -202,29 +203,18 @@ def compute_variance_pivot_local(
     # Common mappings: NG→EC_NG, EG→JM_EG, KE→EC_KE, GH→JD_GH, etc.
     variance_df["company_code"] = variance_df["country_code"].apply(_map_country_to_company)
     
-    # Convert NAV amounts to USD
-    variance_df["nav_amount_usd"] = fx_converter.convert_series_to_usd(
-        variance_df["nav_amount_local"],
-        variance_df["company_code"]
+    # Convert NAV, TV and variance amounts to USD in one pass (rates looked up once)
+    # and add audit fields: fx_rate_used and fx_missing
+    usd_df = fx_converter.convert_columns_to_usd(
+        variance_df,
+        {
+            "nav_amount_local": "nav_amount_usd",
+            "tv_amount_local": "tv_amount_usd",
+            "variance_amount_local": "variance_amount_usd",
+        },
+        company_code_col="company_code",
     )
-    
-    # Convert TV amounts to USD
-    variance_df["tv_amount_usd"] = fx_converter.convert_series_to_usd(
-        variance_df["tv_amount_local"],
-        variance_df["company_code"]
-    )
-    
-    # Convert variance amounts to USD
-    variance_df["variance_amount_usd"] = fx_converter.convert_series_to_usd(
-        variance_df["variance_amount_local"],
-        variance_df["company_code"]
-    )
-    
-    # Add audit fields: fx_rate_used and fx_missing
-    variance_df["fx_rate_used"] = variance_df["company_code"].apply(
-        lambda cc: fx_converter.rates_dict.get(str(cc)) if pd.notna(cc) else None
-    )
-    variance_df["fx_missing"] = variance_df["fx_rate_used"].isna()
+    variance_df[usd_df.columns] = usd_df
     
     # Warn about missing FX rates
     missing_fx_count = variance_df["fx_missing"].sum()
@@ -375,7 +365,7 @@ def evaluate_thresholds_variance_pivot(
         - All threshold metadata is included for complete audit trail
     """
     # Import here to avoid circular dependency
-    from src.core.reconciliation.thresholds import resolve_bucket_threshold
+    from src.core.reconciliation.thresholds import ThresholdType, get_threshold_index
     
     # Validate required columns
     required_cols = ["country_code", "category", "voucher_type", "variance_amount_usd"]
@@ -401,49 +391,37 @@ def evaluate_thresholds_variance_pivot(
     # Make a copy to avoid modifying input
     result_df = variance_df.copy()
     
-    # Initialize threshold columns
-    threshold_data = []
-    
-    # Resolve threshold for each row
-    for idx, row in result_df.iterrows():
-        country_code = row["country_code"]
-        category = row["category"]
-        voucher_type = row["voucher_type"]
-        variance_usd = row["variance_amount_usd"]
-        
-        # Resolve threshold with full context
-        resolved = resolve_bucket_threshold(
-            country_code=country_code,
-            gl_account=gl_account,
-            category=category,
-            voucher_type=voucher_type,
+    # Resolve all buckets in one pass through the compiled threshold index
+    keys = pd.DataFrame({
+        "country_code": result_df["country_code"],
+        "gl_account": gl_account,
+        "category": result_df["category"],
+        "voucher_type": result_df["voucher_type"],
+        "threshold_type": ThresholdType.BUCKET_USD,
+    }, index=result_df.index)
+    resolved = get_threshold_index().resolve_frame(keys)
+    
+    # Determine status
+    # If variance_usd is NaN (missing FX rate), mark as INVESTIGATE by default
+    variance_usd = result_df["variance_amount_usd"]
+    missing_variance = variance_usd.isna()
+    for _, row in result_df.loc[missing_variance].iterrows():
+        logger.warning(
+            f"Missing variance_usd for {row['country_code']}/{row['category']}/{row['voucher_type']}, "
+            f"marking as INVESTIGATE"
         )
-        
-        # Determine status
-        # If variance_usd is NaN (missing FX rate), mark as INVESTIGATE by default
-        if pd.isna(variance_usd):
-            status = "INVESTIGATE"
-            logger.warning(
-                f"Missing variance_usd for {country_code}/{category}/{voucher_type}, "
-                f"marking as INVESTIGATE"
-            )
-        else:
-            abs_variance = abs(variance_usd)
-            status = "OK" if abs_variance < resolved.value_usd else "INVESTIGATE"
-        
-        # Store threshold metadata
-        threshold_data.append({
-            "threshold_usd": resolved.value_usd,
-            "status": status,
-            "threshold_contract_version": resolved.contract_version,
-            "threshold_contract_hash": resolved.contract_hash,
-            "threshold_rule_description": resolved.matched_rule_description,
-            "threshold_source": resolved.source,
-            "threshold_specificity": resolved.specificity_score,
-        })
+    within_threshold = ~missing_variance & (variance_usd.abs() < resolved["value_usd"])
     
     # Add threshold columns to result
-    threshold_df = pd.DataFrame(threshold_data, index=result_df.index)
+    threshold_df = pd.DataFrame({
+        "threshold_usd": resolved["value_usd"],
+        "status": np.where(within_threshold, "OK", "INVESTIGATE").astype(object),
+        "threshold_contract_version": resolved["contract_version"],
+        "threshold_contract_hash": resolved["contract_hash"],
+        "threshold_rule_description": resolved["matched_rule_description"],
+        "threshold_source": resolved["source"],
+        "threshold_specificity": resolved["specificity_score"],
+    }, index=result_df.index)
     result_df = pd.concat([result_df, threshold_df], axis=1)
     
     # Log summary
@@ -44,7 +44,7 @@ from src.utils.debug_probes import probe_df, audit_merge
 from src.core.extraction_pipeline import load_all_data
 
 # Import preprocessing modules
-from src.core.quality_checker import DataQualityEngine
+from src.core.quality_checker import DataQualityEngine, SamplingConfig
 from src.core.scope_filtering import (
     filter_ipe08_scope,
     filter_gl_18412,
@@ -104,6 +104,9 @@ def run_reconciliation(params: Dict[str, Any]) -> Dict[str, Any]:
             - uploaded_files (Dict[str, Any], optional): Manual file uploads
             - run_bridges (bool, optional): Whether to run bridge analysis (default: True)
             - validate_quality (bool, optional): Whether to run quality checks (default: True)
+            - max_workers (int, optional): Number of IPEs extracted concurrently (default: 1)
+            - quality_sampling (dict, optional): SamplingConfig options enabling sampled
+                                                 quality checks on large extracts (default: full scans)
     
     Returns:
         Dictionary containing all reconciliation results:
@@ -162,6 +165,8 @@ def run_reconciliation(params: Dict[str, Any]) -> Dict[str, Any]:
     uploaded_files = params.get('uploaded_files', {})
     run_bridges = params.get('run_bridges', True)
     validate_quality = params.get('validate_quality', True)
+    max_workers = params.get('max_workers', 1)
+    quality_sampling = params.get('quality_sampling')
     
     try:
         # =========================================================
@@ -173,6 +178,7 @@ def run_reconciliation(params: Dict[str, Any]) -> Dict[str, Any]:
             params=params,
             uploaded_files=uploaded_files,
             required_ipes=required_ipes,
+            max_workers=max_workers,
         )
         
         result['evidence_paths'] = evidence_store
@@ -232,7 +238,9 @@ def run_reconciliation(params: Dict[str, Any]) -> Dict[str, Any]:
         
         # Run quality checks if enabled
         if validate_quality:
-            quality_engine = DataQualityEngine()
+            quality_engine = DataQualityEngine(
+                sampling=SamplingConfig(**quality_sampling) if quality_sampling else None
+            )
             
             for item_id, df in data_store.items():
                 catalog_item = get_item_by_id(item_id)
@@ -242,6 +250,8 @@ def run_reconciliation(params: Dict[str, Any]) -> Dict[str, Any]:
                         'status': report.status,
                         'details': report.details,
                     }
+                    if report.sampling:
+                        result['quality_reports'][item_id]['sampling'] = report.sampling
                     if report.status == 'FAIL':
                         result['warnings'].append(f"Quality check failed for {item_id}")
         
@@ -9,6 +9,7 @@ Key Components:
     - models: Data models for threshold rules, contracts, and resolved thresholds
     - registry: YAML loading, caching, and contract management
     - threshold_utils: Threshold resolution with precedence logic
+    - threshold_index: Compiled rule index for resolving DataFrames of keys
 
 Quick Start:
     >>> from src.core.reconciliation.thresholds import resolve_threshold, ThresholdType
@@ -43,6 +44,7 @@ from .registry import (
     get_contract,
     get_contract_hash,
     get_available_countries,
+    get_cache_stats,
     clear_cache,
 )
 from .threshold_utils import (
@@ -51,6 +53,10 @@ from .threshold_utils import (
     resolve_line_item_threshold,
     get_fallback_threshold,
 )
+from .threshold_index import (
+    ThresholdIndex,
+    get_threshold_index,
+)
 
 __all__ = [
     # Models
@@ -64,10 +70,14 @@ __all__ = [
     "get_contract",
     "get_contract_hash",
     "get_available_countries",
+    "get_cache_stats",
     "clear_cache",
     # Threshold resolution
     "resolve_threshold",
     "resolve_bucket_threshold",
     "resolve_line_item_threshold",
     "get_fallback_threshold",
+    # Bulk resolution
+    "ThresholdIndex",
+    "get_threshold_index",
 ]
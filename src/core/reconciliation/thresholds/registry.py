@@ -8,14 +8,16 @@ Key Functions:
     - load_contract: Load and validate a threshold contract from YAML
     - get_contract_hash: Calculate SHA256 hash of contract file
     - get_contract: Get contract with caching (preferred method)
+    - get_cache_stats: Hit/miss counters of the contract cache
 """
 
 import hashlib
 import logging
 import os
-from functools import lru_cache
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 import yaml
 
@@ -66,6 +68,35 @@ def get_contract_hash(contract_path: Path) -> str:
     return sha256_hash.hexdigest()
 
 
+def _resolve_version(country_code: str, version: Optional[int], log: bool = True) -> int:
+    """Requested version, else the THRESHOLD_VERSION_<COUNTRY> pin, else 1."""
+    if version is not None:
+        return version
+    env_var = f"THRESHOLD_VERSION_{country_code.upper()}"
+    env_version = os.environ.get(env_var)
+    if not env_version:
+        return 1
+    try:
+        pinned = int(env_version)
+    except ValueError:
+        if log:
+            logger.warning(f"Invalid version in {env_var}={env_version}, using version 1")
+        return 1
+    if log:
+        logger.info(f"Using pinned version {pinned} for {country_code} from {env_var}")
+    return pinned
+
+
+def _contract_file(country_code: str) -> Path:
+    """Path of a country's contract file (raises if it does not exist)."""
+    contract_file = get_contracts_dir() / f"{country_code}.yaml"
+    if not contract_file.exists():
+        raise FileNotFoundError(
+            f"Contract file not found for {country_code}: {contract_file}"
+        )
+    return contract_file
+
+
 def load_contract(country_code: str, version: Optional[int] = None) -> tuple[ThresholdContract, str]:
     """
     Load a threshold contract from YAML file.
@@ -86,29 +117,8 @@ def load_contract(country_code: str, version: Optional[int] = None) -> tuple[Thr
         FileNotFoundError: If contract file not found
         ValueError: If contract YAML is invalid
     """
-    # Determine version to load
-    if version is None:
-        # Check environment variable for version pinning
-        env_var = f"THRESHOLD_VERSION_{country_code.upper()}"
-        env_version = os.environ.get(env_var)
-        if env_version:
-            try:
-                version = int(env_version)
-                logger.info(f"Using pinned version {version} for {country_code} from {env_var}")
-            except ValueError:
-                logger.warning(f"Invalid version in {env_var}={env_version}, using version 1")
-                version = 1
-        else:
-            version = 1
-    
-    # Construct contract file path
-    contracts_dir = get_contracts_dir()
-    contract_file = contracts_dir / f"{country_code}.yaml"
-    
-    if not contract_file.exists():
-        raise FileNotFoundError(
-            f"Contract file not found for {country_code}: {contract_file}"
-        )
+    version = _resolve_version(country_code, version)
+    contract_file = _contract_file(country_code)
     
     # Calculate hash before loading
     contract_hash = get_contract_hash(contract_file)
@@ -183,13 +193,82 @@ def load_contract(country_code: str, version: Optional[int] = None) -> tuple[Thr
     return contract, contract_hash
 
 
-@lru_cache(maxsize=32)
+class ContractCache:
+    """
+    Thread-safe LRU cache of loaded threshold contracts.
+    
+    Entries are keyed by (country_code, version, file mtime, file size), so
+    an edited contract file misses the cache and is re-parsed and re-hashed,
+    while unchanged files are parsed and hashed once per process.
+    
+    Args:
+        maxsize: Maximum number of cached contracts (least recently used
+            entries are dropped first)
+    """
+    
+    def __init__(self, maxsize: int = 32):
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple, Tuple[ThresholdContract, str]]" = OrderedDict()
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0}
+    
+    def get(self, country_code: str, version: Optional[int] = None) -> tuple[ThresholdContract, str]:
+        """
+        Get a contract, loading it on a miss (see load_contract).
+        
+        Raises:
+            FileNotFoundError: If contract file not found
+            ValueError: If contract YAML is invalid
+        """
+        stat = _contract_file(country_code).stat()
+        key = (
+            country_code,
+            _resolve_version(country_code, version, log=False),
+            stat.st_mtime_ns,
+            stat.st_size,
+        )
+        
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.stats["hits"] += 1
+                return entry
+            
+            # Loaded under the lock so concurrent misses parse the file once
+            self.stats["misses"] += 1
+            entry = load_contract(country_code, version)
+            # A changed file replaces the stale entry of the same contract
+            for stale in [k for k in self._entries if k[:2] == key[:2]]:
+                del self._entries[stale]
+            self._entries[key] = entry
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+            return entry
+    
+    def clear(self) -> None:
+        """Drop all cached contracts and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.stats = {"hits": 0, "misses": 0}
+    
+    def info(self) -> Dict[str, int]:
+        """Hit/miss counters and current size."""
+        with self._lock:
+            return {**self.stats, "size": len(self._entries), "maxsize": self.maxsize}
+
+
+_contract_cache = ContractCache()
+
+
 def get_contract(country_code: str, version: Optional[int] = None) -> tuple[ThresholdContract, str]:
     """
     Get a threshold contract with caching.
     
-    This is the preferred way to load contracts as it uses LRU caching
-    to avoid repeated file I/O and parsing.
+    This is the preferred way to load contracts as it uses a process-wide
+    LRU cache to avoid repeated file I/O, hashing and parsing. The cache is
+    keyed on the contract file's mtime and size, so edited files are
+    reloaded automatically.
     
     Args:
         country_code: Country code (e.g., "EG", "NG", "DEFAULT")
@@ -202,7 +281,21 @@ def get_contract(country_code: str, version: Optional[int] = None) -> tuple[Thre
         FileNotFoundError: If contract file not found
         ValueError: If contract YAML is invalid
     """
-    return load_contract(country_code, version)
+    return _contract_cache.get(country_code, version)
+
+
+def get_cache_stats() -> Dict[str, int]:
+    """
+    Get contract cache counters.
+    
+    Returns:
+        Dict with hits, misses, size and maxsize
+    
+    Example:
+        >>> get_cache_stats()
+        {'hits': 412, 'misses': 3, 'size': 3, 'maxsize': 32}
+    """
+    return _contract_cache.info()
 
 
 def get_available_countries() -> list[str]:
@@ -225,7 +318,11 @@ def get_available_countries() -> list[str]:
 
 def clear_cache():
     """Clear the contract cache. Useful for testing or reloading contracts."""
-    get_contract.cache_clear()
+    # Import here: threshold_index imports this module
+    from .threshold_index import _compiled_index
+
+    _contract_cache.clear()
+    _compiled_index.cache_clear()
     logger.info("Cleared threshold contract cache")
 
 
@@ -234,5 +331,7 @@ __all__ = [
     "get_contract",
     "get_contract_hash",
     "get_available_countries",
+    "get_cache_stats",
     "clear_cache",
+    "ContractCache",
 ]
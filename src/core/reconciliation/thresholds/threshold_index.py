@@ -0,0 +1,307 @@
+"""
+Compiled Threshold Index for SOXauto Threshold Catalog System.
+
+Resolving thresholds one bucket at a time (resolve_threshold) looks up the
+country contract, then DEFAULT, and filters and sorts every rule for each
+call. This module compiles all contracts once into a flat rule table and
+resolves a whole DataFrame of keys with a single join, applying the same
+precedence as resolve_threshold:
+
+1. Country-specific contract, most specific matching rule
+2. DEFAULT contract, most specific matching rule
+3. Hardcoded fallback
+
+Within a contract, ties on specificity keep the rule listed first.
+
+Key Functions:
+    - ThresholdIndex: Compiled rule table with resolve_frame() / resolve()
+    - get_threshold_index: Cached index per contract version
+
+Example:
+    >>> index = get_threshold_index()
+    >>> keys = pd.DataFrame({
+    ...     "country_code": ["EG", "NG"],
+    ...     "gl_account": ["18412", "18412"],
+    ...     "category": ["Issuance", "Usage"],
+    ...     "voucher_type": ["refund", "apology"],
+    ...     "threshold_type": [ThresholdType.BUCKET_USD] * 2,
+    ... })
+    >>> index.resolve_frame(keys)[["value_usd", "source"]]
+"""
+
+import logging
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .models import ResolvedThreshold, ThresholdContract, ThresholdType
+from .registry import get_available_countries, get_contract, get_contracts_dir
+from .threshold_utils import get_fallback_threshold
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONTRACT = "DEFAULT"
+
+KEY_COLUMNS = ["country_code", "gl_account", "category", "voucher_type", "threshold_type"]
+
+# ResolvedThreshold fields returned per key by ThresholdIndex.resolve_frame
+RESOLVED_COLUMNS = [
+    "value_usd",
+    "contract_version",
+    "contract_hash",
+    "matched_rule_description",
+    "source",
+    "specificity_score",
+]
+
+# Scope dimensions: (key column, ThresholdScope attribute)
+_SCOPE_DIMENSIONS = [
+    ("gl_account", "gl_accounts"),
+    ("category", "categories"),
+    ("voucher_type", "voucher_types"),
+]
+
+
+class ThresholdIndex:
+    """
+    Flat, precompiled table of the threshold rules of several contracts.
+
+    Each rule is expanded to one row per combination of its scope values
+    (None standing for "any value"), tagged with its contract tier
+    (0 = country, 1 = DEFAULT), specificity and position in the contract.
+
+    Args:
+        contracts: Mapping of contract code (country code or "DEFAULT") to
+            (ThresholdContract, contract_hash), as returned by get_contract
+    """
+
+    def __init__(self, contracts: Dict[str, Tuple[ThresholdContract, str]]):
+        self.contract_codes = sorted(contracts)
+        rows = []
+        for code, (contract, contract_hash) in contracts.items():
+            is_default = code == DEFAULT_CONTRACT
+            for order, rule in enumerate(contract.rules):
+                scope_values = [
+                    getattr(rule.scope, attr) or [None] for _, attr in _SCOPE_DIMENSIONS
+                ]
+                for gl_account in scope_values[0]:
+                    for category in scope_values[1]:
+                        for voucher_type in scope_values[2]:
+                            rows.append({
+                                "contract": code,
+                                "tier": 1 if is_default else 0,
+                                "threshold_type": rule.threshold_type.value,
+                                "rule_order": order,
+                                "rule_gl_account": gl_account,
+                                "rule_category": category,
+                                "rule_voucher_type": voucher_type,
+                                "specificity_score": rule.specificity_score(),
+                                "value_usd": rule.value_usd,
+                                "contract_version": contract.version,
+                                "contract_hash": contract_hash,
+                                "matched_rule_description": (
+                                    f"DEFAULT: {rule.description}" if is_default else rule.description
+                                ),
+                            })
+        self.rules = pd.DataFrame(rows, columns=[
+            "contract", "tier", "threshold_type", "rule_order",
+            "rule_gl_account", "rule_category", "rule_voucher_type",
+            "specificity_score", "value_usd", "contract_version", "contract_hash",
+            "matched_rule_description",
+        ])
+
+    @classmethod
+    def from_registry(cls, version: Optional[int] = None) -> "ThresholdIndex":
+        """
+        Compile every available contract (countries and DEFAULT).
+
+        Contracts that fail to load are logged and left out, so their
+        countries resolve through DEFAULT as with resolve_threshold.
+
+        Args:
+            version: Optional version number passed to get_contract
+        """
+        contracts = {}
+        for code in get_available_countries() + [DEFAULT_CONTRACT]:
+            try:
+                contracts[code] = get_contract(code, version)
+            except Exception as e:
+                logger.warning(f"Error loading contract for {code}: {e}. Excluded from threshold index")
+        return cls(contracts)
+
+    def resolve_frame(self, keys: pd.DataFrame) -> pd.DataFrame:
+        """
+        Resolve the threshold of every row of a key DataFrame.
+
+        Args:
+            keys: DataFrame with columns country_code, gl_account, category,
+                voucher_type and threshold_type (ThresholdType or its value);
+                gl_account, category and voucher_type may be None
+
+        Returns:
+            DataFrame indexed like keys with the ResolvedThreshold metadata
+            columns: value_usd, contract_version, contract_hash,
+            matched_rule_description, source, specificity_score
+        """
+        missing = [col for col in KEY_COLUMNS if col not in keys.columns]
+        if missing:
+            raise ValueError(f"Threshold keys missing columns: {missing}")
+
+        if keys.empty:
+            return pd.DataFrame(
+                {col: pd.Series(dtype=dtype) for col, dtype in zip(
+                    RESOLVED_COLUMNS, [float, int, object, object, object, int]
+                )},
+                index=keys.index,
+            )
+
+        normalized = keys[KEY_COLUMNS].astype(object).copy()
+        normalized["threshold_type"] = [
+            t.value if isinstance(t, ThresholdType) else ThresholdType(t).value
+            for t in normalized["threshold_type"]
+        ]
+        # Resolve each distinct key once, then broadcast to the rows
+        key_ids, unique_keys = _factorize_keys(normalized)
+        unique_keys["key_id"] = np.arange(len(unique_keys))
+
+        country_candidates = unique_keys.merge(
+            self.rules[self.rules["tier"] == 0],
+            left_on=["country_code", "threshold_type"],
+            right_on=["contract", "threshold_type"],
+        )
+        default_candidates = unique_keys.merge(
+            self.rules[self.rules["tier"] == 1],
+            on="threshold_type",
+        )
+        candidates = pd.concat([country_candidates, default_candidates], ignore_index=True)
+
+        matches = np.ones(len(candidates), dtype=bool)
+        for key_col, _ in _SCOPE_DIMENSIONS:
+            scope_value = candidates[f"rule_{key_col}"]
+            key_value = candidates[key_col]
+            # Same semantics as ThresholdScope.matches: an empty scope or an
+            # empty context value does not filter
+            matches &= (
+                scope_value.isna().to_numpy()
+                | _is_blank(key_value)
+                | (key_value == scope_value).to_numpy()
+            )
+        best = (
+            candidates[matches]
+            .sort_values(["key_id", "tier", "specificity_score", "rule_order"],
+                         ascending=[True, True, False, True], kind="mergesort")
+            .drop_duplicates("key_id")
+            .set_index("key_id")
+        )
+
+        resolved = best.reindex(unique_keys["key_id"]).reset_index(drop=True)
+        resolved["source"] = np.where(resolved["value_usd"].notna(), "catalog", None)
+        resolved = resolved[RESOLVED_COLUMNS].astype(object)
+
+        unresolved = np.flatnonzero(resolved["value_usd"].isna().to_numpy())
+        for key_id in unresolved:
+            key = unique_keys.iloc[key_id]
+            fallback = get_fallback_threshold(ThresholdType(key["threshold_type"]), key["country_code"])
+            resolved.iloc[key_id] = [getattr(fallback, col) for col in RESOLVED_COLUMNS]
+
+        resolved = resolved.astype({
+            "value_usd": float, "contract_version": int, "specificity_score": int,
+        })
+        result = resolved.iloc[key_ids]
+        result.index = keys.index
+        return result
+
+    def resolve(
+        self,
+        country_code: str,
+        threshold_type: ThresholdType,
+        gl_account: Optional[str] = None,
+        category: Optional[str] = None,
+        voucher_type: Optional[str] = None,
+    ) -> ResolvedThreshold:
+        """Resolve a single threshold through the index (see resolve_threshold)."""
+        row = self.resolve_frame(pd.DataFrame([{
+            "country_code": country_code,
+            "gl_account": gl_account,
+            "category": category,
+            "voucher_type": voucher_type,
+            "threshold_type": threshold_type,
+        }])).iloc[0]
+        return ResolvedThreshold(
+            value_usd=float(row["value_usd"]),
+            threshold_type=threshold_type,
+            country_code=country_code,
+            contract_version=int(row["contract_version"]),
+            contract_hash=row["contract_hash"],
+            matched_rule_description=row["matched_rule_description"],
+            source=row["source"],
+            specificity_score=int(row["specificity_score"]),
+        )
+
+
+def _factorize_keys(keys: pd.DataFrame) -> Tuple[np.ndarray, pd.DataFrame]:
+    """Row -> distinct key id, and the distinct keys (None and NaN kept as-is)."""
+    tuples = list(keys.itertuples(index=False, name=None))
+    ids: Dict[tuple, int] = {}
+    key_ids = np.fromiter((ids.setdefault(_hashable(t), len(ids)) for t in tuples),
+                          dtype=np.intp, count=len(tuples))
+    first_rows: List[int] = np.unique(key_ids, return_index=True)[1].tolist()
+    return key_ids, keys.iloc[first_rows].reset_index(drop=True)
+
+
+def _hashable(key: tuple) -> tuple:
+    # NaN != NaN: give missing values one stable identity per type
+    return tuple(("<na>", type(v).__name__) if _is_missing(v) else v for v in key)
+
+
+def _is_missing(value) -> bool:
+    return value is None or (isinstance(value, float) and np.isnan(value))
+
+
+def _is_blank(values: pd.Series) -> np.ndarray:
+    """True where a context value is falsy (None or empty string)."""
+    return np.array([v is None or (isinstance(v, str) and v == "") for v in values], dtype=bool)
+
+
+def get_threshold_index(version: Optional[int] = None) -> ThresholdIndex:
+    """
+    Get the compiled threshold index for a contract version (cached).
+    
+    The index is recompiled when a contract file is added, removed or
+    modified, and the cache is cleared together with the contract cache by
+    registry.clear_cache().
+    
+    Args:
+        version: Optional version number passed to get_contract
+    
+    Returns:
+        ThresholdIndex over all available contracts
+    """
+    return _compiled_index(version, _contracts_fingerprint())
+
+
+def _contracts_fingerprint() -> Tuple[Tuple[str, int, int], ...]:
+    """(name, mtime, size) of every contract file."""
+    fingerprint = []
+    for path in sorted(get_contracts_dir().glob("*.yaml")):
+        stat = path.stat()
+        fingerprint.append((path.name, stat.st_mtime_ns, stat.st_size))
+    return tuple(fingerprint)
+
+
+@lru_cache(maxsize=8)
+def _compiled_index(version: Optional[int], fingerprint: Tuple) -> ThresholdIndex:
+    index = ThresholdIndex.from_registry(version)
+    logger.info(
+        f"Compiled threshold index: {len(index.contract_codes)} contracts, "
+        f"{len(index.rules)} rule rows"
+    )
+    return index
+
+
+__all__ = [
+    "ThresholdIndex",
+    "get_threshold_index",
+]
@@ -7,6 +7,7 @@ to explain variance between NAV and Target Values.
 
 Modules:
     cat_pipeline: Main orchestrator for voucher classification
+    cat_rule_engine: Columnar (vectorized) rule engine used by cat_pipeline
     cat_nav_classifier: NAV integration type classification
     cat_issuance_classifier: Issuance classification (refund, apology, store_credit)
     cat_usage_classifier: Usage classification (positive amounts, integrated)
@@ -33,6 +34,7 @@ run_categorization_pipeline = categorize_nav_vouchers
 from src.core.reconciliation.voucher_classification.cat_nav_classifier import (
     classify_integration_type,
     is_integration_user,
+    load_integration_user_ids,
 )
 # Alias for consistency
 classify_nav_integration_type = classify_integration_type
@@ -49,10 +51,15 @@ from src.core.reconciliation.voucher_classification.cat_expired_classifier impor
 from src.core.reconciliation.voucher_classification.cat_vtc_classifier import (
     classify_vtc,
 )
+from src.core.reconciliation.voucher_classification.cat_rule_engine import (
+    CATEGORIZATION_RULES,
+    apply_categorization_rules,
+)
 
 # Import utilities
 from src.core.reconciliation.voucher_classification.voucher_utils import (
     COUNTRY_CODES,
+    VoucherTypeIndex,
     lookup_voucher_type,
 )
 
@@ -64,10 +71,14 @@ __all__ = [
     "classify_integration_type",
     "classify_nav_integration_type",  # Alias
     "is_integration_user",
+    "load_integration_user_ids",
     "classify_issuance",
     "classify_usage",
     "classify_expired",
     "classify_vtc",
+    "CATEGORIZATION_RULES",
+    "apply_categorization_rules",
     "COUNTRY_CODES",
+    "VoucherTypeIndex",
     "lookup_voucher_type",
 ]
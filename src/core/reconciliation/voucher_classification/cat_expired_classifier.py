@@ -18,11 +18,15 @@ No st.session_state or st.cache usage.
 from typing import Optional
 import pandas as pd
 
+from src.core.reconciliation.voucher_classification.voucher_utils import unclassified_rows
+
 
 def classify_expired(
     df: pd.DataFrame,
     amount_col: Optional[str] = None,
     description_col: Optional[str] = None,
+    inplace: bool = False,
+    row_mask: Optional[pd.Series] = None,
 ) -> pd.DataFrame:
     """
     Classify NAV GL entries as Expired voucher transactions.
@@ -37,6 +41,9 @@ def classify_expired(
         df: DataFrame containing GL entries with amount, description, and Integration_Type columns.
         amount_col: Name of the amount column. If None, auto-detects.
         description_col: Name of the description column. If None, auto-detects.
+        inplace: If True, classify df in place instead of a copy.
+        row_mask: Optional boolean Series restricting which rows are classified.
+                  Defaults to all rows.
 
     Returns:
         DataFrame with 'bridge_category' and 'voucher_type' columns populated
@@ -57,7 +64,7 @@ def classify_expired(
     if df is None or df.empty:
         return df.copy() if df is not None else pd.DataFrame()
 
-    out = df.copy()
+    out = df if inplace else df.copy()
 
     # Ensure required output columns exist
     if "bridge_category" not in out.columns:
@@ -83,11 +90,7 @@ def classify_expired(
         return out
 
     # Apply expired classification for each row
-    for idx, row in out.iterrows():
-        # Skip if already categorized
-        if pd.notna(out.at[idx, "bridge_category"]):
-            continue
-
+    for idx, row in unclassified_rows(out, row_mask).iterrows():
         amount = row[amount_col] if pd.notna(row[amount_col]) else 0
 
         # Only process positive amounts
@@ -135,6 +138,8 @@ def classify_manual_cancellation(
     df: pd.DataFrame,
     amount_col: Optional[str] = None,
     doc_type_col: Optional[str] = None,
+    inplace: bool = False,
+    row_mask: Optional[pd.Series] = None,
 ) -> pd.DataFrame:
     """
     Classify Manual Cancellation transactions via Credit Memo.
@@ -149,6 +154,9 @@ def classify_manual_cancellation(
         df: DataFrame containing GL entries.
         amount_col: Name of the amount column. If None, auto-detects.
         doc_type_col: Name of the document type column. If None, auto-detects.
+        inplace: If True, classify df in place instead of a copy.
+        row_mask: Optional boolean Series restricting which rows are classified.
+                  Defaults to all rows.
 
     Returns:
         DataFrame with classifications for manual cancellation entries.
@@ -156,7 +164,7 @@ def classify_manual_cancellation(
     if df is None or df.empty:
         return df.copy() if df is not None else pd.DataFrame()
 
-    out = df.copy()
+    out = df if inplace else df.copy()
 
     if "bridge_category" not in out.columns:
         out["bridge_category"] = None
@@ -180,10 +188,7 @@ def classify_manual_cancellation(
         return out
 
     # Apply manual cancellation classification
-    for idx, row in out.iterrows():
-        if pd.notna(out.at[idx, "bridge_category"]):
-            continue
-
+    for idx, row in unclassified_rows(out, row_mask).iterrows():
         amount = row[amount_col] if pd.notna(row[amount_col]) else 0
 
         if amount <= 0:
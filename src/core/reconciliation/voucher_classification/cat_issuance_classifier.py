@@ -23,7 +23,10 @@ No st.session_state or st.cache usage.
 from typing import Optional
 import pandas as pd
 
-from src.core.reconciliation.voucher_classification.voucher_utils import COUNTRY_CODES
+from src.core.reconciliation.voucher_classification.voucher_utils import (
+    COUNTRY_CODES,
+    unclassified_rows,
+)
 
 
 def classify_issuance(
@@ -31,6 +34,8 @@ def classify_issuance(
     amount_col: Optional[str] = None,
     description_col: Optional[str] = None,
     doc_no_col: Optional[str] = None,
+    inplace: bool = False,
+    row_mask: Optional[pd.Series] = None,
 ) -> pd.DataFrame:
     """
     Classify NAV GL entries with negative amounts as Issuance transactions.
@@ -45,6 +50,9 @@ def classify_issuance(
         amount_col: Name of the amount column. If None, auto-detects.
         description_col: Name of the description column. If None, auto-detects.
         doc_no_col: Name of the document number column. If None, auto-detects.
+        inplace: If True, classify df in place instead of a copy.
+        row_mask: Optional boolean Series restricting which rows are classified.
+                  Defaults to all rows.
 
     Returns:
         DataFrame with 'bridge_category' and 'voucher_type' columns populated
@@ -65,7 +73,7 @@ def classify_issuance(
     if df is None or df.empty:
         return df.copy() if df is not None else pd.DataFrame()
 
-    out = df.copy()
+    out = df if inplace else df.copy()
 
     # Ensure required output columns exist
     if "bridge_category" not in out.columns:
@@ -97,11 +105,7 @@ def classify_issuance(
         return out
 
     # Apply issuance classification for each row
-    for idx, row in out.iterrows():
-        # Skip if already categorized
-        if pd.notna(out.at[idx, "bridge_category"]):
-            continue
-
+    for idx, row in unclassified_rows(out, row_mask).iterrows():
         amount = row[amount_col] if pd.notna(row[amount_col]) else 0
 
         # Only process negative amounts (issuance)
@@ -4,31 +4,79 @@ NAV Classifier Module - Integration Type Detection.
 Determines whether a NAV GL entry is Manual or Integration based on the User ID.
 
 Business Rule:
-- If User ID == 'JUMIA/NAV31AFR.BATCH.SRVC' (strict match), treat as Integration
+- If User ID is one of the integration user IDs (strict match after trimming,
+  upper-casing and treating '\\' as '/'), treat as Integration
 - Otherwise, treat as Manual
 
+The integration user IDs default to 'JUMIA/NAV31AFR.BATCH.SRVC'. They can be
+overridden per call, or for the whole process with the comma-separated
+SOX_INTEGRATION_USER_IDS environment variable (read once).
+
 This is a pure function: DataFrame -> DataFrame
 No st.session_state or st.cache usage.
 """
 
-from typing import Optional
+import os
+from functools import lru_cache
+from typing import FrozenSet, Iterable, Optional
+import numpy as np
 import pandas as pd
 
 
+DEFAULT_INTEGRATION_USER_IDS: FrozenSet[str] = frozenset({"JUMIA/NAV31AFR.BATCH.SRVC"})
+INTEGRATION_USER_IDS_ENV_VAR = "SOX_INTEGRATION_USER_IDS"
+
+
+def _normalize_user_id(user_id: str) -> str:
+    """Trim, upper-case and treat both / and \\ as the same separator."""
+    return str(user_id).strip().upper().replace("\\", "/")
+
+
+def _normalize_user_ids(user_ids: Iterable[str]) -> FrozenSet[str]:
+    return frozenset(
+        normalized for normalized in (_normalize_user_id(u) for u in user_ids) if normalized
+    )
+
+
+@lru_cache(maxsize=1)
+def load_integration_user_ids() -> FrozenSet[str]:
+    """
+    Normalized integration user IDs for this process.
+
+    Read once from SOX_INTEGRATION_USER_IDS (comma-separated) when set, otherwise
+    DEFAULT_INTEGRATION_USER_IDS. Call load_integration_user_ids.cache_clear()
+    after changing the environment variable.
+
+    Returns:
+        Frozen set of normalized user IDs
+    """
+    configured = os.getenv(INTEGRATION_USER_IDS_ENV_VAR)
+    if configured and configured.strip():
+        return _normalize_user_ids(configured.split(","))
+    return _normalize_user_ids(DEFAULT_INTEGRATION_USER_IDS)
+
+
 def classify_integration_type(
     df: pd.DataFrame,
     user_id_col: Optional[str] = None,
+    integration_user_ids: Optional[Iterable[str]] = None,
+    inplace: bool = False,
 ) -> pd.DataFrame:
     """
     Classify NAV GL entries as Manual or Integration based on User ID.
 
     The integration type is determined by strict matching against the
-    specific user ID 'JUMIA/NAV31AFR.BATCH.SRVC'.
+    integration user IDs (default 'JUMIA/NAV31AFR.BATCH.SRVC'). Each distinct
+    user ID is normalized once, so the cost scales with the number of
+    distinct users rather than rows.
 
     Args:
         df: DataFrame containing GL entries with a user ID column.
         user_id_col: Name of the user ID column. If None, auto-detects from
                      common column names: 'User ID', 'user_id', 'User_ID', 'userid'
+        integration_user_ids: User IDs treated as Integration. If None, uses
+                     load_integration_user_ids().
+        inplace: If True, classify df in place instead of a copy.
 
     Returns:
         DataFrame with added 'Integration_Type' column containing either
@@ -45,8 +93,7 @@ def classify_integration_type(
         result["Integration_Type"] = None
         return result
 
-    out = df.copy()
-    out["Integration_Type"] = None
+    out = df if inplace else df.copy()
 
     # Auto-detect user ID column if not specified
     if user_id_col is None:
@@ -61,30 +108,42 @@ def classify_integration_type(
         out["Integration_Type"] = "Manual"
         return out
 
-    # Apply classification logic for each row
-    for idx, row in out.iterrows():
-        user_id = (
-            str(row[user_id_col]).strip().upper()
-            if pd.notna(row[user_id_col])
-            else ""
-        )
-        # Normalize slashes for strict match: treat both / and \ as equivalent
-        normalized_user_id = user_id.replace("\\", "/")
-        is_integration = normalized_user_id == "JUMIA/NAV31AFR.BATCH.SRVC"
-        out.at[idx, "Integration_Type"] = "Integration" if is_integration else "Manual"
-
+    integration_ids = (
+        load_integration_user_ids()
+        if integration_user_ids is None
+        else _normalize_user_ids(integration_user_ids)
+    )
+
+    # Normalize each distinct user ID once; nulls (code -1) are Manual
+    codes, uniques = pd.factorize(out[user_id_col], use_na_sentinel=True)
+    unique_is_integration = np.fromiter(
+        (_normalize_user_id(user_id) in integration_ids for user_id in uniques),
+        dtype=bool,
+        count=len(uniques),
+    )
+    is_integration = np.zeros(len(out), dtype=bool)
+    matched = codes >= 0
+    is_integration[matched] = unique_is_integration[codes[matched]]
+
+    out["Integration_Type"] = np.where(is_integration, "Integration", "Manual").astype(object)
     return out
 
 
-def is_integration_user(user_id: str) -> bool:
+def is_integration_user(
+    user_id: str,
+    integration_user_ids: Optional[Iterable[str]] = None,
+) -> bool:
     """
     Check if a user ID represents an integration/batch user.
 
     Args:
         user_id: The user ID string to check.
+        integration_user_ids: User IDs treated as Integration. If None, uses
+                     load_integration_user_ids().
 
     Returns:
-        True if the user ID matches the integration user (JUMIA/NAV31AFR.BATCH.SRVC), False otherwise.
+        True if the user ID matches an integration user (default
+        JUMIA/NAV31AFR.BATCH.SRVC), False otherwise.
 
     Example:
         >>> is_integration_user("JUMIA/NAV31AFR.BATCH.SRVC")
@@ -96,10 +155,17 @@ def is_integration_user(user_id: str) -> bool:
     """
     if not user_id or pd.isna(user_id):
         return False
-    user_id_upper = str(user_id).strip().upper()
-    # Normalize slashes for strict match: treat both / and \ as equivalent
-    normalized_user_id = user_id_upper.replace("\\", "/")
-    return normalized_user_id == "JUMIA/NAV31AFR.BATCH.SRVC"
-
-
-__all__ = ["classify_integration_type", "is_integration_user"]
+    integration_ids = (
+        load_integration_user_ids()
+        if integration_user_ids is None
+        else _normalize_user_ids(integration_user_ids)
+    )
+    return _normalize_user_id(user_id) in integration_ids
+
+
+__all__ = [
+    "DEFAULT_INTEGRATION_USER_IDS",
+    "classify_integration_type",
+    "is_integration_user",
+    "load_integration_user_ids",
+]
@@ -16,6 +16,11 @@ Rule Priority (highest to lowest):
 Note: "VTC via Bank Account" has the highest priority among all rules,
 as described in the PR ("VTC > Issuance > Usage > Expired > Manual").
 
+Two engines produce identical results:
+- "vectorized" (default): columnar rule engine (cat_rule_engine), rules
+  evaluated as boolean masks and combined first-match-wins.
+- "row": the original per-row classifiers applied step by step.
+
 This is a pure function: DataFrame -> DataFrame
 No st.session_state or st.cache usage.
 """
@@ -34,6 +39,15 @@ from src.core.reconciliation.voucher_classification.cat_expired_classifier impor
     classify_expired,
     classify_manual_cancellation,
 )
+from src.core.reconciliation.voucher_classification.cat_rule_engine import (
+    apply_categorization_rules,
+)
+from src.core.reconciliation.voucher_classification.voucher_utils import (
+    BRIDGE_CATEGORIES,
+    INTEGRATION_TYPES,
+    VOUCHER_TYPES,
+    to_categorical,
+)
 from src.bridges.categorization.business_line_reclass import (
     identify_business_line_reclass_candidates,
 )
@@ -44,6 +58,7 @@ def categorize_nav_vouchers(
     ipe_08_df: Optional[pd.DataFrame] = None,
     doc_voucher_usage_df: Optional[pd.DataFrame] = None,
     gl_account_filter: str = "18412",
+    engine: str = "vectorized",
 ) -> pd.DataFrame:
     """
     Main categorization pipeline for NAV GL entries.
@@ -74,9 +89,13 @@ def categorize_nav_vouchers(
         doc_voucher_usage_df: Optional DataFrame from DOC_VOUCHER_USAGE (Usage TV).
                               Expected columns: 'id', 'business_use', 'Transaction_No'
         gl_account_filter: GL account to filter for categorization (default: "18412")
+        engine: "vectorized" (columnar rule engine, default) or "row"
+                (per-row classifiers). Both produce the same output.
 
     Returns:
-        DataFrame with added 'bridge_category', 'voucher_type', and 'Integration_Type' columns
+        DataFrame with added 'bridge_category', 'voucher_type', and 'Integration_Type'
+        columns, stored as pandas Categoricals with the fixed label vocabularies
+        of voucher_utils
 
     Example:
         >>> cr_03_df = pd.DataFrame({
@@ -88,12 +107,15 @@ def categorize_nav_vouchers(
         >>> result = categorize_nav_vouchers(cr_03_df)
         >>> print(result[['bridge_category', 'voucher_type']].to_dict())
     """
+    if engine not in ("vectorized", "row"):
+        raise ValueError(f"Unknown categorization engine: {engine!r} (expected 'vectorized' or 'row')")
+
     if cr_03_df is None or cr_03_df.empty:
         result = cr_03_df.copy() if cr_03_df is not None else pd.DataFrame()
         result["bridge_category"] = None
         result["voucher_type"] = None
         result["Integration_Type"] = None
-        return result
+        return _to_categorical_outputs(result)
 
     out = cr_03_df.copy()
 
@@ -105,7 +127,7 @@ def categorize_nav_vouchers(
     gl_col = _find_gl_account_column(out)
 
     # Step 1: Determine Integration_Type for all rows
-    out = classify_integration_type(out)
+    out = classify_integration_type(out, inplace=True)
 
     # For rows not matching GL filter, skip categorization
     # but keep Integration_Type set
@@ -116,65 +138,72 @@ def categorize_nav_vouchers(
         # If no GL column found, process all rows
         gl_mask = pd.Series([True] * len(out), index=out.index)
 
-    # Step 2 (Priority): VTC via Bank Account
-    # This must come before Issuance because it can have negative amounts
-    out = _apply_to_masked_rows(
-        out,
-        gl_mask,
+    if engine == "vectorized":
+        categorized = apply_categorization_rules(
+            out,
+            row_mask=gl_mask,
+            ipe_08_df=ipe_08_df,
+            doc_voucher_usage_df=doc_voucher_usage_df,
+        )
+        out["bridge_category"] = categorized["bridge_category"]
+        out["voucher_type"] = categorized["voucher_type"]
+        return _to_categorical_outputs(out)
+
+    if not gl_mask.any():
+        return _to_categorical_outputs(out)
+
+    # Steps 2-8 classify the GL rows of out in place. Each step is given a
+    # row mask of the GL rows no earlier step has categorized, so it only
+    # iterates the rows still open.
+    steps = [
+        # Step 2 (Priority): VTC via Bank Account
+        # This must come before Issuance because it can have negative amounts
         classify_vtc_bank_account,
-    )
-
-    # Step 3: Issuance (Negative Amounts)
-    out = _apply_to_masked_rows(
-        out,
-        gl_mask,
+        # Step 3: Issuance (Negative Amounts)
         classify_issuance,
-    )
-
-    # Step 4: Usage (Positive Amounts + Integrated)
-    out = _apply_to_masked_rows(
-        out,
-        gl_mask,
-        lambda df: classify_usage(
+        # Step 4: Usage (Positive Amounts + Integrated)
+        lambda df, **kwargs: classify_usage(
             df,
             ipe_08_df=ipe_08_df,
             doc_voucher_usage_df=doc_voucher_usage_df,
+            **kwargs,
         ),
-    )
-
-    # Step 5: Expired (Manual + Positive + EXPR_*)
-    out = _apply_to_masked_rows(
-        out,
-        gl_mask,
+        # Step 5: Expired (Manual + Positive + EXPR_*)
         classify_expired,
-    )
-
-    # Step 6: VTC Pattern (Manual + Positive + RND/PYT+GTB)
-    out = _apply_to_masked_rows(
-        out,
-        gl_mask,
+        # Step 6: VTC Pattern (Manual + Positive + RND/PYT+GTB)
         classify_vtc_pattern,
-    )
-
-    # Step 7: Manual Cancellation (Credit Memo)
-    out = _apply_to_masked_rows(
-        out,
-        gl_mask,
+        # Step 7: Manual Cancellation (Credit Memo)
         classify_manual_cancellation,
-    )
-
-    # Step 8: Manual Usage (Nigeria Exception - ITEMPRICECREDIT)
-    out = _apply_to_masked_rows(
-        out,
-        gl_mask,
-        lambda df: classify_manual_usage(
+        # Step 8: Manual Usage (Nigeria Exception - ITEMPRICECREDIT)
+        lambda df, **kwargs: classify_manual_usage(
             df,
             ipe_08_df=ipe_08_df,
             doc_voucher_usage_df=doc_voucher_usage_df,
+            **kwargs,
         ),
-    )
+    ]
+    for classifier_func in steps:
+        open_mask = gl_mask & out["bridge_category"].isna()
+        if not open_mask.any():
+            break
+        classifier_func(out, inplace=True, row_mask=open_mask)
+
+    return _to_categorical_outputs(out)
+
+
+def _to_categorical_outputs(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Store the classification output columns as pandas Categoricals.
 
-    return out
+    Each column holds a handful of labels, so a fixed category vocabulary
+    (BRIDGE_CATEGORIES, VOUCHER_TYPES, INTEGRATION_TYPES) keeps one small
+    integer code per row and lets pivots group on the codes. voucher_type
+    values looked up from the TV files are added as extra categories.
+    """
+    df["bridge_category"] = to_categorical(df["bridge_category"], BRIDGE_CATEGORIES)
+    df["voucher_type"] = to_categorical(df["voucher_type"], VOUCHER_TYPES)
+    df["Integration_Type"] = to_categorical(df["Integration_Type"], INTEGRATION_TYPES)
+    return df
 
 
 def _find_gl_account_column(df: pd.DataFrame) -> Optional[str]:
@@ -209,40 +238,10 @@ def _find_gl_account_column(df: pd.DataFrame) -> Optional[str]:
     return None
 
 
-def _apply_to_masked_rows(
-    df: pd.DataFrame,
-    mask: pd.Series,
-    classifier_func,
-) -> pd.DataFrame:
-    """
-    Apply a classifier function only to rows matching a mask.
-
-    This helper ensures that classifiers only operate on relevant rows
-    (e.g., GL 18412 rows) while preserving other rows unchanged.
-
-    Args:
-        df: DataFrame to process.
-        mask: Boolean Series indicating which rows to process.
-        classifier_func: Function that takes a DataFrame and returns a classified DataFrame.
-
-    Returns:
-        DataFrame with classified rows merged back with non-classified rows.
-    """
-    if mask.sum() == 0:
-        return df
-
-    # Get the rows to classify
-    rows_to_classify = df[mask].copy()
-
-    # Apply classifier
-    classified = classifier_func(rows_to_classify)
-
-    # Update the original DataFrame with classified values
-    for col in ["bridge_category", "voucher_type"]:
-        if col in classified.columns:
-            df.loc[mask, col] = classified[col].values
-
-    return df
+def _label_counts(values: pd.Series) -> dict:
+    """Counts per label, without the unused categories of a categorical column."""
+    counts = values.value_counts(dropna=False)
+    return counts[counts > 0].to_dict()
 
 
 def get_categorization_summary(df: pd.DataFrame) -> dict:
@@ -281,13 +280,13 @@ def get_categorization_summary(df: pd.DataFrame) -> dict:
     by_integration_type = {}
 
     if "bridge_category" in df.columns:
-        by_category = df["bridge_category"].value_counts(dropna=False).to_dict()
+        by_category = _label_counts(df["bridge_category"])
 
     if "voucher_type" in df.columns:
-        by_voucher_type = df["voucher_type"].value_counts(dropna=False).to_dict()
+        by_voucher_type = _label_counts(df["voucher_type"])
 
     if "Integration_Type" in df.columns:
-        by_integration_type = df["Integration_Type"].value_counts(dropna=False).to_dict()
+        by_integration_type = _label_counts(df["Integration_Type"])
 
     return {
         "total_rows": total,
@@ -0,0 +1,355 @@
+"""
+Columnar Rule Engine for NAV Voucher Categorization.
+
+Evaluates the voucher categorization business rules as boolean masks over whole
+columns instead of looping row by row. Each rule is a condition over a set of
+pre-normalized columns (numeric amount, Integration_Type, upper-cased description,
+document number, comment, balancing account type and document type).
+
+Rules are listed in the same priority order as the per-row classifiers in
+cat_pipeline.py and combined with np.select, which picks the first matching
+condition for each row (first-match-wins).
+
+Rule Priority (highest to lowest):
+1. VTC via Bank Account - Manual + Positive + Bank Account
+2. Issuance - Negative amounts (integrated and manual sub-rules)
+3. Usage - Positive + Integration (Voucher Accrual -> Cancellation)
+4. Expired - Manual + Positive + EXPR_*
+5. VTC Pattern - Manual + Positive + MANUAL RND or PYT_ + GTB
+6. Manual Cancellation - Manual + Positive + Credit Memo
+7. Manual Usage - Manual + Positive + ITEMPRICECREDIT
+
+This is a pure function: DataFrame -> DataFrame
+No st.session_state or st.cache usage.
+"""
+
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from src.core.reconciliation.voucher_classification.voucher_utils import (
+    COUNTRY_CODES,
+    VoucherTypeIndex,
+)
+
+
+# Column name candidates, identical to the per-row classifiers' auto-detection
+AMOUNT_COLUMNS = ["Amount", "amount", "Amt", "amt"]
+DESCRIPTION_COLUMNS = ["Document Description", "description", "Description", "desc"]
+DOC_NO_COLUMNS = ["Document No", "Document No_", "doc_no", "Doc_No"]
+DOC_TYPE_COLUMNS = ["Document Type", "Document_Type", "doc_type", "Doc_Type"]
+COMMENT_COLUMNS = ["Comment", "Comments", "comment", "comments"]
+BAL_ACCOUNT_TYPE_COLUMNS = ["Bal_ Account Type", "Bal_Account_Type", "bal_account_type"]
+VOUCHER_NO_COLUMNS = ["Voucher No_", "[Voucher No_]", "voucher_no", "Voucher_No"]
+
+# Sentinel voucher_type meaning "resolve from the TV files (IPE_08 / DOC_VOUCHER_USAGE)"
+LOOKUP_VOUCHER_TYPE = "__lookup__"
+
+
+class RuleInputs:
+    """
+    Normalized column views shared by all categorization rules.
+
+    Normalization mirrors the per-row classifiers exactly:
+    - amount: numeric, NaN treated as 0
+    - integration_type: stripped string, NaN or missing column treated as 'Manual'
+    - description / doc_no / comment / bal_account_type: upper-cased and stripped
+    - doc_type: lower-cased and stripped
+    Missing columns normalize to empty strings.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        self.index = df.index
+        self.amount_col = _find_column(df, AMOUNT_COLUMNS)
+
+        if self.amount_col is not None:
+            self.amount = pd.to_numeric(df[self.amount_col], errors="coerce").fillna(0)
+        else:
+            self.amount = pd.Series(0.0, index=df.index)
+
+        if "Integration_Type" in df.columns:
+            integration = _normalize_text(df["Integration_Type"], default="Manual")
+        else:
+            integration = pd.Series("Manual", index=df.index)
+        self.is_integration = integration == "Integration"
+        self.is_manual = integration == "Manual"
+
+        self.description = _normalize_text(_column_or_none(df, DESCRIPTION_COLUMNS), index=df.index).str.upper()
+        self.doc_no = _normalize_text(_column_or_none(df, DOC_NO_COLUMNS), index=df.index).str.upper()
+        self.comment = _normalize_text(_column_or_none(df, COMMENT_COLUMNS), index=df.index).str.upper()
+        self.bal_account_type = _normalize_text(
+            _column_or_none(df, BAL_ACCOUNT_TYPE_COLUMNS), index=df.index
+        ).str.upper()
+        self.doc_type = _normalize_text(_column_or_none(df, DOC_TYPE_COLUMNS), index=df.index).str.lower()
+
+        self.positive = self.amount > 0
+        self.negative = self.amount < 0
+
+    def description_contains(self, *patterns: str) -> pd.Series:
+        """Return True where the description contains any of the literal patterns."""
+        mask = pd.Series(False, index=self.index)
+        for pattern in patterns:
+            mask |= self.description.str.contains(pattern, regex=False)
+        return mask
+
+
+@dataclass(frozen=True)
+class CategorizationRule:
+    """
+    A single categorization rule evaluated as a boolean mask.
+
+    Attributes:
+        name: Rule identifier (for debugging and summaries)
+        bridge_category: Category assigned when the rule matches
+        voucher_type: Voucher type assigned when the rule matches. None keeps the
+                      existing value; LOOKUP_VOUCHER_TYPE resolves it from the TV files.
+        condition: Function of RuleInputs returning a boolean Series
+    """
+    name: str
+    bridge_category: str
+    voucher_type: Optional[str]
+    condition: Callable[[RuleInputs], pd.Series]
+
+
+def _is_store_credit_doc(inputs: RuleInputs) -> pd.Series:
+    return inputs.doc_no.str.startswith(tuple(COUNTRY_CODES))
+
+
+CATEGORIZATION_RULES: List[CategorizationRule] = [
+    # 1. VTC via Bank Account (highest priority, before Issuance)
+    CategorizationRule(
+        "vtc_bank_account", "VTC", "Refund",
+        lambda i: i.is_manual & i.positive & (i.bal_account_type == "BANK ACCOUNT"),
+    ),
+    # 2. Integrated Issuance
+    CategorizationRule(
+        "issuance_integrated_refund", "Issuance", "Refund",
+        lambda i: i.negative & i.is_integration & i.description_contains("REFUND", "RF_", "RF "),
+    ),
+    CategorizationRule(
+        "issuance_integrated_apology", "Issuance", "Apology",
+        lambda i: i.negative & i.is_integration & i.description_contains("COMMERCIAL GESTURE"),
+    ),
+    CategorizationRule(
+        "issuance_integrated_jforce", "Issuance", "JForce",
+        lambda i: i.negative & i.is_integration & i.description_contains("PYT_"),
+    ),
+    CategorizationRule(
+        "issuance_integrated_generic", "Issuance", None,
+        lambda i: i.negative & i.is_integration,
+    ),
+    # 2. Manual Issuance (anything not 'Integration')
+    CategorizationRule(
+        "issuance_manual_store_credit", "Issuance", "Store Credit",
+        lambda i: i.negative & ~i.is_integration & _is_store_credit_doc(i),
+    ),
+    CategorizationRule(
+        "issuance_manual_refund", "Issuance", "Refund",
+        lambda i: i.negative & ~i.is_integration & i.description_contains("REFUND", "RFN", "RF_", "RF "),
+    ),
+    CategorizationRule(
+        "issuance_manual_apology", "Issuance", "Apology",
+        lambda i: i.negative & ~i.is_integration & i.description_contains("COMMERCIAL", "CXP", "APOLOGY"),
+    ),
+    CategorizationRule(
+        "issuance_manual_jforce", "Issuance", "JForce",
+        lambda i: i.negative & ~i.is_integration & i.description_contains("PYT_"),
+    ),
+    CategorizationRule(
+        "issuance_manual_generic", "Issuance", None,
+        lambda i: i.negative & ~i.is_integration,
+    ),
+    # 3. Usage (Positive + Integration)
+    CategorizationRule(
+        "usage_voucher_accrual_cancellation", "Cancellation", "Apology",
+        lambda i: i.positive & i.is_integration & i.description_contains("VOUCHER ACCRUAL"),
+    ),
+    CategorizationRule(
+        "usage_integrated", "Usage", LOOKUP_VOUCHER_TYPE,
+        lambda i: i.positive & i.is_integration,
+    ),
+    # 4. Expired (Manual + Positive + EXPR_*)
+    CategorizationRule(
+        "expired_apology", "Expired", "Apology",
+        lambda i: i.positive & i.is_manual & i.description_contains("EXPR_APLGY"),
+    ),
+    CategorizationRule(
+        "expired_jforce", "Expired", "JForce",
+        lambda i: i.positive & i.is_manual & i.description_contains("EXPR_JFORCE"),
+    ),
+    CategorizationRule(
+        "expired_store_credit", "Expired", "Store Credit",
+        lambda i: i.positive & i.is_manual & i.description_contains("EXPR_STR CRDT", "EXPR_STR_CRDT"),
+    ),
+    CategorizationRule(
+        "expired_generic", "Expired", None,
+        lambda i: i.positive & i.is_manual & i.description_contains("EXPR"),
+    ),
+    # 5. VTC Pattern (Manual + Positive + MANUAL RND or PYT_ with GTB comment)
+    CategorizationRule(
+        "vtc_pattern", "VTC", "Refund",
+        lambda i: i.positive & i.is_manual & (
+            i.description_contains("MANUAL RND")
+            | (i.description_contains("PYT_") & i.comment.str.contains("GTB", regex=False))
+        ),
+    ),
+    # 6. Manual Cancellation (Credit Memo)
+    CategorizationRule(
+        "manual_cancellation_credit_memo", "Cancellation", "Store Credit",
+        lambda i: i.positive & i.is_manual & (i.doc_type == "credit memo"),
+    ),
+    # 7. Manual Usage (Nigeria exception - ITEMPRICECREDIT)
+    CategorizationRule(
+        "manual_usage_itempricecredit", "Usage", LOOKUP_VOUCHER_TYPE,
+        lambda i: i.positive & i.is_manual & i.description_contains("ITEMPRICECREDIT"),
+    ),
+]
+
+
+def apply_categorization_rules(
+    df: pd.DataFrame,
+    row_mask: Optional[pd.Series] = None,
+    ipe_08_df: Optional[pd.DataFrame] = None,
+    doc_voucher_usage_df: Optional[pd.DataFrame] = None,
+    rules: Optional[Sequence[CategorizationRule]] = None,
+) -> pd.DataFrame:
+    """
+    Evaluate categorization rules as column masks and return the results.
+
+    Only rows selected by row_mask and with no existing bridge_category are
+    classified. The first matching rule wins, following the list order.
+
+    Args:
+        df: DataFrame of NAV GL entries (Integration_Type should already be set).
+        row_mask: Optional boolean Series restricting which rows are classified
+                  (e.g., GL 18412 rows). Defaults to all rows.
+        ipe_08_df: Optional IPE_08 DataFrame for Usage voucher type lookups.
+        doc_voucher_usage_df: Optional DOC_VOUCHER_USAGE DataFrame for lookups.
+        rules: Rules to evaluate, in priority order. Defaults to CATEGORIZATION_RULES.
+
+    Returns:
+        DataFrame indexed like df with 'bridge_category' and 'voucher_type' columns.
+
+    Example:
+        >>> df = pd.DataFrame({
+        ...     'Amount': [-100.0, 30.0],
+        ...     'Document Description': ['Refund voucher', 'EXPR_APLGY cleanup'],
+        ...     'Integration_Type': ['Integration', 'Manual'],
+        ... })
+        >>> apply_categorization_rules(df)['bridge_category'].tolist()
+        ['Issuance', 'Expired']
+    """
+    rules = CATEGORIZATION_RULES if rules is None else rules
+
+    existing_category = _existing_column(df, "bridge_category")
+    existing_voucher_type = _existing_column(df, "voucher_type")
+
+    result = pd.DataFrame(
+        {"bridge_category": existing_category, "voucher_type": existing_voucher_type},
+        index=df.index,
+    )
+
+    if df.empty:
+        return result
+
+    inputs = RuleInputs(df)
+    if inputs.amount_col is None:
+        # Cannot classify without amount column
+        return result
+
+    open_mask = existing_category.isna()
+    if row_mask is not None:
+        open_mask &= row_mask.to_numpy(dtype=bool)
+
+    if not open_mask.any():
+        return result
+
+    conditions = [
+        (open_mask & rule.condition(inputs)).to_numpy(dtype=bool)
+        for rule in rules
+    ]
+    # Index of the first matching rule per row, -1 when no rule matches
+    matched_rule = np.select(conditions, list(range(len(rules))), default=-1)
+
+    categories = np.array([rule.bridge_category for rule in rules] + [None], dtype=object)
+    bridge_category = categories[matched_rule]
+    matched = matched_rule >= 0
+
+    voucher_type = existing_voucher_type.to_numpy(dtype=object, copy=True)
+    voucher_type_index = None
+    for rule_idx, rule in enumerate(rules):
+        if rule.voucher_type is None:
+            continue
+        rule_rows = matched_rule == rule_idx
+        if not rule_rows.any():
+            continue
+        if rule.voucher_type == LOOKUP_VOUCHER_TYPE:
+            if voucher_type_index is None:
+                voucher_type_index = VoucherTypeIndex(ipe_08_df, doc_voucher_usage_df)
+            looked_up = _lookup_voucher_types(
+                df.loc[rule_rows], voucher_type_index
+            ).to_numpy(dtype=object)
+            found = np.array([bool(v) for v in looked_up], dtype=bool)
+            target = np.flatnonzero(rule_rows)[found]
+            voucher_type[target] = looked_up[found]
+        else:
+            voucher_type[rule_rows] = rule.voucher_type
+
+    result.loc[matched, "bridge_category"] = bridge_category[matched]
+    result["voucher_type"] = voucher_type
+    return result
+
+
+def _lookup_voucher_types(df: pd.DataFrame, voucher_type_index: VoucherTypeIndex) -> pd.Series:
+    """Resolve the TV voucher type for each row of df in one batch (None when not found)."""
+    voucher_no_col = _find_column(df, VOUCHER_NO_COLUMNS)
+    doc_no_col = _find_column(df, DOC_NO_COLUMNS)
+    voucher_nos = _normalize_text(df[voucher_no_col] if voucher_no_col else None, index=df.index)
+    doc_nos = _normalize_text(df[doc_no_col] if doc_no_col else None, index=df.index)
+
+    return voucher_type_index.lookup_many(voucher_nos, doc_nos)
+
+
+def _find_column(df: pd.DataFrame, candidates: List[str]) -> Optional[str]:
+    """Return the first candidate column present in df, or None."""
+    for col in candidates:
+        if col in df.columns:
+            return col
+    return None
+
+
+def _column_or_none(df: pd.DataFrame, candidates: List[str]) -> Optional[pd.Series]:
+    col = _find_column(df, candidates)
+    return df[col] if col is not None else None
+
+
+def _existing_column(df: pd.DataFrame, col: str) -> pd.Series:
+    if col in df.columns:
+        return df[col].astype(object)
+    return pd.Series(None, index=df.index, dtype=object)
+
+
+def _normalize_text(
+    series: Optional[pd.Series],
+    default: str = "",
+    index: Optional[pd.Index] = None,
+) -> pd.Series:
+    """Convert to stripped strings, replacing NaN (or a missing column) with default."""
+    if series is None:
+        return pd.Series(default, index=index, dtype=object)
+    values = series.astype(object)
+    notna = values.notna()
+    out = pd.Series(default, index=values.index, dtype=object)
+    out[notna] = values[notna].map(str).str.strip()
+    return out
+
+
+__all__ = [
+    "CATEGORIZATION_RULES",
+    "CategorizationRule",
+    "LOOKUP_VOUCHER_TYPE",
+    "RuleInputs",
+    "apply_categorization_rules",
+]
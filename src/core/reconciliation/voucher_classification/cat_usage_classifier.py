@@ -15,7 +15,11 @@ No st.session_state or st.cache usage.
 from typing import Optional
 import pandas as pd
 
-from src.core.reconciliation.voucher_classification.voucher_utils import lookup_voucher_type
+from src.core.reconciliation.voucher_classification.voucher_utils import (
+    VoucherTypeIndex,
+    lookup_voucher_type,
+    unclassified_rows,
+)
 
 
 def classify_usage(
@@ -24,6 +28,8 @@ def classify_usage(
     description_col: Optional[str] = None,
     ipe_08_df: Optional[pd.DataFrame] = None,
     doc_voucher_usage_df: Optional[pd.DataFrame] = None,
+    inplace: bool = False,
+    row_mask: Optional[pd.Series] = None,
 ) -> pd.DataFrame:
     """
     Classify NAV GL entries with positive amounts and Integration type as Usage.
@@ -44,6 +50,9 @@ def classify_usage(
                    Expected columns: 'id', 'business_use'
         doc_voucher_usage_df: Optional DataFrame for fallback voucher type lookups.
                               Expected columns: 'id', 'business_use', 'Transaction_No'
+        inplace: If True, classify df in place instead of a copy.
+        row_mask: Optional boolean Series restricting which rows are classified.
+                  Defaults to all rows.
 
     Returns:
         DataFrame with 'bridge_category' and 'voucher_type' columns populated
@@ -62,7 +71,7 @@ def classify_usage(
     if df is None or df.empty:
         return df.copy() if df is not None else pd.DataFrame()
 
-    out = df.copy()
+    out = df if inplace else df.copy()
 
     # Ensure required output columns exist
     if "bridge_category" not in out.columns:
@@ -100,12 +109,11 @@ def classify_usage(
         # Cannot classify without amount column
         return out
 
-    # Apply usage classification for each row
-    for idx, row in out.iterrows():
-        # Skip if already categorized
-        if pd.notna(out.at[idx, "bridge_category"]):
-            continue
+    # Build the TV lookup index once instead of scanning the TV files per row
+    voucher_type_index = VoucherTypeIndex(ipe_08_df, doc_voucher_usage_df)
 
+    # Apply usage classification for each row
+    for idx, row in unclassified_rows(out, row_mask).iterrows():
         amount = row[amount_col] if pd.notna(row[amount_col]) else 0
 
         # Only process positive amounts
@@ -148,9 +156,7 @@ def classify_usage(
                 else ""
             )
 
-            voucher_type = lookup_voucher_type(
-                voucher_no, doc_no, ipe_08_df, doc_voucher_usage_df
-            )
+            voucher_type = voucher_type_index.lookup(voucher_no, doc_no)
             if voucher_type:
                 out.at[idx, "voucher_type"] = voucher_type
 
@@ -163,6 +169,8 @@ def classify_manual_usage(
     description_col: Optional[str] = None,
     ipe_08_df: Optional[pd.DataFrame] = None,
     doc_voucher_usage_df: Optional[pd.DataFrame] = None,
+    inplace: bool = False,
+    row_mask: Optional[pd.Series] = None,
 ) -> pd.DataFrame:
     """
     Classify Manual Usage transactions (Nigeria exception - ITEMPRICECREDIT).
@@ -179,6 +187,9 @@ def classify_manual_usage(
         description_col: Name of the description column. If None, auto-detects.
         ipe_08_df: Optional DataFrame for voucher type lookups.
         doc_voucher_usage_df: Optional DataFrame for fallback voucher type lookups.
+        inplace: If True, classify df in place instead of a copy.
+        row_mask: Optional boolean Series restricting which rows are classified.
+                  Defaults to all rows.
 
     Returns:
         DataFrame with updated classifications for manual usage entries.
@@ -186,7 +197,7 @@ def classify_manual_usage(
     if df is None or df.empty:
         return df.copy() if df is not None else pd.DataFrame()
 
-    out = df.copy()
+    out = df if inplace else df.copy()
 
     # Ensure required output columns exist
     if "bridge_category" not in out.columns:
@@ -223,12 +234,10 @@ def classify_manual_usage(
     if amount_col is None or amount_col not in out.columns:
         return out
 
-    # Apply manual usage classification
-    for idx, row in out.iterrows():
-        # Skip if already categorized
-        if pd.notna(out.at[idx, "bridge_category"]):
-            continue
+    voucher_type_index = VoucherTypeIndex(ipe_08_df, doc_voucher_usage_df)
 
+    # Apply manual usage classification
+    for idx, row in unclassified_rows(out, row_mask).iterrows():
         amount = row[amount_col] if pd.notna(row[amount_col]) else 0
 
         # Only process positive amounts
@@ -267,9 +276,7 @@ def classify_manual_usage(
                 else ""
             )
 
-            voucher_type = lookup_voucher_type(
-                voucher_no, doc_no, ipe_08_df, doc_voucher_usage_df
-            )
+            voucher_type = voucher_type_index.lookup(voucher_no, doc_no)
             if voucher_type:
                 out.at[idx, "voucher_type"] = voucher_type
 
@@ -15,6 +15,8 @@ No st.session_state or st.cache usage.
 from typing import Optional
 import pandas as pd
 
+from src.core.reconciliation.voucher_classification.voucher_utils import unclassified_rows
+
 
 def classify_vtc(
     df: pd.DataFrame,
@@ -22,6 +24,8 @@ def classify_vtc(
     description_col: Optional[str] = None,
     bal_account_type_col: Optional[str] = None,
     comment_col: Optional[str] = None,
+    inplace: bool = False,
+    row_mask: Optional[pd.Series] = None,
 ) -> pd.DataFrame:
     """
     Classify NAV GL entries as VTC (Voucher to Cash) transactions.
@@ -36,6 +40,9 @@ def classify_vtc(
         description_col: Name of the description column. If None, auto-detects.
         bal_account_type_col: Name of the balancing account type column. If None, auto-detects.
         comment_col: Name of the comment column. If None, auto-detects.
+        inplace: If True, classify df in place instead of a copy.
+        row_mask: Optional boolean Series restricting which rows are classified.
+                  Defaults to all rows.
 
     Returns:
         DataFrame with 'bridge_category' and 'voucher_type' columns populated
@@ -54,7 +61,7 @@ def classify_vtc(
     if df is None or df.empty:
         return df.copy() if df is not None else pd.DataFrame()
 
-    out = df.copy()
+    out = df if inplace else df.copy()
 
     # Ensure required output columns exist
     if "bridge_category" not in out.columns:
@@ -92,11 +99,7 @@ def classify_vtc(
         return out
 
     # Apply VTC classification for each row
-    for idx, row in out.iterrows():
-        # Skip if already categorized
-        if pd.notna(out.at[idx, "bridge_category"]):
-            continue
-
+    for idx, row in unclassified_rows(out, row_mask).iterrows():
         amount = row[amount_col] if pd.notna(row[amount_col]) else 0
 
         integration_type = (
@@ -157,6 +160,8 @@ def classify_vtc_bank_account(
     df: pd.DataFrame,
     amount_col: Optional[str] = None,
     bal_account_type_col: Optional[str] = None,
+    inplace: bool = False,
+    row_mask: Optional[pd.Series] = None,
 ) -> pd.DataFrame:
     """
     Classify VTC transactions based on Bank Account balancing type.
@@ -173,6 +178,9 @@ def classify_vtc_bank_account(
         df: DataFrame containing GL entries.
         amount_col: Name of the amount column. If None, auto-detects.
         bal_account_type_col: Name of the balancing account type column. If None, auto-detects.
+        inplace: If True, classify df in place instead of a copy.
+        row_mask: Optional boolean Series restricting which rows are classified.
+                  Defaults to all rows.
 
     Returns:
         DataFrame with VTC classifications for Bank Account entries.
@@ -180,7 +188,7 @@ def classify_vtc_bank_account(
     if df is None or df.empty:
         return df.copy() if df is not None else pd.DataFrame()
 
-    out = df.copy()
+    out = df if inplace else df.copy()
 
     if "bridge_category" not in out.columns:
         out["bridge_category"] = None
@@ -204,10 +212,7 @@ def classify_vtc_bank_account(
         return out
 
     # Apply Bank Account VTC classification
-    for idx, row in out.iterrows():
-        if pd.notna(out.at[idx, "bridge_category"]):
-            continue
-
+    for idx, row in unclassified_rows(out, row_mask).iterrows():
         amount = row[amount_col] if pd.notna(row[amount_col]) else 0
 
         integration_type = (
@@ -237,6 +242,8 @@ def classify_vtc_pattern(
     amount_col: Optional[str] = None,
     description_col: Optional[str] = None,
     comment_col: Optional[str] = None,
+    inplace: bool = False,
+    row_mask: Optional[pd.Series] = None,
 ) -> pd.DataFrame:
     """
     Classify VTC transactions based on description/comment patterns.
@@ -250,6 +257,9 @@ def classify_vtc_pattern(
         amount_col: Name of the amount column. If None, auto-detects.
         description_col: Name of the description column. If None, auto-detects.
         comment_col: Name of the comment column. If None, auto-detects.
+        inplace: If True, classify df in place instead of a copy.
+        row_mask: Optional boolean Series restricting which rows are classified.
+                  Defaults to all rows.
 
     Returns:
         DataFrame with VTC classifications for pattern-based entries.
@@ -257,7 +267,7 @@ def classify_vtc_pattern(
     if df is None or df.empty:
         return df.copy() if df is not None else pd.DataFrame()
 
-    out = df.copy()
+    out = df if inplace else df.copy()
 
     if "bridge_category" not in out.columns:
         out["bridge_category"] = None
@@ -287,10 +297,7 @@ def classify_vtc_pattern(
         return out
 
     # Apply pattern-based VTC classification
-    for idx, row in out.iterrows():
-        if pd.notna(out.at[idx, "bridge_category"]):
-            continue
-
+    for idx, row in unclassified_rows(out, row_mask).iterrows():
         amount = row[amount_col] if pd.notna(row[amount_col]) else 0
 
         # Only positive amounts for pattern-based VTC
@@ -5,13 +5,49 @@ This module contains common constants and utility functions used across
 categorization modules for voucher type lookups and business rules.
 """
 
-from typing import List, Optional
+import logging
+from typing import Dict, List, Optional, Tuple
+import numpy as np
 import pandas as pd
 
+logger = logging.getLogger(__name__)
+
 
 # Country codes for Store Credit issuance detection
 COUNTRY_CODES: List[str] = ["NG", "EG", "KE", "GH", "CI", "MA", "TN", "ZA", "UG", "SN"]
 
+# Transaction_No column naming conventions found in TV files
+TRANSACTION_NO_COLUMNS: List[str] = ["Transaction_No", "transaction_no", "Transaction_No_", "TransactionNo"]
+
+# Label vocabularies of the categorization output columns, used as the fixed
+# categories of their pandas Categorical representation
+BRIDGE_CATEGORIES: List[str] = ["Issuance", "Usage", "Cancellation", "Expired", "VTC"]
+VOUCHER_TYPES: List[str] = ["Refund", "Apology", "JForce", "Store Credit"]
+INTEGRATION_TYPES: List[str] = ["Integration", "Manual"]
+
+# Canonical values returned by harmonize_voucher_type
+HARMONIZED_VOUCHER_TYPES: List[str] = [
+    "refund", "store_credit", "apology", "jforce", "expired", "vtc", "other", "Unknown",
+]
+
+# Lower-cased raw labels -> canonical voucher type
+# Based on voucher classification system in cat_issuance_classifier.py
+_VOUCHER_TYPE_ALIASES: Dict[str, str] = {
+    alias: canonical
+    for canonical, aliases in {
+        "refund": ["refund", "rf_", "rfn"],
+        "store_credit": ["store credit", "store_credit", "storecredit"],
+        "apology": ["apology", "commercial gesture", "cxp"],
+        "jforce": ["jforce", "pyt_", "pyt_pf"],
+        "expired": ["expired", "exp"],
+        "vtc": ["vtc", "voucher to cash"],
+        "other": ["other", "unknown"],
+    }.items()
+    for alias in aliases
+}
+_HARMONIZED_POSITIONS: Dict[str, int] = {label: i for i, label in enumerate(HARMONIZED_VOUCHER_TYPES)}
+_HARMONIZED_DTYPE = pd.CategoricalDtype(HARMONIZED_VOUCHER_TYPES)
+
 
 def _lookup_by_transaction_no(
     df: pd.DataFrame,
@@ -34,7 +70,7 @@ def _lookup_by_transaction_no(
     
     # Find Transaction_No column (handle various naming conventions)
     transaction_col = None
-    for col in ["Transaction_No", "transaction_no", "Transaction_No_", "TransactionNo"]:
+    for col in TRANSACTION_NO_COLUMNS:
         if col in df.columns:
             transaction_col = col
             break
@@ -137,12 +173,199 @@ def lookup_voucher_type(
     return None
 
 
+class VoucherTypeIndex:
+    """
+    Hash index for voucher type lookups against the TV files.
+
+    Pre-normalizes the IPE_08 and DOC_VOUCHER_USAGE keys once (str + strip) and
+    keeps a first-occurrence mapping key -> business_use for each lookup path,
+    so each lookup is a hash probe instead of a scan of the TV DataFrames.
+
+    Lookup priority is the same as lookup_voucher_type:
+    1. IPE_08 id
+    2. DOC_VOUCHER_USAGE id
+    3. DOC_VOUCHER_USAGE Transaction_No
+    4. IPE_08 Transaction_No
+
+    Example:
+        >>> index = VoucherTypeIndex(ipe_08_df, doc_voucher_usage_df)
+        >>> index.lookup("V12345", "DOC-001")
+        'refund'
+        >>> index.lookup_many(nav_df["[Voucher No_]"], nav_df["Document No"])
+    """
+
+    def __init__(
+        self,
+        ipe_08_df: Optional[pd.DataFrame] = None,
+        doc_voucher_usage_df: Optional[pd.DataFrame] = None,
+    ):
+        self._ipe_08_by_id = self._build_key_map(ipe_08_df, ["id"])
+        self._usage_by_id = self._build_key_map(doc_voucher_usage_df, ["id"])
+        self._usage_by_transaction_no = self._build_key_map(doc_voucher_usage_df, TRANSACTION_NO_COLUMNS)
+        self._ipe_08_by_transaction_no = self._build_key_map(ipe_08_df, TRANSACTION_NO_COLUMNS)
+
+    @staticmethod
+    def _build_key_map(
+        df: Optional[pd.DataFrame],
+        key_candidates: List[str],
+    ) -> Optional[pd.Series]:
+        """
+        Build a key -> business_use Series (unique index, first occurrence wins).
+
+        Returns None when the DataFrame, key column or business_use column is missing.
+        """
+        if df is None or df.empty or "business_use" not in df.columns:
+            return None
+
+        key_col = next((col for col in key_candidates if col in df.columns), None)
+        if key_col is None:
+            return None
+
+        try:
+            keys = df[key_col].astype(str).str.strip()
+        except (TypeError, ValueError, AttributeError):
+            return None
+
+        mapping = pd.Series(df["business_use"].astype(str).to_numpy(), index=keys.to_numpy())
+        return mapping[~mapping.index.duplicated(keep="first")]
+
+    def lookup(self, voucher_no: str, doc_no: str) -> Optional[str]:
+        """
+        Lookup the voucher type for a single (voucher_no, doc_no) pair.
+
+        Args:
+            voucher_no: The voucher number from NAV ([Voucher No_])
+            doc_no: The document number from NAV (Document No)
+
+        Returns:
+            The voucher type (business_use) if found, None otherwise
+        """
+        if voucher_no:
+            key = str(voucher_no).strip()
+            for mapping in (self._ipe_08_by_id, self._usage_by_id):
+                if mapping is not None and key in mapping.index:
+                    return mapping[key]
+
+        if doc_no:
+            key = str(doc_no).strip()
+            for mapping in (self._usage_by_transaction_no, self._ipe_08_by_transaction_no):
+                if mapping is not None and key in mapping.index and mapping[key]:
+                    return mapping[key]
+
+        return None
+
+    def lookup_many(self, voucher_nos: pd.Series, doc_nos: pd.Series) -> pd.Series:
+        """
+        Resolve voucher types for aligned Series of voucher and document numbers.
+
+        Each lookup path is a single hash join (Series.map) over the whole batch;
+        later paths only fill rows left unresolved by earlier ones.
+
+        Args:
+            voucher_nos: NAV voucher numbers (NaN/empty means missing)
+            doc_nos: NAV document numbers, aligned with voucher_nos
+
+        Returns:
+            Object Series indexed like voucher_nos with the voucher type or None
+        """
+        voucher_keys = _normalize_keys(voucher_nos)
+        doc_keys = _normalize_keys(doc_nos)
+
+        result = np.full(len(voucher_keys), None, dtype=object)
+        resolved = np.zeros(len(voucher_keys), dtype=bool)
+        steps = [
+            (voucher_keys, self._ipe_08_by_id, False),
+            (voucher_keys, self._usage_by_id, False),
+            (doc_keys, self._usage_by_transaction_no, True),
+            (doc_keys, self._ipe_08_by_transaction_no, True),
+        ]
+        for keys, mapping, require_value in steps:
+            if mapping is None:
+                continue
+            open_rows = ~resolved & (keys.to_numpy() != "")
+            if not open_rows.any():
+                continue
+            found = keys[open_rows].map(mapping).to_numpy(dtype=object)
+            hit = pd.notna(found)
+            if require_value:
+                # Transaction_No fallbacks only count non-empty voucher types
+                hit &= found != ""
+            rows = np.flatnonzero(open_rows)[hit]
+            result[rows] = found[hit]
+            resolved[rows] = True
+
+        return pd.Series(result, index=voucher_nos.index, dtype=object)
+
+
+def unclassified_rows(df: pd.DataFrame, row_mask: Optional[pd.Series] = None) -> pd.DataFrame:
+    """
+    Rows a per-row classifier still has to look at.
+
+    Args:
+        df: DataFrame with a bridge_category column.
+        row_mask: Optional boolean Series restricting which rows are classified.
+                  Defaults to all rows.
+
+    Returns:
+        The rows of df with no bridge_category yet and selected by row_mask.
+    """
+    open_mask = df["bridge_category"].isna().to_numpy()
+    if row_mask is not None:
+        open_mask &= row_mask.to_numpy(dtype=bool)
+    return df.loc[open_mask]
+
+
+def _normalize_keys(values: pd.Series) -> pd.Series:
+    """Normalize lookup keys to stripped strings, with NaN/None as empty string."""
+    values = values.astype(object)
+    notna = values.notna()
+    keys = pd.Series("", index=values.index, dtype=object)
+    keys[notna] = values[notna].map(str).str.strip()
+    return keys
+
+
+def to_categorical(values: pd.Series, categories: List[str]) -> pd.Series:
+    """
+    Convert a label column to a pandas Categorical with a fixed vocabulary.
+
+    Labels outside the vocabulary (e.g. business_use values looked up from
+    the TV files) are appended as extra categories in sorted order, so no
+    value is lost. Missing values stay missing.
+
+    Args:
+        values: Label Series (object or categorical)
+        categories: Fixed vocabulary, in category order
+
+    Returns:
+        Series with an unordered CategoricalDtype, indexed like values
+    """
+    observed = pd.unique(values.dropna().astype(object))
+    known = set(categories)
+    extra = sorted({str(v) for v in observed if v not in known})
+    dtype = pd.CategoricalDtype(list(categories) + extra)
+    if extra and any(not isinstance(v, str) for v in observed):
+        values = values.where(values.isna(), values.astype(str))
+    return values.astype(object).astype(dtype)
+
+
+def _canonical_voucher_type(voucher_type) -> Tuple[str, bool]:
+    """Canonical label of one raw voucher_type and whether the label was recognized."""
+    if pd.isna(voucher_type) or not voucher_type or str(voucher_type).strip() == "":
+        return "Unknown", True
+    canonical = _VOUCHER_TYPE_ALIASES.get(str(voucher_type).lower().strip())
+    if canonical is None:
+        # Unknown voucher types should be mapped to "other"
+        return "other", False
+    return canonical, True
+
+
 def harmonize_voucher_type(voucher_type: str) -> str:
     """
     Harmonize voucher_type labels to canonical enum.
     
     Maps various voucher type labels to canonical standardized values.
-    Handles None/NaN values by returning "Unknown".
+    Handles None/NaN values by returning "Unknown". Use harmonize_voucher_types
+    for whole columns.
     
     Args:
         voucher_type: Raw voucher type label from source data
@@ -161,35 +384,74 @@ def harmonize_voucher_type(voucher_type: str) -> str:
         >>> harmonize_voucher_type("")
         'Unknown'
     """
-    import logging
-    logger = logging.getLogger(__name__)
+    canonical, recognized = _canonical_voucher_type(voucher_type)
+    if not recognized:
+        logger.debug(f"Unknown voucher_type '{voucher_type}' mapped to 'other'")
+    return canonical
+
+
+def harmonize_voucher_types(voucher_types: pd.Series) -> pd.Series:
+    """
+    Harmonize a voucher_type column to the canonical enum.
     
-    if pd.isna(voucher_type) or not voucher_type or str(voucher_type).strip() == "":
-        return "Unknown"
+    Each distinct label is normalized once through the alias table and the
+    result is broadcast back to the rows through their codes (the category
+    codes of a categorical column, or factorized codes otherwise). Labels
+    mapped to "other" are reported in one aggregated debug message.
     
-    # Normalize: lowercase and strip
-    vt = str(voucher_type).lower().strip()
+    Args:
+        voucher_types: Raw voucher type labels (object or categorical)
+        
+    Returns:
+        Categorical Series with HARMONIZED_VOUCHER_TYPES categories, indexed
+        like voucher_types; missing values map to "Unknown"
     
-    # Canonical mapping
-    # Based on voucher classification system in cat_issuance_classifier.py
-    if vt in ["refund", "rf_", "rfn"]:
-        return "refund"
-    elif vt in ["store credit", "store_credit", "storecredit"]:
-        return "store_credit"
-    elif vt in ["apology", "commercial gesture", "cxp"]:
-        return "apology"
-    elif vt in ["jforce", "pyt_", "pyt_pf"]:
-        return "jforce"
-    elif vt in ["expired", "exp"]:
-        return "expired"
-    elif vt in ["vtc", "voucher to cash"]:
-        return "vtc"
-    elif vt in ["other", "unknown"]:
-        return "other"
+    Example:
+        >>> harmonize_voucher_types(pd.Series(["Refund", None, "CXP"])).tolist()
+        ['refund', 'Unknown', 'apology']
+    """
+    if isinstance(voucher_types.dtype, pd.CategoricalDtype):
+        codes = voucher_types.cat.codes.to_numpy()
+        labels = voucher_types.cat.categories
     else:
-        # Unknown voucher types should be mapped to "other"
-        logger.debug(f"Unknown voucher_type '{voucher_type}' mapped to 'other'")
-        return "other"
+        codes, labels = pd.factorize(voucher_types, use_na_sentinel=True)
+
+    positions = np.empty(len(labels) + 1, dtype=np.int8)
+    unknown_labels = []
+    for i, label in enumerate(labels):
+        canonical, recognized = _canonical_voucher_type(label)
+        positions[i] = _HARMONIZED_POSITIONS[canonical]
+        if not recognized:
+            unknown_labels.append(i)
+    # Code -1 (missing value) indexes the trailing "Unknown" entry
+    positions[-1] = _HARMONIZED_POSITIONS["Unknown"]
+
+    if unknown_labels and logger.isEnabledFor(logging.DEBUG):
+        counts = np.bincount(codes[codes >= 0], minlength=len(labels))
+        unknown_counts = {str(labels[i]): int(counts[i]) for i in unknown_labels if counts[i]}
+        if unknown_counts:
+            logger.debug(
+                f"Mapped {sum(unknown_counts.values())} rows with {len(unknown_counts)} "
+                f"unknown voucher_type labels to 'other': {unknown_counts}"
+            )
+
+    return pd.Series(
+        pd.Categorical.from_codes(positions[codes], dtype=_HARMONIZED_DTYPE),
+        index=voucher_types.index,
+        name=voucher_types.name,
+    )
 
 
-__all__ = ["COUNTRY_CODES", "lookup_voucher_type", "harmonize_voucher_type"]
+__all__ = [
+    "COUNTRY_CODES",
+    "TRANSACTION_NO_COLUMNS",
+    "BRIDGE_CATEGORIES",
+    "VOUCHER_TYPES",
+    "INTEGRATION_TYPES",
+    "HARMONIZED_VOUCHER_TYPES",
+    "to_categorical",
+    "harmonize_voucher_types",
+    "VoucherTypeIndex",
+    "lookup_voucher_type",
+    "harmonize_voucher_type",
+]
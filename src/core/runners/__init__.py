@@ -9,6 +9,12 @@ from src.core.runners.mssql_runner import (
     IPEValidationError,
     IPEConnectionError,
 )
+from src.core.runners.connection_pool import (
+    ConnectionPool,
+    get_connection_pool,
+    connection_pool_name,
+    close_all_pools,
+)
 
 # Aliases for clarity
 IPERunnerMSSQL = IPERunner
@@ -18,4 +24,8 @@ __all__ = [
     'IPERunner',
     'IPEValidationError',
     'IPEConnectionError',
+    'ConnectionPool',
+    'get_connection_pool',
+    'connection_pool_name',
+    'close_all_pools',
 ]
@@ -0,0 +1,270 @@
+"""
+Connection Pool Module
+
+Thread-safe pool of reusable database connections shared by IPERunner
+instances and the extraction pipeline.
+
+Opening a pyodbc connection through the Teleport tunnel is a large share of
+the runtime of small IPEs, so connections are kept open between runs and
+handed out again after a health check. The pool is bounded (max_size
+connections in use or idle) and evicts connections idle for longer than
+idle_timeout.
+
+The pool does not know how to connect: callers pass a connect callable to
+acquire(), typically the retry-decorated IPERunner._get_database_connection,
+which is only invoked when no healthy idle connection is available.
+
+Pools are registered per credential set (see connection_pool_name), so a
+runner never receives a connection opened with another secret or connection
+string.
+
+Example:
+    >>> pool = get_connection_pool(connection_pool_name(secret_name="prod-nav"))
+    >>> with pool.connection(runner._get_database_connection) as conn:
+    ...     df = pd.read_sql(query, conn)
+"""
+
+import atexit
+import hashlib
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "ConnectionPool",
+    "get_connection_pool",
+    "connection_pool_name",
+    "close_all_pools",
+]
+
+
+class ConnectionPool:
+    """
+    Bounded pool of reusable DB-API connections.
+
+    Args:
+        max_size: Maximum number of connections open at once (idle + in use)
+        idle_timeout: Seconds after which an idle connection is closed
+        health_check_query: Query run before reusing an idle connection
+        health_check_interval: Connections released less than this many seconds
+            ago are reused without a health check (0 = always check)
+        acquire_timeout: Seconds to wait for a free slot before raising TimeoutError
+    """
+
+    def __init__(self, max_size: int = 8, idle_timeout: float = 300.0,
+                 health_check_query: str = "SELECT 1", health_check_interval: float = 0.0,
+                 acquire_timeout: float = 120.0):
+        if max_size < 1:
+            raise ValueError(f"Invalid max_size: {max_size} (must be >= 1)")
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.health_check_query = health_check_query
+        self.health_check_interval = health_check_interval
+        self.acquire_timeout = acquire_timeout
+
+        self._condition = threading.Condition()
+        self._idle: List[Tuple[Any, float]] = []   # (connection, released_at), most recent last
+        self._in_use = 0
+        self._closed = False
+        self.stats: Dict[str, int] = {"created": 0, "reused": 0, "evicted": 0, "discarded": 0}
+
+    @property
+    def size(self) -> int:
+        """Number of open connections (idle + in use)."""
+        with self._condition:
+            return self._in_use + len(self._idle)
+
+    def acquire(self, connect: Callable[[], Any]) -> Any:
+        """
+        Get a healthy connection, reusing an idle one when possible.
+
+        Args:
+            connect: Callable opening a new connection when none can be reused
+
+        Returns:
+            Open connection; hand it back with release()
+
+        Raises:
+            TimeoutError: If no slot frees up within acquire_timeout
+        """
+        deadline = time.monotonic() + self.acquire_timeout
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise RuntimeError("Connection pool is closed")
+                self._evict_idle_locked()
+                if self._idle:
+                    candidate, released_at = self._idle.pop()
+                    self._in_use += 1
+                    break
+                if self._in_use < self.max_size:
+                    candidate, released_at = None, None
+                    self._in_use += 1
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(
+                        f"No database connection available after {self.acquire_timeout:.0f}s "
+                        f"(max_size={self.max_size})"
+                    )
+                self._condition.wait(remaining)
+
+        # Health checks and connects run outside the lock: both are network calls
+        if candidate is not None:
+            recently_used = time.monotonic() - released_at < self.health_check_interval
+            if recently_used or self._is_healthy(candidate):
+                self._count("reused")
+                return candidate
+            logger.warning("Discarding pooled connection that failed its health check")
+            self._close_quietly(candidate)
+            self._count("discarded")
+
+        try:
+            connection = connect()
+        except Exception:
+            with self._condition:
+                self._in_use -= 1
+                self._condition.notify()
+            raise
+        self._count("created")
+        return connection
+
+    def release(self, connection: Any, discard: bool = False) -> None:
+        """
+        Return a connection to the pool.
+
+        Args:
+            connection: Connection obtained from acquire()
+            discard: Close the connection instead of keeping it (e.g. after a
+                network error)
+        """
+        if connection is None:
+            return
+        with self._condition:
+            self._in_use = max(self._in_use - 1, 0)
+            keep = not discard and not self._closed
+            if keep:
+                self._idle.append((connection, time.monotonic()))
+            self._condition.notify()
+        if not keep:
+            self._close_quietly(connection)
+            self._count("discarded")
+
+    @contextmanager
+    def connection(self, connect: Callable[[], Any]) -> Iterator[Any]:
+        """Context manager acquiring a connection; discards it if the block raises."""
+        conn = self.acquire(connect)
+        try:
+            yield conn
+        except Exception:
+            self.release(conn, discard=True)
+            raise
+        self.release(conn)
+
+    def close(self) -> None:
+        """Close idle connections and refuse new acquisitions."""
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._condition.notify_all()
+        for connection, _ in idle:
+            self._close_quietly(connection)
+
+    def _evict_idle_locked(self) -> None:
+        """Close connections idle for longer than idle_timeout (lock held)."""
+        now = time.monotonic()
+        expired = [conn for conn, released_at in self._idle if now - released_at > self.idle_timeout]
+        if not expired:
+            return
+        self._idle = [(conn, released_at) for conn, released_at in self._idle
+                      if now - released_at <= self.idle_timeout]
+        for connection in expired:
+            self._close_quietly(connection)
+        self.stats["evicted"] += len(expired)
+        logger.info(f"Evicted {len(expired)} idle pooled connection(s)")
+
+    def _is_healthy(self, connection: Any) -> bool:
+        try:
+            cursor = connection.cursor()
+            try:
+                cursor.execute(self.health_check_query)
+                cursor.fetchall()
+            finally:
+                cursor.close()
+            return True
+        except Exception as e:
+            logger.debug(f"Pooled connection health check failed: {e}")
+            return False
+
+    def _count(self, stat: str) -> None:
+        with self._condition:
+            self.stats[stat] += 1
+
+    @staticmethod
+    def _close_quietly(connection: Any) -> None:
+        try:
+            connection.close()
+        except Exception as e:
+            logger.debug(f"Error closing pooled connection: {e}")
+
+
+_pools: Dict[str, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_connection_pool(name: str = "default", **pool_kwargs) -> ConnectionPool:
+    """
+    Get (or create) the process-wide pool registered under a name.
+
+    Args:
+        name: Pool name, one per database/credential set
+        **pool_kwargs: ConnectionPool options, used only when the pool is created
+
+    Returns:
+        Shared ConnectionPool instance
+    """
+    with _pools_lock:
+        pool = _pools.get(name)
+        if pool is None or pool._closed:
+            pool = ConnectionPool(**pool_kwargs)
+            _pools[name] = pool
+        return pool
+
+
+def connection_pool_name(secret_name: Optional[str] = None,
+                         connection_string: Optional[str] = None) -> str:
+    """
+    Registry name identifying the credentials a connection is opened with.
+
+    Mirrors IPERunner._get_database_connection: an explicit connection string
+    (DB_CONNECTION_STRING) takes precedence over the Secrets Manager secret.
+    The connection string is identified by its SHA-256 so it never appears
+    in pool names or logs.
+
+    Args:
+        secret_name: Secrets Manager secret holding the connection string
+        connection_string: Connection string used instead of the secret
+
+    Returns:
+        Name to pass to get_connection_pool()
+    """
+    if connection_string:
+        digest = hashlib.sha256(connection_string.encode("utf-8")).hexdigest()
+        return f"connection-string:{digest[:16]}"
+    return f"secret:{secret_name}"
+
+
+def close_all_pools() -> None:
+    """Close every registered pool (called automatically at interpreter exit)."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
+
+
+atexit.register(close_all_pools)
@@ -9,18 +9,29 @@ import logging
 import os
 import pandas as pd
 import pyodbc
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, Tuple, Callable
+from pathlib import Path
+from typing import Dict, Any, Iterator, Optional, Tuple, Callable
 from functools import wraps
 from src.utils.aws_utils import AWSSecretsManager
 from src.core.evidence.manager import DigitalEvidenceManager, IPEEvidenceGenerator
+from src.core.evidence.streaming import ChunkedDatasetWriter, StreamedDataset
+from src.core.runners.connection_pool import ConnectionPool
 from src.utils.date_utils import validate_yyyy_mm_dd
-from src.core.schema import apply_schema_contract, ValidationPresets
+from src.core.schema import apply_schema_contract, SchemaReport, ValidationPresets
 
 # Logging configuration
 logger = logging.getLogger(__name__)
 
+# Rows per fetchmany() call when streaming without an explicit chunk_size
+DEFAULT_CHUNK_SIZE = 50_000
+
+# SOX validations in the order their results are recorded and failures reported
+SOX_VALIDATIONS = ('completeness', 'accuracy_positive', 'accuracy_negative')
+
 
 def _sanitize_input(value: str, max_length: int = 255, allow_chars: str = None) -> str:
     """
@@ -71,7 +82,8 @@ class IPEConnectionError(Exception):
     pass
 
 
-def retry_on_network_error(max_retries: int = 3, backoff_factor: float = 2.0, initial_delay: float = 1.0):
+def retry_on_network_error(max_retries: int = 3, backoff_factor: float = 2.0, initial_delay: float = 1.0,
+                           on_retry: Optional[Callable[..., None]] = None):
     """
     Decorator to retry database operations on transient network errors.
     
@@ -79,6 +91,8 @@ def retry_on_network_error(max_retries: int = 3, backoff_factor: float = 2.0, in
         max_retries: Maximum number of retry attempts (default: 3)
         backoff_factor: Multiplier for exponential backoff (default: 2.0)
         initial_delay: Initial delay in seconds before first retry (default: 1.0)
+        on_retry: Optional hook called as on_retry(error, *args, **kwargs) before
+                  each retry, e.g. to replace a broken (pooled) connection
     
     Returns:
         Decorated function with retry logic
@@ -120,6 +134,9 @@ def retry_on_network_error(max_retries: int = 3, backoff_factor: float = 2.0, in
                     time.sleep(delay)
                     delay *= backoff_factor
                     
+                    if on_retry is not None:
+                        on_retry(e, *args, **kwargs)
+                    
                 except Exception as e:
                     # Non-database errors - raise immediately without retry
                     logger.error(f"Non-retriable error in database operation: {e}")
@@ -133,6 +150,11 @@ def retry_on_network_error(max_retries: int = 3, backoff_factor: float = 2.0, in
     return decorator
 
 
+def _reset_runner_connection(error: Exception, runner: 'IPERunner', *args, **kwargs) -> None:
+    """Retry hook: replace the runner's connection before re-running a query."""
+    runner._reset_connection(error)
+
+
 class IPERunner:
     """
     Class responsible for executing a single IPE.
@@ -142,7 +164,10 @@ class IPERunner:
     def __init__(self, ipe_config: Dict[str, Any], secret_manager: AWSSecretsManager,
                  cutoff_date: Optional[str] = None, evidence_manager: Optional[DigitalEvidenceManager] = None,
                  country: Optional[str] = None, period: Optional[str] = None, 
-                 full_params: Optional[Dict[str, Any]] = None):
+                 full_params: Optional[Dict[str, Any]] = None,
+                 chunk_size: Optional[int] = None,
+                 connection_pool: Optional[ConnectionPool] = None,
+                 parallel_validations: bool = True):
         """
         Initialize the runner for a specific IPE.
         
@@ -154,6 +179,17 @@ class IPERunner:
             country: Country code (e.g., 'NG', 'KE') for evidence naming
             period: Period in YYYYMM format (e.g., '202509') for evidence naming
             full_params: Full dictionary of all SQL parameters to be logged
+            chunk_size: Rows fetched per chunk (falls back to
+                ipe_config['chunk_size']). When set, run() fetches, casts and
+                hashes the main query chunk by chunk through run_streaming(),
+                but still returns the complete DataFrame; only callers of
+                run_streaming() consume the data without materializing it
+            connection_pool: Optional shared ConnectionPool. Connections are then
+                borrowed from the pool and returned to it after the run instead of
+                being opened and closed by every runner
+            parallel_validations: With a connection pool, run the three SOX
+                validation queries concurrently on separate pooled connections,
+                overlapped with evidence generation (default: True)
         """
         self.config = ipe_config
         self.secret_manager = secret_manager
@@ -174,9 +210,19 @@ class IPERunner:
             self.cutoff_date = first_day_of_month.strftime('%Y-%m-%d')
         
         self.connection = None
+        self.connection_pool = connection_pool
+        self.parallel_validations = parallel_validations
+        # Per-thread connection override used by parallel validation workers
+        self._thread_state = threading.local()
         self.extracted_data = None
+        self.streamed_dataset = None
         self.validation_results = {}
         
+        chunk_size = chunk_size or ipe_config.get('chunk_size')
+        if chunk_size is not None and int(chunk_size) <= 0:
+            raise ValueError(f"Invalid chunk_size: {chunk_size} (must be > 0)")
+        self.chunk_size = int(chunk_size) if chunk_size else None
+        
         # SOX evidence manager
         self.evidence_manager = evidence_manager or DigitalEvidenceManager()
         self.evidence_generator = None
@@ -241,7 +287,55 @@ class IPERunner:
             logger.error(error_msg)
             raise IPEConnectionError(error_msg)
     
-    @retry_on_network_error(max_retries=3, backoff_factor=2.0, initial_delay=1.0)
+    def _acquire_connection(self) -> pyodbc.Connection:
+        """
+        Get a database connection, from the pool when one is configured.
+        
+        Returns:
+            pyodbc connection to the database
+            
+        Raises:
+            IPEConnectionError: If no connection can be established
+        """
+        if self.connection_pool is None:
+            return self._get_database_connection()
+        try:
+            connection = self.connection_pool.acquire(self._get_database_connection)
+        except TimeoutError as e:
+            raise IPEConnectionError(f"[{self.ipe_id}] {e}")
+        logger.info(f"[{self.ipe_id}] Database connection acquired from pool")
+        return connection
+    
+    def _query_connection(self) -> pyodbc.Connection:
+        """Connection for the current thread: a validation worker's own, else the runner's."""
+        return getattr(self._thread_state, 'connection', None) or self.connection
+    
+    def _reset_connection(self, error: Exception) -> None:
+        """
+        Replace the current connection after a transient network error.
+        
+        A pooled connection is discarded rather than returned, so the pool never
+        hands the broken connection to another runner.
+        """
+        logger.warning(f"[{self.ipe_id}] Replacing database connection after error: {error}")
+        worker_connection = getattr(self._thread_state, 'connection', None)
+        if worker_connection is not None:
+            self.connection_pool.release(worker_connection, discard=True)
+            self._thread_state.connection = None
+            self._thread_state.connection = self._acquire_connection()
+            return
+        if self.connection_pool is not None:
+            self.connection_pool.release(self.connection, discard=True)
+        elif self.connection is not None:
+            try:
+                self.connection.close()
+            except Exception:
+                pass
+        self.connection = None
+        self.connection = self._acquire_connection()
+    
+    @retry_on_network_error(max_retries=3, backoff_factor=2.0, initial_delay=1.0,
+                            on_retry=_reset_runner_connection)
     def _execute_query_with_parameters(self, query: str, parameters: Optional[Tuple] = None) -> pd.DataFrame:
         """
         Execute SQL query with secure parameterized values.
@@ -261,7 +355,7 @@ class IPERunner:
                 parameters = tuple([self.cutoff_date] * placeholder_count)
             
             logger.debug(f"[{self.ipe_id}] Executing query with parameters: {parameters}")
-            df = pd.read_sql(query, self.connection, params=parameters)
+            df = pd.read_sql(query, self._query_connection(), params=parameters)
             logger.info(f"[{self.ipe_id}] Query executed: {len(df)} rows returned")
             return df
             
@@ -269,12 +363,71 @@ class IPERunner:
             logger.error(f"[{self.ipe_id}] Error executing query: {e}")
             raise
     
+    @retry_on_network_error(max_retries=3, backoff_factor=2.0, initial_delay=1.0,
+                            on_retry=_reset_runner_connection)
+    def _open_query_cursor(self, query: str, parameters: Tuple) -> Any:
+        """
+        Execute a query on a new cursor without fetching its rows.
+        Automatically retries on transient network errors with exponential backoff.
+        
+        Args:
+            query: SQL query to execute
+            parameters: Parameters to inject into the query
+            
+        Returns:
+            pyodbc cursor positioned before the first row
+        """
+        cursor = self.connection.cursor()
+        try:
+            logger.debug(f"[{self.ipe_id}] Executing streamed query with parameters: {parameters}")
+            cursor.execute(query, parameters)
+            return cursor
+        except Exception as e:
+            cursor.close()
+            logger.error(f"[{self.ipe_id}] Error executing query: {e}")
+            raise
+    
+    def _iter_query_chunks(self, query: str, parameters: Tuple,
+                           chunk_size: int) -> Iterator[pd.DataFrame]:
+        """
+        Stream query results as DataFrames of at most chunk_size rows.
+        
+        Uses cursor.fetchmany so only one chunk of rows is held in memory.
+        Decimal values are converted to float like pd.read_sql does, so both
+        extraction paths return the same dtypes. An empty result set yields a
+        single empty DataFrame with the query columns.
+        
+        Args:
+            query: SQL query to execute
+            parameters: Parameters to inject into the query
+            chunk_size: Maximum number of rows per chunk
+            
+        Yields:
+            DataFrame chunks in result-set order
+        """
+        cursor = self._open_query_cursor(query, parameters)
+        try:
+            columns = [column[0] for column in cursor.description or []]
+            chunk_count = 0
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                chunk_count += 1
+                yield pd.DataFrame.from_records(
+                    [tuple(row) for row in rows], columns=columns, coerce_float=True
+                )
+            if chunk_count == 0:
+                yield pd.DataFrame(columns=columns)
+        finally:
+            cursor.close()
+    
     def _validate_completeness(self, main_dataframe: pd.DataFrame) -> bool:
         """
         Completeness validation: verifies that all expected data is present.
         
         Args:
-            main_dataframe: The main DataFrame to validate
+            main_dataframe: The main DataFrame (or StreamedDataset) to validate
             
         Returns:
             True if validation succeeds, False otherwise
@@ -412,9 +565,101 @@ class IPERunner:
             logger.error(error_msg)
             raise IPEValidationError(error_msg)
     
+    def _run_sox_validations(self, main_data: Any,
+                             overlap: Optional[Callable[[], Any]] = None) -> Any:
+        """
+        Run the completeness and accuracy validations, overlapped with other work.
+        
+        With a connection pool and parallel_validations enabled, the configured
+        validation queries run concurrently, each on its own pooled connection,
+        while overlap() (evidence generation) runs on the calling thread. The
+        runner's main connection is returned to the pool first, so a worker
+        never waits on a connection held by this runner. Otherwise overlap()
+        runs first and the validations follow one after another.
+        
+        Results are recorded in validation_results in SOX_VALIDATIONS order and,
+        when several validations fail, the first failure in that order is raised.
+        
+        Args:
+            main_data: Extracted DataFrame (or StreamedDataset) for completeness
+            overlap: Optional callable run alongside the validations
+            
+        Returns:
+            Result of overlap(), or None
+            
+        Raises:
+            IPEValidationError: If a validation fails
+        """
+        validators = {
+            'completeness': lambda: self._validate_completeness(main_data),
+            'accuracy_positive': self._validate_accuracy_positive,
+            'accuracy_negative': self._validate_accuracy_negative,
+        }
+        configured = [
+            name for name in SOX_VALIDATIONS
+            if f"{name}_query" in self.config.get('validation', {})
+        ]
+        
+        if not (self.parallel_validations and self.connection_pool is not None and len(configured) > 1):
+            overlap_result = overlap() if overlap else None
+            logger.info(f"[{self.ipe_id}] Starting SOX validations...")
+            for name in SOX_VALIDATIONS:
+                validators[name]()
+            return overlap_result
+        
+        logger.info(f"[{self.ipe_id}] Starting {len(configured)} SOX validations in parallel...")
+        self._cleanup_connection()
+        errors: Dict[str, BaseException] = {}
+        with ThreadPoolExecutor(max_workers=len(configured),
+                                thread_name_prefix=f"sox-validation-{self.ipe_id}") as executor:
+            futures = {
+                name: executor.submit(self._run_on_pooled_connection, validators[name])
+                for name in configured
+            }
+            try:
+                overlap_result = overlap() if overlap else None
+            finally:
+                for name, future in futures.items():
+                    try:
+                        future.result()
+                    except BaseException as e:
+                        errors[name] = e
+        
+        # Validations without a query only log a warning; no connection needed
+        for name in SOX_VALIDATIONS:
+            if name not in futures:
+                validators[name]()
+        
+        ordered = {name: self.validation_results[name]
+                   for name in SOX_VALIDATIONS if name in self.validation_results}
+        for key, value in list(self.validation_results.items()):
+            ordered.setdefault(key, value)
+        self.validation_results = ordered
+        
+        for name in SOX_VALIDATIONS:
+            if name in errors:
+                other_failures = [other for other in errors if other != name]
+                if other_failures:
+                    logger.error(f"[{self.ipe_id}] Additional validation failures: {other_failures}")
+                raise errors[name]
+        return overlap_result
+    
+    def _run_on_pooled_connection(self, validation: Callable[[], bool]) -> bool:
+        """Run a validation on the current thread with its own pooled connection."""
+        self._thread_state.connection = self._acquire_connection()
+        try:
+            return validation()
+        finally:
+            self.connection_pool.release(self._thread_state.connection)
+            self._thread_state.connection = None
+    
     def _cleanup_connection(self):
-        """Cleanly closes the database connection."""
-        if self.connection:
+        """Cleanly closes the database connection (or returns it to the pool)."""
+        if self.connection and self.connection_pool is not None:
+            self.connection_pool.release(self.connection)
+            self.connection = None
+            logger.info(f"[{self.ipe_id}] Connection returned to pool")
+        elif self.connection:
             try:
                 self.connection.close()
                 logger.info(f"[{self.ipe_id}] Connection closed")
@@ -425,6 +670,11 @@ class IPERunner:
         """
         Execute complete IPE: extraction, validation and SOX evidence generation.
         
+        With chunk_size set, the extraction goes through run_streaming(), which
+        bounds the memory used while fetching, casting and hashing. The spooled
+        chunks are then concatenated into the returned DataFrame and the spool
+        is deleted, so the result itself is held in memory as usual.
+        
         Returns:
             DataFrame containing extracted and validated data
             
@@ -432,6 +682,11 @@ class IPERunner:
             IPEValidationError: If validation fails
             IPEConnectionError: If connection problem occurs
         """
+        if self.chunk_size:
+            with self.run_streaming() as dataset:
+                self.extracted_data = dataset.to_dataframe()
+            return self.extracted_data
+        
         try:
             logger.info(f"[{self.ipe_id}] ==> STARTING IPE EXECUTION")
             
@@ -453,7 +708,7 @@ class IPERunner:
             self.evidence_generator = IPEEvidenceGenerator(evidence_dir, self.ipe_id)
             
             # 2. Establish connection
-            self.connection = self._get_database_connection()
+            self.connection = self._acquire_connection()
             
             # 3. Extract main data
             logger.info(f"[{self.ipe_id}] Extracting main data...")
@@ -470,17 +725,7 @@ class IPERunner:
             }
             
             # Add any additional parameters passed to the runner (sanitize for logging)
-            if self.full_params:
-                sanitized_params = {}
-                for key, value in self.full_params.items():
-                    # Sanitize keys and values for safe logging
-                    safe_key = _sanitize_input(str(key), max_length=100)
-                    if isinstance(value, str):
-                        safe_value = _sanitize_input(value, max_length=500)
-                    else:
-                        safe_value = value  # Numbers, dates, etc. are safe
-                    sanitized_params[safe_key] = safe_value
-                full_params_dict.update(sanitized_params)
+            full_params_dict.update(self._sanitized_full_params())
             
             # Save exact query with ALL parameters BEFORE execution
             self.evidence_generator.save_executed_query(
@@ -518,25 +763,23 @@ class IPERunner:
             self.extracted_data['_extraction_date'] = datetime.now().isoformat()
             self.extracted_data['_cutoff_date'] = self.cutoff_date
             
-            # 4. Generate evidence proofs immediately
-            logger.info(f"[{self.ipe_id}] Generating evidence proofs...")
-            self.evidence_generator.save_data_snapshot(self.extracted_data)
-            integrity_hash = self.evidence_generator.generate_integrity_hash(self.extracted_data)
-            
-            # 4.5. Save schema validation evidence (NEW!)
-            if self.schema_report:
-                self.evidence_generator.save_schema_validation(self.schema_report)
-                self.evidence_generator.save_transformation_log(self.schema_report)
-            
-            logger.info(f"[{self.ipe_id}] Data extracted: {len(self.extracted_data)} rows, "
-                       f"Hash: {integrity_hash[:16]}...")
+            # 4. Generate evidence proofs (overlapped with the SOX validations)
+            def generate_evidence() -> str:
+                logger.info(f"[{self.ipe_id}] Generating evidence proofs...")
+                self.evidence_generator.save_data_snapshot(self.extracted_data)
+                integrity_hash = self.evidence_generator.generate_integrity_hash(self.extracted_data)
+                
+                # 4.5. Save schema validation evidence (NEW!)
+                if self.schema_report:
+                    self.evidence_generator.save_schema_validation(self.schema_report)
+                    self.evidence_generator.save_transformation_log(self.schema_report)
+                
+                logger.info(f"[{self.ipe_id}] Data extracted: {len(self.extracted_data)} rows, "
+                           f"Hash: {integrity_hash[:16]}...")
+                return integrity_hash
             
             # 5. Execute SOX validations
-            logger.info(f"[{self.ipe_id}] Starting SOX validations...")
-            
-            self._validate_completeness(self.extracted_data)
-            self._validate_accuracy_positive()
-            self._validate_accuracy_negative()
+            integrity_hash = self._run_sox_validations(self.extracted_data, overlap=generate_evidence)
             
             # 6. Save validation results
             self.validation_results['overall_status'] = 'SUCCESS'
@@ -573,6 +816,161 @@ class IPERunner:
             self._cleanup_connection()
 
 
+    def run_streaming(self, chunk_size: Optional[int] = None) -> StreamedDataset:
+        """
+        Execute the IPE with bounded memory by streaming the main query in chunks.
+        
+        Each chunk is fetched with cursor.fetchmany, cast through the schema
+        contract, tagged with traceability columns and spooled to Parquet part
+        files next to the evidence package. The integrity hash and data snapshot
+        are built incrementally, so peak memory stays proportional to chunk_size.
+        
+        Args:
+            chunk_size: Rows fetched per chunk (default: self.chunk_size or 50,000)
+        
+        Returns:
+            StreamedDataset handle; call to_dataframe() to materialize the data
+            and cleanup() (or use it as a context manager) to delete the spool
+            
+        Raises:
+            IPEValidationError: If validation fails
+            IPEConnectionError: If connection problem occurs
+        """
+        chunk_size = chunk_size or self.chunk_size or DEFAULT_CHUNK_SIZE
+        writer = None
+        succeeded = False
+        try:
+            logger.info(f"[{self.ipe_id}] ==> STARTING STREAMED IPE EXECUTION (chunk_size={chunk_size})")
+            
+            execution_metadata = {
+                'ipe_id': self.ipe_id,
+                'description': self.description,
+                'cutoff_date': self.cutoff_date,
+                'execution_start': datetime.now().isoformat(),
+                'secret_name': self.config['secret_name'],
+                'sox_compliance_required': True,
+                'country': self.country,
+                'period': self.period,
+                'extraction_mode': 'streamed',
+                'chunk_size': chunk_size
+            }
+            
+            evidence_dir = self.evidence_manager.create_evidence_package(
+                self.ipe_id, execution_metadata, country=self.country, period=self.period
+            )
+            self.evidence_generator = IPEEvidenceGenerator(evidence_dir, self.ipe_id)
+            
+            self.connection = self._acquire_connection()
+            
+            logger.info(f"[{self.ipe_id}] Streaming main data...")
+            main_query = self.config['main_query']
+            parameters = [self.cutoff_date] * main_query.count('?')
+            full_params_dict = {
+                'cutoff_date': self.cutoff_date,
+                'parameters': parameters,
+                'chunk_size': chunk_size,
+            }
+            full_params_dict.update(self._sanitized_full_params())
+            self.evidence_generator.save_executed_query(main_query, full_params_dict)
+            
+            # Spool outside the evidence directory so the ZIP stays small
+            data_dir = Path(evidence_dir).parent / f"{Path(evidence_dir).name}_data"
+            writer = ChunkedDatasetWriter(data_dir)
+            extraction_date = datetime.now().isoformat()
+            apply_contract = True
+            self.schema_report = None
+            
+            for chunk in self._iter_query_chunks(main_query, tuple(parameters), chunk_size):
+                if apply_contract:
+                    try:
+                        chunk, chunk_report = apply_schema_contract(
+                            df=chunk,
+                            dataset_id=self.ipe_id,
+                            strict=False,
+                            cast=True,
+                            track=True,
+                            drop_unknown=False
+                        )
+                        self.schema_report = _merge_schema_reports(self.schema_report, chunk_report)
+                    except ValueError as e:
+                        logger.warning(f"[{self.ipe_id}] Schema validation skipped: {e}")
+                        apply_contract = False
+                
+                chunk['_ipe_id'] = self.ipe_id
+                chunk['_extraction_date'] = extraction_date
+                chunk['_cutoff_date'] = self.cutoff_date
+                writer.write(chunk)
+            
+            self.streamed_dataset = writer.close()
+            integrity_hash = self.streamed_dataset.integrity_hash
+            
+            def generate_evidence() -> None:
+                logger.info(f"[{self.ipe_id}] Generating evidence proofs...")
+                self.evidence_generator.save_streamed_data_snapshot(writer)
+                self.evidence_generator.save_integrity_hash(
+                    integrity_hash,
+                    data_rows=writer.row_count,
+                    data_columns=len(writer.columns),
+                    algorithm=writer.hasher.algorithm,
+                    verification_instructions=writer.hasher.verification_instructions
+                )
+                
+                if self.schema_report:
+                    self.evidence_generator.save_schema_validation(self.schema_report)
+                    self.evidence_generator.save_transformation_log(self.schema_report)
+                
+                logger.info(f"[{self.ipe_id}] Data streamed: {writer.row_count} rows in "
+                           f"{len(writer.part_files)} chunks, Hash: {integrity_hash[:16]}...")
+            
+            self._run_sox_validations(self.streamed_dataset, overlap=generate_evidence)
+            
+            self.validation_results['overall_status'] = 'SUCCESS'
+            self.validation_results['execution_time'] = datetime.now().isoformat()
+            self.validation_results['data_integrity_hash'] = integrity_hash
+            self.evidence_generator.save_validation_results(self.validation_results)
+            
+            evidence_zip = self.evidence_generator.finalize_evidence_package()
+            
+            logger.info(f"[{self.ipe_id}] ==> STREAMED IPE EXECUTED SUCCESSFULLY - "
+                       f"{writer.row_count} rows validated")
+            logger.info(f"[{self.ipe_id}] SOX evidence package: {evidence_zip}")
+            
+            succeeded = True
+            return self.streamed_dataset
+            
+        except (IPEValidationError, IPEConnectionError):
+            self.validation_results['overall_status'] = 'FAILED'
+            if self.evidence_generator:
+                self.evidence_generator.save_validation_results(self.validation_results)
+                self.evidence_generator.finalize_evidence_package()
+            raise
+        except Exception as e:
+            self.validation_results['overall_status'] = 'ERROR'
+            error_msg = f"[{self.ipe_id}] Unexpected error during execution: {e}"
+            if self.evidence_generator:
+                self.evidence_generator.save_validation_results(self.validation_results)
+                self.evidence_generator.finalize_evidence_package()
+            logger.error(error_msg)
+            raise Exception(error_msg)
+        finally:
+            # A failed extraction must not leave its partial spool behind
+            if writer is not None and not succeeded:
+                writer.discard()
+                self.streamed_dataset = None
+            self._cleanup_connection()
+    
+    def _sanitized_full_params(self) -> Dict[str, Any]:
+        """Sanitize the additional runner parameters for safe evidence logging."""
+        sanitized_params = {}
+        for key, value in self.full_params.items():
+            safe_key = _sanitize_input(str(key), max_length=100)
+            if isinstance(value, str):
+                safe_value = _sanitize_input(value, max_length=500)
+            else:
+                safe_value = value  # Numbers, dates, etc. are safe
+            sanitized_params[safe_key] = safe_value
+        return sanitized_params
+
     def run_demo(self, demo_dataframe: pd.DataFrame, source_name: str) -> pd.DataFrame:
         """
         Demo execution path: uses a provided DataFrame instead of querying the DB
@@ -692,6 +1090,58 @@ class IPERunner:
             'ipe_id': self.ipe_id,
             'description': self.description,
             'cutoff_date': self.cutoff_date,
-            'extracted_rows': len(self.extracted_data) if self.extracted_data is not None else 0,
+            'extracted_rows': self._extracted_row_count(),
             'validation_results': self.validation_results
-        }
\ No newline at end of file
+        }
+    
+    def _extracted_row_count(self) -> int:
+        """Row count of the in-memory or streamed extraction."""
+        if self.extracted_data is not None:
+            return len(self.extracted_data)
+        if self.streamed_dataset is not None:
+            return len(self.streamed_dataset)
+        return 0
+
+
+def _merge_schema_reports(total: Optional[SchemaReport], chunk_report: SchemaReport) -> SchemaReport:
+    """
+    Fold the schema report of one chunk into the running report of a streamed run.
+    
+    Events with the same type, source, columns and rename are merged by summing
+    their row and coercion counters, so the final report describes the whole
+    dataset instead of repeating every transformation once per chunk.
+    """
+    if total is None:
+        return chunk_report
+    
+    total.success = total.success and chunk_report.success
+    total.row_count_before += chunk_report.row_count_before
+    total.row_count_after += chunk_report.row_count_after
+    for message in chunk_report.validation_errors:
+        if message not in total.validation_errors:
+            total.validation_errors.append(message)
+    for message in chunk_report.validation_warnings:
+        if message not in total.validation_warnings:
+            total.validation_warnings.append(message)
+    
+    def _event_key(event):
+        return (event.event_type, event.source, tuple(event.columns),
+                event.before_name, event.after_name)
+    
+    events_by_key = {_event_key(event): event for event in total.events}
+    for event in chunk_report.events:
+        existing = events_by_key.get(_event_key(event))
+        if existing is None:
+            total.add_event(event)
+            events_by_key[_event_key(event)] = event
+            continue
+        for attr in ('row_count_before', 'row_count_after', 'null_count_before', 'null_count_after'):
+            value = getattr(event, attr)
+            if value is not None:
+                setattr(existing, attr, (getattr(existing, attr) or 0) + value)
+        existing.invalid_coerced_to_nan += event.invalid_coerced_to_nan
+        existing.values_filled += event.values_filled
+        total.total_invalid_coerced += event.invalid_coerced_to_nan
+        total.total_values_filled += event.values_filled
+    
+    return total
@@ -24,6 +24,11 @@ from src.core.schema.contract_registry import (
     clear_cache,
 )
 
+from src.core.schema.contract_plan import (
+    ContractPlan,
+    get_contract_plan,
+)
+
 from src.core.schema.schema_utils import (
     apply_schema_contract,
     require_columns,
@@ -46,6 +51,9 @@ __all__ = [
     "list_available_contracts",
     "load_contract",
     "clear_cache",
+    # Compiled plans
+    "ContractPlan",
+    "get_contract_plan",
     # Utility functions
     "apply_schema_contract",
     "require_columns",
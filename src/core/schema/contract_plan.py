@@ -0,0 +1,205 @@
+"""
+Compiled Schema Contract Plans
+
+Resolving a contract against a DataFrame (alias matching, required-field
+checks, which fields to cast, which columns are unknown) only depends on the
+contract and the input column names, not on the data. A ContractPlan holds
+that resolution so apply_schema_contract can run the rename, cast and fill
+steps directly.
+
+Plans are cached by (dataset_id, version, contract_hash, input columns):
+repeated extractions of the same dataset, and every chunk of a streamed
+extraction, reuse one plan.
+
+Example:
+    >>> contract = get_active_contract("IPE_07")
+    >>> plan = get_contract_plan(contract, df.columns)
+    >>> plan.rename_map
+    {'Customer No_': 'customer_id', ...}
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Hashable, Iterable, List, Tuple
+
+from src.core.schema.models import SchemaContract, SchemaField
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "AliasMatch",
+    "ContractPlan",
+    "compile_contract_plan",
+    "get_contract_plan",
+    "clear_plan_cache",
+    "get_plan_cache_stats",
+]
+
+
+@dataclass(frozen=True)
+class AliasMatch:
+    """Input column renamed to a canonical field name."""
+    alias: str
+    canonical: str
+    priority: int  # Position in the field's alias list
+
+
+@dataclass(frozen=True)
+class ContractPlan:
+    """
+    Contract resolved against a fixed set of input columns.
+
+    Attributes:
+        dataset_id, version, contract_hash: Contract identity
+        input_columns: Column names the plan was compiled for
+        renames: Alias matches, in contract field order
+        output_columns: Column names after renaming
+        missing_required: Required fields with no matching column
+        cast_fields: Fields present after renaming, in contract order
+        known_columns: Canonical names of all contract fields
+        unknown_columns: Output columns not defined by the contract
+    """
+    dataset_id: str
+    version: int
+    contract_hash: str
+    input_columns: Tuple[Hashable, ...]
+    renames: Tuple[AliasMatch, ...]
+    output_columns: Tuple[Hashable, ...]
+    missing_required: Tuple[str, ...]
+    cast_fields: Tuple[SchemaField, ...]
+    known_columns: FrozenSet[str]
+    unknown_columns: Tuple[Hashable, ...]
+
+    @property
+    def rename_map(self) -> Dict[str, str]:
+        """Alias -> canonical name mapping for DataFrame.rename."""
+        return {match.alias: match.canonical for match in self.renames}
+
+    @property
+    def known_output_columns(self) -> List[Hashable]:
+        """Output columns defined by the contract, in output order."""
+        return [col for col in self.output_columns if col in self.known_columns]
+
+
+def compile_contract_plan(contract: SchemaContract, columns: Iterable[Hashable]) -> ContractPlan:
+    """
+    Resolve a contract against input column names.
+
+    Uses deterministic ordering:
+    1. Fields are processed in contract order (YAML order matters)
+    2. Within each field, aliases are tried in list order (priority matters)
+    3. First match wins
+
+    Args:
+        contract: Schema contract
+        columns: Input DataFrame column names
+
+    Returns:
+        ContractPlan
+    """
+    input_columns = tuple(columns)
+    present = set(input_columns)
+
+    renames = []
+    for field in contract.fields:
+        # Try canonical name first, then aliases in order
+        for alias in [field.name] + field.aliases:
+            if alias in present:
+                if alias != field.name:
+                    renames.append(AliasMatch(alias, field.name, field.aliases.index(alias)))
+                break
+
+    rename_map = {match.alias: match.canonical for match in renames}
+    output_columns = tuple(rename_map.get(col, col) for col in input_columns)
+    output_present = set(output_columns)
+
+    # A required field is satisfied by its canonical name or any alias
+    missing_required = tuple(
+        field.name
+        for field in contract.get_required_fields()
+        if not any(name in output_present for name in [field.name] + field.aliases)
+    )
+
+    known_columns = frozenset(field.name for field in contract.fields)
+    return ContractPlan(
+        dataset_id=contract.dataset_id,
+        version=contract.version,
+        contract_hash=contract.contract_hash or "",
+        input_columns=input_columns,
+        renames=tuple(renames),
+        output_columns=output_columns,
+        missing_required=missing_required,
+        cast_fields=tuple(field for field in contract.fields if field.name in output_present),
+        known_columns=known_columns,
+        unknown_columns=tuple(col for col in output_columns if col not in known_columns),
+    )
+
+
+class _PlanCache:
+    """Thread-safe LRU cache of compiled plans with hit/miss counters."""
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._plans: "OrderedDict[tuple, ContractPlan]" = OrderedDict()
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0}
+
+    def get(self, contract: SchemaContract, columns: Iterable[Hashable]) -> ContractPlan:
+        input_columns = tuple(columns)
+        key = (contract.dataset_id, contract.version, contract.contract_hash, input_columns)
+        with self._lock:
+            plan = self._plans.get(key)
+            if plan is not None:
+                self._plans.move_to_end(key)
+                self.stats["hits"] += 1
+                return plan
+            self.stats["misses"] += 1
+
+        plan = compile_contract_plan(contract, input_columns)
+        logger.debug(
+            f"Compiled contract plan for {contract.dataset_id} v{contract.version}: "
+            f"{len(plan.renames)} renames, {len(plan.cast_fields)} casts"
+        )
+        with self._lock:
+            self._plans[key] = plan
+            while len(self._plans) > self.maxsize:
+                self._plans.popitem(last=False)
+        return plan
+
+    def clear(self) -> None:
+        with self._lock:
+            self._plans.clear()
+            self.stats = {"hits": 0, "misses": 0}
+
+    def info(self) -> Dict[str, int]:
+        with self._lock:
+            return {**self.stats, "size": len(self._plans), "maxsize": self.maxsize}
+
+
+_plan_cache = _PlanCache()
+
+
+def get_contract_plan(contract: SchemaContract, columns: Iterable[Hashable]) -> ContractPlan:
+    """
+    Get the compiled plan of a contract for input columns (cached).
+
+    Args:
+        contract: Schema contract
+        columns: Input DataFrame column names (order matters)
+
+    Returns:
+        ContractPlan shared by all callers with the same contract and columns
+    """
+    return _plan_cache.get(contract, columns)
+
+
+def clear_plan_cache() -> None:
+    """Drop all compiled plans and reset the counters."""
+    _plan_cache.clear()
+
+
+def get_plan_cache_stats() -> Dict[str, int]:
+    """Hit/miss counters and size of the plan cache."""
+    return _plan_cache.info()
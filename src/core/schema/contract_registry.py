@@ -419,5 +419,7 @@ def list_available_contracts() -> Dict[str, Dict[int, str]]:
 
 
 def clear_cache():
-    """Clear the contract cache (useful for testing)."""
+    """Clear the contract cache and the compiled plans (useful for testing)."""
+    from src.core.schema.contract_plan import clear_plan_cache
     load_contract.cache_clear()
+    clear_plan_cache()
@@ -52,9 +52,9 @@ class CoercionRules:
     remove_commas: bool = True          # For amounts: "1,234.56" → 1234.56
     remove_spaces: bool = True          # For amounts: "1 234.56" → 1234.56
     remove_currency_symbols: bool = True # For amounts: "$1,234" → 1234.0
-    date_formats: List[str] = field(default_factory=lambda: [
-        "%Y-%m-%d", "%d/%m/%Y", "%m/%d/%Y", "%Y%m%d"
-    ])
+    # strptime formats tried in order before inference; only contracts that
+    # declare them get format-based (e.g. day-first) parsing
+    date_formats: List[str] = field(default_factory=list)
     
     @staticmethod
     def strict() -> 'CoercionRules':
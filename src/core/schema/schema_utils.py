@@ -10,13 +10,14 @@ import warnings
 from datetime import datetime
 from typing import List, Optional, Tuple, Dict
 
+import numpy as np
 import pandas as pd
 
+from src.core.schema.contract_plan import ContractPlan, get_contract_plan
 from src.core.schema.contract_registry import get_active_contract
 from src.core.schema.models import (
     CoercionRules,
     FillPolicy,
-    SchemaContract,
     SchemaField,
     SchemaReport,
     SemanticTag,
@@ -29,6 +30,82 @@ from src.utils.pandas_utils import coerce_numeric_series
 logger = logging.getLogger(__name__)
 
 
+def _coerce_dates(series: pd.Series, date_formats: List[str]) -> Tuple[pd.Series, int]:
+    """
+    Normalize a Series of date values to midnight Timestamps.
+    
+    Each distinct value is parsed once: first with the date_formats the
+    contract declares (in order), then with one pd.to_datetime inference pass
+    (month first for ambiguous values) over the values none of them matched.
+    Values that cannot be parsed become NaT.
+    
+    Args:
+        series: Input series (strings, dates, timestamps or numbers)
+        date_formats: strptime formats declared in the contract's coercion
+            rules (empty: inference only)
+    
+    Returns:
+        Tuple of (normalized_series, invalid_count) where invalid_count is the
+        number of non-null values that could not be parsed
+    """
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series.dt.normalize(), 0
+    
+    not_null = series.notna().to_numpy()
+    codes, uniques = pd.factorize(series[not_null].astype(str).str.strip())
+    parsed = _parse_date_strings(np.asarray(uniques, dtype=object), date_formats)
+    
+    if parsed.dtype == object:
+        result = pd.Series(pd.NaT, index=series.index, dtype=object)
+    else:
+        result = pd.Series(pd.NaT, index=series.index, dtype=parsed.dtype)
+    result.iloc[np.flatnonzero(not_null)] = parsed[codes]
+    
+    invalid_count = int((not_null & result.isna().to_numpy()).sum())
+    return result, invalid_count
+
+
+def _parse_date_strings(strings: np.ndarray, date_formats: List[str]) -> np.ndarray:
+    """Parse distinct date strings; returns datetime64[ns] (or object if tz-aware)."""
+    parsed = np.full(len(strings), np.datetime64("NaT"), dtype="datetime64[ns]")
+    pending = strings != ""
+    
+    for date_format in date_formats:
+        positions = np.flatnonzero(pending)
+        if len(positions) == 0:
+            break
+        attempt = pd.to_datetime(pd.Index(strings[positions]), format=date_format, errors="coerce")
+        if attempt.tz is not None:
+            continue
+        matched = ~attempt.isna()
+        parsed[positions[matched]] = attempt[matched].normalize().to_numpy()
+        pending[positions[matched]] = False
+    
+    positions = np.flatnonzero(pending)
+    if len(positions) == 0:
+        return parsed
+    
+    # Formats not declared in the contract: one inference pass over the rest
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            attempt = pd.to_datetime(pd.Index(strings[positions]), format="mixed", errors="coerce")
+    except (ValueError, TypeError):
+        attempt = None
+    if isinstance(attempt, pd.DatetimeIndex) and attempt.tz is None:
+        parsed[positions] = attempt.normalize().to_numpy()
+        return parsed
+    
+    # Timezone-aware or mixed-offset values: parse one by one, keeping tz
+    parsed = np.array([pd.Timestamp(value) for value in parsed], dtype=object)
+    for position in positions:
+        try:
+            parsed[position] = normalize_date(strings[position])
+        except (ValueError, TypeError):
+            parsed[position] = pd.NaT
+    return parsed
+
+
 def _coerce_by_semantic_tag(
     series: pd.Series,
     field: SchemaField
@@ -54,24 +131,8 @@ def _coerce_by_semantic_tag(
         invalid_count = result.isnull().sum() - original_null_count
         
     elif field.semantic_tag == SemanticTag.DATE:
-        # Use date_utils for date normalization
-        result = series.copy()
-        valid_dates = []
-        
-        for val in series:
-            if pd.isna(val):
-                valid_dates.append(pd.NaT)
-                continue
-            
-            try:
-                # Try to normalize using date_utils
-                normalized = normalize_date(str(val))
-                valid_dates.append(normalized)
-            except (ValueError, TypeError):
-                valid_dates.append(pd.NaT)
-                invalid_count += 1
-        
-        result = pd.Series(valid_dates, index=series.index)
+        date_formats = field.coercion_rules.date_formats if field.coercion_rules else []
+        result, invalid_count = _coerce_dates(series, date_formats)
         
     elif field.semantic_tag in [SemanticTag.KEY, SemanticTag.ID, SemanticTag.CODE]:
         # String fields: strip whitespace, convert to string
@@ -106,132 +167,64 @@ def _coerce_by_semantic_tag(
     return result, invalid_count, filled_count
 
 
-def _normalize_column_names(
-    df: pd.DataFrame,
-    contract: SchemaContract,
-    track: bool = True
-) -> Tuple[pd.DataFrame, List[TransformEvent]]:
+def _rename_events(
+    plan: ContractPlan,
+    row_count: int
+) -> List[TransformEvent]:
     """
-    Normalize DataFrame column names using contract aliases.
-    
-    Uses deterministic ordering:
-    1. Fields are processed in contract order (YAML order matters)
-    2. Within each field, aliases are tried in list order (priority matters)
-    3. First match wins and is logged
+    Build the RENAME events of a compiled contract plan.
     
     Args:
-        df: Input DataFrame
-        contract: Schema contract with field definitions
-        track: Whether to record transformation events
+        plan: Compiled contract plan
+        row_count: Number of rows in the DataFrame
     
     Returns:
-        Tuple of (normalized_df, transform_events)
+        One TransformEvent per alias renamed to its canonical name
     """
-    df_normalized = df.copy()
     events = []
-    rename_map = {}
-    
-    # Build rename mapping using aliases (deterministic order)
-    for field in contract.fields:
-        # Check if any alias exists in the DataFrame
-        # Try canonical name first, then aliases in order
-        for alias in [field.name] + field.aliases:
-            if alias in df_normalized.columns:
-                if alias != field.name:
-                    # Found an alias that needs renaming
-                    rename_map[alias] = field.name
-                    
-                    if track:
-                        event = TransformEvent(
-                            event_type=TransformType.RENAME,
-                            timestamp=datetime.now(),
-                            source="schema.normalize",
-                            columns=[field.name],
-                            before_name=alias,
-                            after_name=field.name,
-                            row_count_before=len(df),
-                            row_count_after=len(df),
-                            metadata={
-                                "alias_matched": alias,
-                                "alias_priority": field.aliases.index(alias) if alias in field.aliases else -1
-                            }
-                        )
-                        events.append(event)
-                    
-                    logger.debug(
-                        f"Matched alias '{alias}' → canonical '{field.name}' "
-                        f"(priority: {field.aliases.index(alias) if alias in field.aliases else 'canonical'})"
-                    )
-                break  # Use first matching alias only
-    
-    if rename_map:
-        df_normalized = df_normalized.rename(columns=rename_map)
-        logger.info(f"Renamed {len(rename_map)} columns: {rename_map}")
-    
-    return df_normalized, events
-    
-    if rename_map:
-        df_normalized = df_normalized.rename(columns=rename_map)
-        logger.debug(f"Renamed columns: {rename_map}")
-    
-    return df_normalized, events
-
-
-def _validate_required_columns(
-    df: pd.DataFrame,
-    contract: SchemaContract
-) -> List[str]:
-    """
-    Validate that all required columns exist in the DataFrame.
-    
-    Args:
-        df: DataFrame to validate
-        contract: Schema contract with required fields
-    
-    Returns:
-        List of missing required column names (empty if all present)
-    """
-    required_fields = contract.get_required_fields()
-    missing = []
-    
-    for field in required_fields:
-        # Check canonical name and all aliases
-        found = False
-        for name in [field.name] + field.aliases:
-            if name in df.columns:
-                found = True
-                break
-        
-        if not found:
-            missing.append(field.name)
-    
-    return missing
+    for match in plan.renames:
+        events.append(TransformEvent(
+            event_type=TransformType.RENAME,
+            timestamp=datetime.now(),
+            source="schema.normalize",
+            columns=[match.canonical],
+            before_name=match.alias,
+            after_name=match.canonical,
+            row_count_before=row_count,
+            row_count_after=row_count,
+            metadata={
+                "alias_matched": match.alias,
+                "alias_priority": match.priority
+            }
+        ))
+        logger.debug(
+            f"Matched alias '{match.alias}' → canonical '{match.canonical}' "
+            f"(priority: {match.priority})"
+        )
+    return events
 
 
 def _cast_columns(
     df: pd.DataFrame,
-    contract: SchemaContract,
+    plan: ContractPlan,
     track: bool = True
-) -> Tuple[pd.DataFrame, List[TransformEvent]]:
+) -> List[TransformEvent]:
     """
-    Cast DataFrame columns to target dtypes based on contract.
+    Cast DataFrame columns to target dtypes in place, following a contract plan.
     
     Args:
-        df: Input DataFrame
-        contract: Schema contract with dtype specifications
+        df: DataFrame owned by the caller (modified in place)
+        plan: Compiled contract plan listing the fields to cast
         track: Whether to record transformation events
     
     Returns:
-        Tuple of (cast_df, transform_events)
+        List of CAST transform events
     """
-    df_cast = df.copy()
     events = []
     
-    for field in contract.fields:
-        if field.name not in df_cast.columns:
-            continue  # Skip columns not in DataFrame
-        
-        before_dtype = str(df_cast[field.name].dtype)
+    for field in plan.cast_fields:
+        series = df[field.name]
+        before_dtype = str(series.dtype)
         
         # Skip if already correct dtype
         if field.dtype in before_dtype:
@@ -239,13 +232,10 @@ def _cast_columns(
         
         try:
             # Apply coercion based on semantic tag
-            coerced, invalid_count, filled_count = _coerce_by_semantic_tag(
-                df_cast[field.name],
-                field
-            )
+            coerced, invalid_count, filled_count = _coerce_by_semantic_tag(series, field)
             
-            df_cast[field.name] = coerced
-            after_dtype = str(df_cast[field.name].dtype)
+            df[field.name] = coerced
+            after_dtype = str(coerced.dtype)
             
             if track:
                 event = TransformEvent(
@@ -257,8 +247,8 @@ def _cast_columns(
                     after_dtype=after_dtype,
                     row_count_before=len(df),
                     row_count_after=len(df),
-                    null_count_before=df[field.name].isnull().sum(),
-                    null_count_after=df_cast[field.name].isnull().sum(),
+                    null_count_before=series.isnull().sum(),
+                    null_count_after=coerced.isnull().sum(),
                     invalid_coerced_to_nan=invalid_count,
                     values_filled=filled_count,
                     metadata={
@@ -277,7 +267,7 @@ def _cast_columns(
             logger.error(f"Failed to cast column '{field.name}': {e}")
             # Continue with other columns
     
-    return df_cast, events
+    return events
 
 
 def apply_schema_contract(
@@ -340,13 +330,17 @@ def apply_schema_contract(
         row_count_after=len(df)
     )
     
-    # Step 1: Normalize column names
-    df_result, rename_events = _normalize_column_names(df, contract, track=track)
-    for event in rename_events:
-        report.add_event(event)
+    # Column mapping, required-field checks and cast targets only depend on
+    # the contract and the input columns: resolve them once per column set
+    plan = get_contract_plan(contract, df.columns)
+    
+    # Step 1: Record column renames
+    if track:
+        for event in _rename_events(plan, len(df)):
+            report.add_event(event)
     
-    # Step 2: Validate required columns
-    missing_required = _validate_required_columns(df_result, contract)
+    # Step 2: Validate required columns (before copying anything)
+    missing_required = list(plan.missing_required)
     
     if missing_required:
         report.required_columns_missing = missing_required
@@ -359,22 +353,27 @@ def apply_schema_contract(
             raise ValueError(
                 f"Schema validation failed for {dataset_id}: "
                 f"Required columns missing: {missing_required}. "
-                f"Available columns: {list(df_result.columns)}"
+                f"Available columns: {list(plan.output_columns)}"
             )
         else:
             report.validation_warnings.append(
                 f"Missing required columns (strict=False): {missing_required}"
             )
     
+    # Single copy: the input DataFrame is never modified
+    if plan.renames:
+        df_result = df.rename(columns=plan.rename_map)
+        logger.info(f"Renamed {len(plan.renames)} columns: {plan.rename_map}")
+    else:
+        df_result = df.copy()
+    
     # Step 3: Cast columns to target dtypes
     if cast:
-        df_result, cast_events = _cast_columns(df_result, contract, track=track)
-        for event in cast_events:
+        for event in _cast_columns(df_result, plan, track=track):
             report.add_event(event)
     
     # Step 4: Handle unknown columns
-    known_columns = {field.name for field in contract.fields}
-    unknown_columns = [col for col in df_result.columns if col not in known_columns]
+    unknown_columns = list(plan.unknown_columns)
     
     if unknown_columns:
         report.unknown_columns_kept = unknown_columns
@@ -383,7 +382,7 @@ def apply_schema_contract(
             logger.warning(
                 f"Dropping {len(unknown_columns)} unknown columns: {unknown_columns}"
             )
-            df_result = df_result[list(known_columns.intersection(df_result.columns))]
+            df_result = df_result[plan.known_output_columns]
             
             if track:
                 event = TransformEvent(
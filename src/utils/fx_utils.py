@@ -5,7 +5,8 @@ Provides functionality to convert local currency amounts to USD using
 monthly FX rates from CR_05 (FX Rates Control Report).
 """
 
-from typing import Optional
+from typing import Dict, Optional, Tuple
+import numpy as np
 import pandas as pd
 
 
@@ -47,17 +48,17 @@ class FXConverter:
         self.default_rate = default_rate
         
         # Build lookup dictionary: {Company_Code: FX_rate}
-        # Use the first rate if there are duplicates
-        self.rates_dict = {}
-        for _, row in cr05_df.iterrows():
-            company_code = row["Company_Code"]
-            fx_rate = row["FX_rate"]
-            
-            # Only store if company_code is not null
-            if pd.notna(company_code):
-                # Store the rate if it's valid (not null and not zero)
-                if pd.notna(fx_rate) and fx_rate != 0:
-                    self.rates_dict[str(company_code)] = float(fx_rate)
+        # Only non-null company codes with a valid (non-null, non-zero) rate are kept;
+        # for duplicated company codes the last valid rate is retained.
+        company_codes = cr05_df["Company_Code"]
+        fx_rates = cr05_df["FX_rate"]
+        valid = company_codes.notna() & fx_rates.notna() & (fx_rates != 0)
+        self.rates_dict = dict(
+            zip(
+                company_codes[valid].astype(str),
+                fx_rates[valid].astype(float),
+            )
+        )
     
     def convert_to_usd(self, amount: float, company_code: str) -> float:
         """
@@ -137,15 +138,97 @@ class FXConverter:
                 "amount_series and company_code_series must have the same length"
             )
         
-        # Apply conversion element-wise
-        result = pd.Series(index=amount_series.index, dtype=float)
-        for idx in amount_series.index:
-            result[idx] = self.convert_to_usd(
-                amount_series[idx], 
-                company_code_series[idx]
-            )
+        rates, _ = self.lookup_rates(company_code_series)
+        amounts = _to_float_array(amount_series)
+        
+        # NaN amounts convert to 0.0 (same as convert_to_usd)
+        result = np.where(np.isnan(amounts), 0.0, amounts / rates)
+        
+        return pd.Series(result, index=amount_series.index, dtype=float)
+    
+    def lookup_rates(self, company_code_series: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Map a Series of company codes to an array of FX rates.
+        
+        Each distinct company code is looked up once and the result is
+        broadcast back to all rows.
+        
+        Args:
+            company_code_series: Series of company codes
+        
+        Returns:
+            Tuple (rates, missing):
+            - rates: float array of the rate to divide by (default_rate when
+              the company code is null or not in CR_05)
+            - missing: bool array, True where no CR_05 rate was found
+        """
+        codes, uniques = pd.factorize(company_code_series.astype(object))
+        unique_rates = np.array(
+            [self.rates_dict.get(str(code), np.nan) for code in uniques],
+            dtype=float,
+        )
+        
+        # Null company codes are factorized to -1
+        found_rates = np.full(len(codes), np.nan)
+        has_code = codes >= 0
+        found_rates[has_code] = unique_rates[codes[has_code]]
+        
+        missing = np.isnan(found_rates)
+        rates = np.where(missing, self.default_rate, found_rates)
+        return rates, missing
+    
+    def convert_columns_to_usd(
+        self,
+        df: pd.DataFrame,
+        amount_columns: Dict[str, str],
+        company_code_col: str,
+    ) -> pd.DataFrame:
+        """
+        Convert several amount columns of a DataFrame to USD in one call.
         
+        Company codes are mapped to rates once and reused for every column.
+        
+        Args:
+            df: DataFrame holding the amount and company code columns
+            amount_columns: Mapping of local amount column -> output USD column
+                (e.g., {"nav_amount_local": "nav_amount_usd"})
+            company_code_col: Name of the company code column
+        
+        Returns:
+            DataFrame indexed like df with one column per USD output plus:
+            - fx_rate_used: CR_05 rate applied (NaN when missing)
+            - fx_missing: True when no CR_05 rate was found for the company
+        
+        Examples:
+            >>> usd = converter.convert_columns_to_usd(
+            ...     variance_df,
+            ...     {"nav_amount_local": "nav_amount_usd", "tv_amount_local": "tv_amount_usd"},
+            ...     "company_code",
+            ... )
+            >>> usd.columns.tolist()
+            ['nav_amount_usd', 'tv_amount_usd', 'fx_rate_used', 'fx_missing']
+        """
+        missing_cols = [
+            col for col in list(amount_columns) + [company_code_col] if col not in df.columns
+        ]
+        if missing_cols:
+            raise ValueError(f"DataFrame missing required columns: {missing_cols}")
+        
+        rates, missing = self.lookup_rates(df[company_code_col])
+        
+        result = pd.DataFrame(index=df.index)
+        for source_col, output_col in amount_columns.items():
+            amounts = _to_float_array(df[source_col])
+            result[output_col] = np.where(np.isnan(amounts), 0.0, amounts / rates)
+        
+        result["fx_rate_used"] = np.where(missing, np.nan, rates)
+        result["fx_missing"] = missing
         return result
 
 
+def _to_float_array(series: pd.Series) -> np.ndarray:
+    """Convert a numeric Series (including nullable/object dtypes) to a float array with NaN."""
+    return pd.to_numeric(series).to_numpy(dtype=float, na_value=np.nan)
+
+
 __all__ = ["FXConverter"]
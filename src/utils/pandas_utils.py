@@ -32,6 +32,8 @@ from typing import List, Optional
 
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
 
 
 logger = logging.getLogger(__name__)
@@ -87,12 +89,7 @@ def coerce_numeric_series(
     
     # For object/string dtype, strip commas and spaces before coercion
     if pd.api.types.is_object_dtype(s):
-        # Handle None/NaN values and empty strings
-        s_clean = s.apply(
-            lambda x: str(x).replace(',', '').replace(' ', '').strip()
-            if pd.notna(x) and str(x).strip() != ''
-            else np.nan
-        )
+        s_clean = _clean_numeric_strings(s)
     else:
         s_clean = s
     
@@ -106,6 +103,49 @@ def coerce_numeric_series(
     return result
 
 
+# Object columns holding only numbers (e.g. SQL DECIMAL values) need no cleaning
+_NUMERIC_INFERRED_TYPES = {"integer", "floating", "mixed-integer-float", "decimal"}
+
+# Thousands separators and spaces removed from amount strings
+_AMOUNT_SEPARATORS = str.maketrans("", "", ", ")
+
+# Characters removed by str.strip(), for the Arrow trim kernel
+_STRIP_CHARACTERS = "".join(c for c in map(chr, range(0x3001)) if c.isspace())
+
+
+def _clean_numeric_strings(s: pd.Series) -> pd.Series:
+    """
+    Strip commas and spaces from the values of an object Series.
+    
+    Equivalent to str(x).replace(',', '').replace(' ', '').strip() on every
+    non-missing value, run with Arrow string kernels. Missing values stay
+    missing and blank strings become empty (both coerce to NaN). Columns
+    already made of numbers are returned unchanged.
+    """
+    if pd.api.types.infer_dtype(s, skipna=True) in _NUMERIC_INFERRED_TYPES:
+        return s
+    
+    values = s.to_numpy(dtype=object)
+    present = ~pd.isna(values)
+    strings = values[present]
+    if pd.api.types.infer_dtype(strings, skipna=False) != "string":
+        strings = [str(v) for v in strings]
+    
+    try:
+        arrow_strings = pc.utf8_trim(
+            pc.replace_substring(pc.replace_substring(pa.array(strings, type=pa.string()), ",", ""), " ", ""),
+            characters=_STRIP_CHARACTERS,
+        )
+        cleaned_strings = arrow_strings.to_numpy(zero_copy_only=False)
+    except (pa.ArrowException, UnicodeError):
+        # e.g. lone surrogates, which Arrow cannot encode
+        cleaned_strings = [v.translate(_AMOUNT_SEPARATORS).strip() for v in strings]
+    
+    cleaned = np.full(len(values), np.nan, dtype=object)
+    cleaned[present] = cleaned_strings
+    return pd.Series(cleaned, index=s.index, name=s.name)
+
+
 def cast_amount_columns(
     df: pd.DataFrame,
     *,
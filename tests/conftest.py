@@ -1,3 +1,5 @@
+from unittest.mock import MagicMock
+
 import pytest
 
 
@@ -10,3 +12,38 @@ def pytest_collection_modifyitems(config, items):
             item.add_marker(skip_athena)
         if "okta" in path:
             item.add_marker(skip_okta)
+
+
+@pytest.fixture
+def make_ipe_runner(tmp_path):
+    """
+    Factory building IPERunner instances with test defaults.
+
+    Evidence goes to tmp_path. ipe_id, main_query, validation and secret_name
+    set the IPE config; connect replaces _get_database_connection; any other
+    keyword is passed to IPERunner (chunk_size, connection_pool, ...).
+    """
+    from src.core.evidence import DigitalEvidenceManager
+    from src.core.runners.mssql_runner import IPERunner
+
+    def make(ipe_id="TEST_IPE", main_query="SELECT * FROM t WHERE d < ?",
+             validation=None, secret_name="fake", connect=None, **runner_kwargs):
+        ipe_config = {
+            "id": ipe_id,
+            "description": f"{ipe_id} test",
+            "secret_name": secret_name,
+            "main_query": main_query,
+            "validation": dict(validation or {}),
+        }
+        runner = IPERunner(
+            ipe_config,
+            MagicMock(),
+            cutoff_date="2025-09-30",
+            evidence_manager=DigitalEvidenceManager(str(tmp_path / "evidence")),
+            **runner_kwargs,
+        )
+        if connect is not None:
+            runner._get_database_connection = connect
+        return runner
+
+    return make
@@ -0,0 +1,198 @@
+"""
+Tests for line-item drilldown (drilldown.py) and its use in build_review_table.
+"""
+
+import pandas as pd
+import pytest
+
+from src.core.reconciliation.analysis.drilldown import (
+    LINE_ITEM_COLUMNS,
+    extract_nav_line_items,
+    extract_nav_line_items_frame,
+    extract_tv_line_items,
+    extract_tv_line_items_frame,
+)
+from src.core.reconciliation.analysis.review_tables import REVIEW_TABLE_COLUMNS, build_review_table
+from src.core.reconciliation.thresholds import resolve_line_item_threshold
+from src.utils.fx_utils import FXConverter
+
+
+@pytest.fixture
+def fx_converter():
+    return FXConverter(pd.DataFrame({
+        "Company_Code": ["EG", "NG"],
+        "FX_rate": [50.0, 1650.0],
+    }))
+
+
+@pytest.fixture
+def nav_source():
+    return pd.DataFrame({
+        "country_code": ["EG", "EG", "EG", "NG", "EG"],
+        "category": ["Voucher", "Voucher", "Voucher", "Voucher", "Usage"],
+        "voucher_type": ["refund", "refund", "apology", "refund", "refund"],
+        "voucher_no": ["V1", "V2", "V3", "V4", "V5"],
+        "document_no": ["D1", "D2", "D3", "D4", "D5"],
+        "amount_local": [100000.0, -50.0, 10.0, 3300000.0, 7.0],
+    })
+
+
+@pytest.fixture
+def tv_source():
+    return pd.DataFrame({
+        "ID_COMPANY": ["EG", "EG", "NG"],
+        "category": ["Voucher", "Voucher", "Voucher"],
+        "business_use": ["Refund", "APOLOGY", "refund"],
+        "id": [11, 12, 13],
+        "remaining_amount": ["5000", "25", None],
+    })
+
+
+def _buckets(rows):
+    buckets = pd.DataFrame(rows, columns=["country_code", "category", "voucher_type"])
+    buckets["bucket_threshold_usd"] = 1000.0
+    buckets["threshold_contract_version"] = 1
+    buckets["threshold_contract_hash"] = "abc"
+    buckets["line_item_threshold_usd"] = 500.0
+    buckets["threshold_rule_description"] = "test rule"
+    return buckets
+
+
+class TestLineItemFrames:
+    """All buckets are drilled down in one pass over the source."""
+
+    def test_nav_line_items_grouped_by_bucket(self, nav_source, fx_converter):
+        buckets = _buckets([("NG", "Voucher", "refund"), ("EG", "Voucher", "refund")])
+
+        items = extract_nav_line_items_frame(nav_source, buckets, "18412", fx_converter)
+
+        assert list(items.columns) == LINE_ITEM_COLUMNS
+        assert items["voucher_id"].tolist() == ["V4", "V1", "V2"]
+        assert items["nav_amount_usd"].tolist() == pytest.approx([2000.0, 2000.0, -1.0])
+        assert items["variance_amount_usd"].tolist() == items["nav_amount_usd"].tolist()
+        assert items["tv_amount_local"].isna().all()
+        assert items["line_item_material"].tolist() == [True, True, False]
+        assert (items["row_type"] == "line_item").all()
+        assert (items["gl_account"] == "18412").all()
+
+    def test_filter_non_material(self, nav_source, fx_converter):
+        buckets = _buckets([("EG", "Voucher", "refund")])
+
+        items = extract_nav_line_items_frame(
+            nav_source, buckets, "18412", fx_converter, filter_non_material=True,
+        )
+
+        assert items["voucher_id"].tolist() == ["V1"]
+
+    def test_tv_business_use_matches_case_insensitively(self, tv_source, fx_converter):
+        buckets = _buckets([("EG", "Voucher", "refund"), ("NG", "Voucher", "refund")])
+
+        items = extract_tv_line_items_frame(tv_source, buckets, "18412", fx_converter)
+
+        assert items["voucher_id"].tolist() == [11, 13]
+        assert items["tv_amount_usd"].tolist() == pytest.approx([100.0, 0.0])
+        assert items["document_no"].isna().all()
+
+    def test_missing_columns_return_empty(self, fx_converter):
+        buckets = _buckets([("EG", "Voucher", "refund")])
+        no_amount = pd.DataFrame({"category": ["Voucher"], "voucher_type": ["refund"]})
+
+        assert extract_nav_line_items_frame(no_amount, buckets, "18412", fx_converter).empty
+        assert extract_tv_line_items_frame(pd.DataFrame({"x": [1]}), buckets, "18412", fx_converter).empty
+
+
+class TestSingleBucketExtraction:
+    """The per-bucket API returns one dict per line item."""
+
+    def test_extract_nav_line_items(self, nav_source, fx_converter):
+        threshold = resolve_line_item_threshold("EG", "18412", "Voucher", "refund")
+
+        items = extract_nav_line_items(
+            nav_source, "EG", "Voucher", "refund", "18412", threshold, fx_converter,
+            bucket_threshold_usd=1000.0, bucket_contract_version=1, bucket_contract_hash="abc",
+        )
+
+        assert [item["voucher_id"] for item in items] == ["V1", "V2"]
+        assert items[0]["tv_amount_local"] is None
+        assert items[0]["line_item_threshold_usd"] == threshold.value_usd
+        assert items[0]["threshold_rule_description"] == threshold.matched_rule_description
+        assert set(items[0]) == set(LINE_ITEM_COLUMNS)
+
+    def test_extract_tv_line_items_no_match(self, tv_source, fx_converter):
+        threshold = resolve_line_item_threshold("EG", "18412", "Voucher", "gift")
+
+        assert extract_tv_line_items(
+            tv_source, "EG", "Voucher", "gift", "18412", threshold, fx_converter,
+            bucket_threshold_usd=1000.0, bucket_contract_version=1, bucket_contract_hash="abc",
+        ) == []
+
+
+class TestReviewTableDrilldown:
+    """build_review_table appends line items of INVESTIGATE buckets."""
+
+    def test_review_table_with_line_items(self, nav_source, tv_source, fx_converter):
+        evaluated = pd.DataFrame({
+            "country_code": ["EG", "NG"],
+            "category": ["Voucher", "Voucher"],
+            "voucher_type": ["refund", "refund"],
+            "status": ["INVESTIGATE", "OK"],
+            "nav_amount_local": [99950.0, 3300000.0],
+            "tv_amount_local": [5000.0, 0.0],
+            "variance_amount_local": [94950.0, 3300000.0],
+            "nav_amount_usd": [1999.0, 2000.0],
+            "tv_amount_usd": [100.0, 0.0],
+            "variance_amount_usd": [1899.0, 2000.0],
+            "threshold_usd": [1000.0, 5000.0],
+            "threshold_contract_version": [1, 1],
+            "threshold_contract_hash": ["abc", "abc"],
+            "threshold_rule_description": ["bucket rule", "bucket rule"],
+        })
+
+        review = build_review_table(
+            evaluated, "18412",
+            nav_source_df=nav_source, tv_source_df=tv_source, fx_converter=fx_converter,
+        )
+
+        assert review["row_type"].tolist() == ["bucket_summary", "line_item", "line_item", "line_item"]
+        line_items = review[review["row_type"] == "line_item"]
+        assert sorted(line_items["voucher_id"].astype(str)) == ["11", "V1", "V2"]
+        expected = resolve_line_item_threshold("EG", "18412", "Voucher", "refund")
+        assert (line_items["line_item_threshold_usd"] == expected.value_usd).all()
+        assert set(review["country_code"]) == {"EG"}
+        assert review["line_item_material"].dtype == "boolean"
+        assert review["line_item_material"].iloc[1:].notna().all()
+
+
+class TestReviewTableDtypes:
+    """The review table has the same typed columns with or without line items."""
+
+    def test_bucket_summaries_are_typed(self):
+        evaluated = pd.DataFrame({
+            "country_code": ["EG", "EG"],
+            "category": ["Voucher", "Usage"],
+            "voucher_type": ["refund", "refund"],
+            "status": ["INVESTIGATE", "INVESTIGATE"],
+            "nav_amount_local": [10, 20],
+            "tv_amount_local": [0.0, None],
+            "variance_amount_local": [10.0, 20.0],
+            "nav_amount_usd": [0.2, 0.4],
+            "tv_amount_usd": [0.0, None],
+            "variance_amount_usd": [0.2, 0.4],
+            "threshold_usd": [0.1, 0.1],
+            "threshold_contract_version": [1, 2],
+            "threshold_contract_hash": ["abc", "def"],
+            "threshold_rule_description": ["rule", "rule"],
+        })
+
+        review = build_review_table(evaluated, "18412")
+        empty = build_review_table(evaluated.assign(status="OK"), "18412")
+
+        assert list(review.columns) == REVIEW_TABLE_COLUMNS
+        assert review.dtypes.to_dict() == empty.dtypes.to_dict()
+        assert review["nav_amount_local"].dtype == "float64"
+        assert review["threshold_contract_version"].dtype == "Int64"
+        assert review["line_item_material"].dtype == "boolean"
+        assert review["line_item_material"].isna().all()
+        assert review["category"].tolist() == ["Usage", "Voucher"]
+        assert review["voucher_id"].isna().all()
+        assert empty.empty
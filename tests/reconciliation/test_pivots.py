@@ -13,6 +13,8 @@ Test Coverage:
 - Schema validation: deterministic ordering, column validation, error handling
 """
 
+import logging
+
 import pandas as pd
 import pytest
 
@@ -20,7 +22,12 @@ from src.core.reconciliation.analysis.pivots import (
     build_target_values_pivot_local,
 )
 from src.core.reconciliation.voucher_classification.voucher_utils import (
+    BRIDGE_CATEGORIES,
+    HARMONIZED_VOUCHER_TYPES,
+    VOUCHER_TYPES,
     harmonize_voucher_type,
+    harmonize_voucher_types,
+    to_categorical,
 )
 
 
@@ -79,6 +86,26 @@ class TestHarmonizeVoucherType:
         assert harmonize_voucher_type("XYZ123") == "other"
 
 
+class TestHarmonizeVoucherTypes:
+    """Tests for the column-level harmonizer."""
+
+    def test_matches_scalar_harmonizer(self):
+        labels = ['Refund', 'REFUND', 'rf_', 'Store Credit', 'storecredit', 'CXP', 'pyt_pf',
+                  'EXP', 'Voucher to Cash', 'UNKNOWN', 'xyz', '', '   ', None, float('nan'), pd.NA]
+        values = pd.Series(labels * 3, index=range(100, 100 + 3 * len(labels)))
+        result = harmonize_voucher_types(values)
+        assert result.tolist() == [harmonize_voucher_type(v) for v in values]
+        assert result.index.equals(values.index)
+
+    def test_unknown_labels_logged_once(self, caplog):
+        values = pd.Series(['xyz'] * 500 + ['abc'] * 2 + ['refund'])
+        with caplog.at_level(logging.DEBUG, logger='src.core.reconciliation.voucher_classification.voucher_utils'):
+            harmonize_voucher_types(values)
+        messages = [r.getMessage() for r in caplog.records if 'voucher_type' in r.getMessage()]
+        assert len(messages) == 1
+        assert "502 rows" in messages[0] and "'xyz': 500" in messages[0]
+
+
 class TestBuildTargetValuesPivotLocal:
     """Tests for build_target_values_pivot_local function."""
 
@@ -787,6 +814,37 @@ class TestBuildNavPivot:
         assert ('Usage', 'store_credit') in nav_pivot.index
 
 
+class TestBuildNavPivotCategorical:
+    """build_nav_pivot on categorical columns from categorize_nav_vouchers."""
+
+    def test_categorical_input_matches_object_input(self):
+        cr_03_df = pd.DataFrame({
+            'bridge_category': ['Issuance', None, 'Usage', 'Issuance', 'Expired'],
+            'voucher_type': ['Refund', 'Apology', None, 'STORE CREDIT', 'jforce'],
+            'amount': [-100.0, 20.0, 30.0, -40.0, 5.0],
+        })
+        categorical_df = cr_03_df.copy()
+        categorical_df['bridge_category'] = to_categorical(cr_03_df['bridge_category'], BRIDGE_CATEGORIES)
+        categorical_df['voucher_type'] = to_categorical(cr_03_df['voucher_type'], VOUCHER_TYPES)
+
+        object_pivot, _ = build_nav_pivot(cr_03_df)
+        categorical_pivot, nav_lines = build_nav_pivot(categorical_df)
+
+        pd.testing.assert_frame_equal(categorical_pivot, object_pivot)
+        assert ('Uncategorized', 'apology') in categorical_pivot.index
+        # Only observed (category, voucher_type) combinations are listed
+        assert len(categorical_pivot) == 6
+        assert nav_lines['voucher_type'].tolist() == [
+            'refund', 'apology', 'Unknown', 'store_credit', 'jforce'
+        ]
+
+    def test_harmonize_categories_maps_codes(self):
+        voucher_types = to_categorical(pd.Series(['Refund', None, 'RFN', 'xyz']), VOUCHER_TYPES)
+        harmonized = harmonize_voucher_types(voucher_types)
+        assert list(harmonized.cat.categories) == HARMONIZED_VOUCHER_TYPES
+        assert harmonized.tolist() == ['refund', 'Unknown', 'refund', 'other']
+
+
 class TestEdgeCases:
     """Tests for edge cases and boundary conditions."""
     
@@ -43,6 +43,47 @@ def test_classify_simple_matches():
     assert out.loc[2, "bridge_key"] in ("PREPAYMENTS", "PREPAID_DELIVERIES")
 
 
+def _classify_row_by_row(df, rules):
+    """Reference first-match-wins implementation (former iterrows loop)."""
+    keys = []
+    for _, row in df.iterrows():
+        key = None
+        for rule in sorted(rules, key=lambda r: r.priority_rank):
+            if all(
+                col in row.index
+                and not pd.isna(row[col])
+                and str(row[col]).lower() in {str(v).lower() for v in values}
+                for col, values in rule.triggers.items()
+            ):
+                key = rule.key
+                break
+        keys.append(key)
+    return keys
+
+
+def test_classify_matches_row_by_row_priority():
+    rules = load_rules()
+    trigger_values = [v for r in rules for vals in r.triggers.values() for v in vals]
+    df = pd.DataFrame({
+        "Transaction_Type": (trigger_values + ["REFUND", "transfer TO", None, "Unknown"]) * 3,
+        "IS_PREPAYMENT": (["1", None, 1, "0"] * 100)[: (len(trigger_values) + 4) * 3],
+    })
+    out = classify_bridges(df, rules)
+
+    assert out["bridge_key"].tolist() == _classify_row_by_row(df, rules)
+    assert out.loc[out["bridge_key"].isna(), "dr_gl_accounts"].isna().all()
+    rules_by_key = {r.key: r for r in rules}
+    for key, gl_accounts in out.dropna(subset=["bridge_key"])[["bridge_key", "dr_gl_accounts"]].values:
+        assert gl_accounts == ",".join(rules_by_key[key].dr_gl_accounts)
+
+
+def test_classify_missing_trigger_column_and_no_rules():
+    df = pd.DataFrame({"Amount": [1, 2]})
+    out = classify_bridges(df, load_rules())
+    assert out["bridge_key"].isna().all()
+    assert classify_bridges(df, [])["bridge_title"].isna().all()
+
+
 def test_customer_posting_group_bridge_empty_input():
     """Test with empty DataFrame"""
     empty_df = pd.DataFrame()
@@ -218,6 +259,23 @@ def test_customer_posting_group_bridge_output_format():
     assert proof_df.iloc[0]["Customer Posting Group"] == "GROUP_A, GROUP_B"
 
 
+def test_customer_posting_group_ignores_missing_and_duplicate_groups():
+    """Missing posting groups don't count; duplicates are listed once."""
+    df = pd.DataFrame(
+        {
+            "Customer No_": ["C001", "C001", "C001", "C002", "C002", None],
+            "Customer Name": [None, "Customer 1", "Customer 1", "Customer 2", "Customer 2", "X"],
+            "Customer Posting Group": ["RETAIL", "VIP", "RETAIL", "RETAIL", None, "VIP"],
+        }
+    )
+
+    _, proof_df = calculate_customer_posting_group_bridge(df)
+
+    assert proof_df["Customer No_"].tolist() == ["C001"]
+    assert proof_df.iloc[0]["Customer Name"] == "Customer 1"
+    assert proof_df.iloc[0]["Customer Posting Group"] == "RETAIL, VIP"
+
+
 def test_calculate_vtc_adjustment_basic():
     """Test basic VTC adjustment calculation with unmatched vouchers."""
     # Create IPE_08 data with canceled refund vouchers
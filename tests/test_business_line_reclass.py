@@ -475,6 +475,23 @@ class TestOutputSchema:
         assert (result["reasoning"].str.len() > 0).all()
         assert "Customer C001" in result["reasoning"].iloc[0]
 
+    def test_reasoning_text(self):
+        """Test reasoning text for primary and non-primary business lines."""
+        cle_df = pd.DataFrame([
+            {"customer_id": "C001", "business_line_code": "BL01", "amount_lcy": 1000.0},
+            {"customer_id": "C001", "business_line_code": "BL02", "amount_lcy": -200.5},
+        ])
+
+        result = identify_business_line_reclass_candidates(cle_df, "2025-09-30")
+
+        assert result["reasoning"].tolist() == [
+            "Customer C001 has 2 business lines. Proposed primary: BL01 "
+            "(largest absolute balance). Current BL is proposed primary. No reclass needed.",
+            "Customer C001 has 2 business lines. Proposed primary: BL01 "
+            "(largest absolute balance). Reclass -200.50 from BL02 to BL01.",
+        ]
+        assert result["proposed_reclass_amount_lcy"].tolist() == [0.0, -200.5]
+
     def test_output_sorted_deterministically(self):
         """Test output is sorted deterministically by customer_id and business_line_code."""
         cle_df = pd.DataFrame([
@@ -9,6 +9,7 @@ import pandas as pd
 from src.core.reconciliation.voucher_classification.cat_nav_classifier import (
     classify_integration_type,
     is_integration_user,
+    load_integration_user_ids,
 )
 from src.core.reconciliation.voucher_classification.cat_issuance_classifier import (
     classify_issuance,
@@ -107,6 +108,33 @@ class TestClassifyIntegrationType:
         result = classify_integration_type(df)
         assert result.loc[0, "Integration_Type"] == "Integration"
 
+    def test_repeated_and_null_user_ids(self):
+        """Each row gets the classification of its (normalized) user ID."""
+        df = pd.DataFrame({
+            "User ID": [" jumia/nav31afr.batch.srvc ", None, "USER/01", "JUMIA\\NAV31AFR.BATCH.SRVC"] * 50
+        })
+        result = classify_integration_type(df)
+        assert result["Integration_Type"].tolist() == ["Integration", "Manual", "Manual", "Integration"] * 50
+        assert result["Integration_Type"].dtype == object
+
+    def test_configured_integration_user_ids(self):
+        """A custom set of integration users replaces the default."""
+        df = pd.DataFrame({
+            "User ID": ["JUMIA/NAV31AFR.BATCH.SRVC", "jumia\\nav13afr.batch.srvc"]
+        })
+        result = classify_integration_type(df, integration_user_ids=["JUMIA/NAV13AFR.BATCH.SRVC"])
+        assert result["Integration_Type"].tolist() == ["Manual", "Integration"]
+
+    def test_integration_user_ids_from_environment(self, monkeypatch):
+        """SOX_INTEGRATION_USER_IDS is read once and can list several users."""
+        monkeypatch.setenv("SOX_INTEGRATION_USER_IDS", "JUMIA/NAV31AFR.BATCH.SRVC, jumia/nav13afr.batch.srvc")
+        load_integration_user_ids.cache_clear()
+        try:
+            assert is_integration_user("JUMIA/NAV13AFR.BATCH.SRVC") is True
+            assert is_integration_user("USER/01") is False
+        finally:
+            load_integration_user_ids.cache_clear()
+
 
 class TestIsIntegrationUser:
     """Tests for is_integration_user helper function."""
@@ -540,6 +568,28 @@ class TestCategorizationPipeline:
         assert result.loc[0, "voucher_type"] == "Refund"
         assert result.loc[0, "Integration_Type"] == "Manual"
 
+    def test_output_columns_are_categorical(self):
+        """Output labels use fixed category vocabularies; TV lookups extend them."""
+        df = pd.DataFrame({
+            "Chart of Accounts No_": ["18412", "18412", "99999"],
+            "Amount": [-75.0, 50.0, 10.0],
+            "User ID": ["JUMIA/NAV31AFR.BATCH.SRVC", "JUMIA/NAV31AFR.BATCH.SRVC", "USER/01"],
+            "Document Description": ["Refund voucher", "Order usage", "Other"],
+            "[Voucher No_]": [None, "V1", None],
+        })
+        ipe_08_df = pd.DataFrame({"id": ["V1"], "business_use": ["marketing"]})
+        for engine in ("vectorized", "row"):
+            result = categorize_nav_vouchers(df, ipe_08_df=ipe_08_df, engine=engine)
+            for col in ("bridge_category", "voucher_type", "Integration_Type"):
+                assert isinstance(result[col].dtype, pd.CategoricalDtype)
+            assert list(result["bridge_category"].cat.categories) == [
+                "Issuance", "Usage", "Cancellation", "Expired", "VTC"
+            ]
+            assert result["bridge_category"].tolist()[:2] == ["Issuance", "Usage"]
+            assert pd.isna(result.loc[2, "bridge_category"])
+            assert result.loc[1, "voucher_type"] == "marketing"
+            assert "marketing" in result["voucher_type"].cat.categories
+
 
 class TestGetCategorizationSummary:
     """Tests for get_categorization_summary function."""
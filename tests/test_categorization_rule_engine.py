@@ -0,0 +1,214 @@
+"""
+Tests for the columnar categorization rule engine.
+
+Checks that the vectorized engine produces the same bridge_category /
+voucher_type output as the original per-row classifiers.
+"""
+
+import itertools
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.core.reconciliation.voucher_classification.cat_pipeline import (
+    categorize_nav_vouchers,
+)
+from src.core.reconciliation.voucher_classification.cat_rule_engine import (
+    CATEGORIZATION_RULES,
+    LOOKUP_VOUCHER_TYPE,
+    apply_categorization_rules,
+)
+
+
+DESCRIPTIONS = [
+    "Refund voucher",
+    "RF_12345",
+    "rf 999 adjustment",
+    "RFN manual",
+    "Commercial Gesture",
+    "Commercial adj",
+    "CXP apology",
+    "PYT_PF payout",
+    "Voucher Accrual reversal",
+    "EXPR_APLGY-2024",
+    "EXPR_JFORCE-2024",
+    "EXPR_STR CRDT-2024",
+    "EXPR_STR_CRDT-2024",
+    "EXPR generic",
+    "Manual RND entry",
+    "ITEMPRICECREDIT NG",
+    "  plain text  ",
+    None,
+]
+USER_IDS = ["JUMIA/NAV31AFR.BATCH.SRVC", "jumia\\nav31afr.batch.srvc", "USER/01", None]
+AMOUNTS = [-100.0, 0.0, 50.0, np.nan]
+BAL_ACCOUNT_TYPES = ["Bank Account", "G/L Account", None]
+DOC_NOS = ["NGSC0001", "DOC-001", None]
+DOC_TYPES = ["Credit Memo", "Invoice", None]
+COMMENTS = ["GTB transfer", "", None]
+
+
+def _build_combinations_frame() -> pd.DataFrame:
+    """Build a frame exercising every rule and its negative cases."""
+    rows = []
+    combinations = itertools.product(DESCRIPTIONS, USER_IDS, AMOUNTS, BAL_ACCOUNT_TYPES)
+    for i, (desc, user, amount, bal_account_type) in enumerate(combinations):
+        rows.append({
+            "Chart of Accounts No_": "13011" if i % 17 == 0 else "18412",
+            "Amount": amount,
+            "User ID": user,
+            "Document Description": desc,
+            "Bal_ Account Type": bal_account_type,
+            "Document No": DOC_NOS[i % len(DOC_NOS)],
+            "Document Type": DOC_TYPES[(i // 3) % len(DOC_TYPES)],
+            "Comment": COMMENTS[(i // 2) % len(COMMENTS)],
+            "[Voucher No_]": f"V{i % 7}" if i % 5 else None,
+        })
+    return pd.DataFrame(rows)
+
+
+@pytest.fixture
+def tv_frames():
+    ipe_08_df = pd.DataFrame({
+        "id": ["V1", "V2", "V3"],
+        "business_use": ["refund", "apology", "store_credit"],
+    })
+    usage_df = pd.DataFrame({
+        "id": ["V4", "V5"],
+        "business_use": ["jforce", "refund"],
+        "Transaction_No": ["DOC-001", "NGSC0001"],
+    })
+    return ipe_08_df, usage_df
+
+
+class TestRuleEngineParity:
+    """The vectorized engine must match the per-row implementation."""
+
+    def test_parity_without_lookups(self):
+        df = _build_combinations_frame()
+        row_result = categorize_nav_vouchers(df, engine="row")
+        vec_result = categorize_nav_vouchers(df, engine="vectorized")
+
+        pd.testing.assert_series_equal(
+            row_result["bridge_category"], vec_result["bridge_category"]
+        )
+        pd.testing.assert_series_equal(
+            row_result["voucher_type"], vec_result["voucher_type"]
+        )
+
+    def test_parity_with_tv_lookups(self, tv_frames):
+        ipe_08_df, usage_df = tv_frames
+        df = _build_combinations_frame()
+        kwargs = {"ipe_08_df": ipe_08_df, "doc_voucher_usage_df": usage_df}
+        row_result = categorize_nav_vouchers(df, engine="row", **kwargs)
+        vec_result = categorize_nav_vouchers(df, engine="vectorized", **kwargs)
+
+        pd.testing.assert_frame_equal(row_result, vec_result)
+
+    def test_every_rule_is_exercised(self):
+        df = _build_combinations_frame()
+        result = categorize_nav_vouchers(df)
+        categorized = result[result["bridge_category"].notna()]
+        observed = set(zip(categorized["bridge_category"], categorized["voucher_type"]))
+        expected = {
+            (rule.bridge_category, rule.voucher_type)
+            for rule in CATEGORIZATION_RULES
+            if rule.voucher_type not in (None, LOOKUP_VOUCHER_TYPE)
+        }
+        assert expected <= observed
+
+    def test_non_default_index(self, tv_frames):
+        ipe_08_df, usage_df = tv_frames
+        df = _build_combinations_frame()
+        df.index = df.index * 10 + 3
+        row_result = categorize_nav_vouchers(df, ipe_08_df, usage_df, engine="row")
+        vec_result = categorize_nav_vouchers(df, ipe_08_df, usage_df, engine="vectorized")
+
+        pd.testing.assert_frame_equal(row_result, vec_result)
+
+
+class TestRowEngineOpenRows:
+    """The row engine classifies the GL rows in place, one open-row mask per step."""
+
+    def test_input_not_modified(self):
+        df = _build_combinations_frame()
+        original = df.copy()
+        categorize_nav_vouchers(df, engine="row")
+        pd.testing.assert_frame_equal(df, original)
+
+    def test_steps_only_see_unclassified_rows(self, monkeypatch):
+        from src.core.reconciliation.voucher_classification import cat_pipeline
+
+        calls = []
+
+        def recording(func):
+            def wrapper(df, **kwargs):
+                row_mask = kwargs["row_mask"]
+                calls.append((id(df), kwargs.get("inplace"), int(row_mask.sum())))
+                assert df.loc[row_mask, "bridge_category"].isna().all()
+                return func(df, **kwargs)
+            return wrapper
+
+        for name in ("classify_issuance", "classify_expired", "classify_manual_cancellation"):
+            monkeypatch.setattr(cat_pipeline, name, recording(getattr(cat_pipeline, name)))
+
+        df = _build_combinations_frame()
+        gl_rows = int((df["Chart of Accounts No_"] == "18412").sum())
+        result = categorize_nav_vouchers(df, engine="row")
+
+        assert len(calls) == 3
+        assert len({frame_id for frame_id, _, _ in calls}) == 1
+        assert all(inplace for _, inplace, _ in calls)
+        open_counts = [count for _, _, count in calls]
+        assert open_counts == sorted(open_counts, reverse=True)
+        assert open_counts[0] < gl_rows
+        pd.testing.assert_series_equal(
+            result["bridge_category"],
+            categorize_nav_vouchers(df, engine="vectorized")["bridge_category"],
+        )
+
+
+class TestApplyCategorizationRules:
+    """Tests for apply_categorization_rules."""
+
+    def test_first_match_wins(self):
+        df = pd.DataFrame({
+            "Amount": [-10.0],
+            "Document Description": ["REFUND COMMERCIAL GESTURE PYT_"],
+            "Integration_Type": ["Integration"],
+        })
+        result = apply_categorization_rules(df)
+        assert result.loc[0, "bridge_category"] == "Issuance"
+        assert result.loc[0, "voucher_type"] == "Refund"
+
+    def test_existing_category_is_preserved(self):
+        df = pd.DataFrame({
+            "Amount": [-10.0, -10.0],
+            "Document Description": ["Refund", "Refund"],
+            "Integration_Type": ["Integration", "Integration"],
+            "bridge_category": ["VTC", None],
+            "voucher_type": ["Refund", None],
+        })
+        result = apply_categorization_rules(df)
+        assert result["bridge_category"].tolist() == ["VTC", "Issuance"]
+
+    def test_row_mask_restricts_rows(self):
+        df = pd.DataFrame({
+            "Amount": [-10.0, -10.0],
+            "Document Description": ["Refund", "Refund"],
+            "Integration_Type": ["Integration", "Integration"],
+        })
+        result = apply_categorization_rules(df, row_mask=pd.Series([False, True]))
+        assert pd.isna(result.loc[0, "bridge_category"])
+        assert result.loc[1, "bridge_category"] == "Issuance"
+
+    def test_missing_amount_column(self):
+        df = pd.DataFrame({"Document Description": ["Refund"]})
+        result = apply_categorization_rules(df)
+        assert pd.isna(result.loc[0, "bridge_category"])
+
+    def test_unknown_engine_raises(self):
+        df = pd.DataFrame({"Amount": [1.0]})
+        with pytest.raises(ValueError):
+            categorize_nav_vouchers(df, engine="spark")
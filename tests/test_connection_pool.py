@@ -0,0 +1,213 @@
+"""
+Tests for the shared database connection pool and its IPERunner integration.
+"""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pyodbc
+import pytest
+
+from src.core.extraction_pipeline import ExtractionPipeline
+from src.core.runners.connection_pool import (
+    ConnectionPool,
+    connection_pool_name,
+    get_connection_pool,
+)
+from src.core.runners.mssql_runner import IPEConnectionError
+
+
+def _connect_factory():
+    """Connect callable producing distinct mock connections."""
+    return MagicMock(side_effect=lambda: MagicMock(name="connection"))
+
+
+class TestConnectionPool:
+    """Tests for ConnectionPool."""
+
+    def test_released_connection_is_reused(self):
+        pool = ConnectionPool(max_size=2)
+        connect = _connect_factory()
+
+        first = pool.acquire(connect)
+        pool.release(first)
+        second = pool.acquire(connect)
+
+        assert second is first
+        assert connect.call_count == 1
+        assert pool.stats["reused"] == 1
+        first.cursor.return_value.execute.assert_called_with("SELECT 1")
+
+    def test_unhealthy_connection_is_replaced(self):
+        pool = ConnectionPool()
+        connect = _connect_factory()
+        broken = pool.acquire(connect)
+        pool.release(broken)
+        broken.cursor.side_effect = pyodbc.Error("communication link failure")
+
+        replacement = pool.acquire(connect)
+
+        assert replacement is not broken
+        broken.close.assert_called_once()
+        assert pool.stats["discarded"] == 1
+
+    def test_health_check_skipped_for_recent_connections(self):
+        pool = ConnectionPool(health_check_interval=60)
+        connection = pool.acquire(_connect_factory())
+        pool.release(connection)
+
+        assert pool.acquire(_connect_factory()) is connection
+        connection.cursor.assert_not_called()
+
+    def test_idle_connections_are_evicted(self):
+        pool = ConnectionPool(idle_timeout=0)
+        connect = _connect_factory()
+        stale = pool.acquire(connect)
+        pool.release(stale)
+
+        fresh = pool.acquire(connect)
+
+        assert fresh is not stale
+        stale.close.assert_called_once()
+        assert pool.stats["evicted"] == 1
+
+    def test_max_size_blocks_until_release(self):
+        pool = ConnectionPool(max_size=1, acquire_timeout=5)
+        connect = _connect_factory()
+        held = pool.acquire(connect)
+        acquired = []
+
+        waiter = threading.Thread(target=lambda: acquired.append(pool.acquire(connect)))
+        waiter.start()
+        waiter.join(timeout=0.2)
+        assert acquired == []
+
+        pool.release(held)
+        waiter.join(timeout=5)
+        assert acquired == [held]
+        assert pool.size == 1
+
+    def test_acquire_timeout(self):
+        pool = ConnectionPool(max_size=1, acquire_timeout=0.05)
+        pool.acquire(_connect_factory())
+        with pytest.raises(TimeoutError):
+            pool.acquire(_connect_factory())
+
+    def test_failed_connect_frees_slot(self):
+        pool = ConnectionPool(max_size=1)
+        with pytest.raises(pyodbc.Error):
+            pool.acquire(MagicMock(side_effect=pyodbc.Error("login failed")))
+        assert pool.size == 0
+        assert pool.acquire(_connect_factory()) is not None
+
+    def test_context_manager_discards_on_error(self):
+        pool = ConnectionPool()
+        with pytest.raises(RuntimeError):
+            with pool.connection(_connect_factory()) as connection:
+                raise RuntimeError("query failed")
+        connection.close.assert_called_once()
+        assert pool.size == 0
+
+    def test_named_pools_are_shared(self):
+        assert get_connection_pool("test-shared") is get_connection_pool("test-shared")
+        assert get_connection_pool("test-shared") is not get_connection_pool("test-other")
+
+    def test_pool_name_keys_on_credentials(self):
+        assert connection_pool_name("secret-a") == connection_pool_name("secret-a")
+        assert connection_pool_name("secret-a") != connection_pool_name("secret-b")
+        # An explicit connection string wins over the secret and is not exposed
+        by_string = connection_pool_name("secret-a", connection_string="DSN=nav;PWD=x")
+        assert by_string == connection_pool_name("secret-b", connection_string="DSN=nav;PWD=x")
+        assert by_string != connection_pool_name("secret-a", connection_string="DSN=bob;PWD=x")
+        assert "PWD" not in by_string
+
+
+VALIDATION = {"completeness_query": "SELECT COUNT(*) FROM t WHERE d < ?"}
+
+
+class TestIPERunnerPooling:
+    """IPERunner borrows connections from a shared pool."""
+
+    def test_runs_share_one_connection(self, make_ipe_runner):
+        pool = ConnectionPool()
+        connect = _connect_factory()
+        results = iter([pd.DataFrame({"a": [1, 2]}), pd.DataFrame({"n": [2]})] * 2)
+
+        with patch("src.core.runners.mssql_runner.pd.read_sql", side_effect=lambda *a, **k: next(results)):
+            for _ in range(2):
+                runner = make_ipe_runner("TEST_POOL", validation=VALIDATION,
+                                         connection_pool=pool, connect=connect)
+                runner.run()
+                assert runner.connection is None
+
+        assert connect.call_count == 1
+        assert pool.stats["reused"] == 1
+        assert pool.size == 1
+
+    def test_runners_with_different_secrets_use_separate_pools(self, make_ipe_runner, monkeypatch):
+        monkeypatch.delenv("DB_CONNECTION_STRING", raising=False)
+        pipeline = ExtractionPipeline({"cutoff_date": "2025-09-30"})
+        connect = {name: _connect_factory() for name in ("test-secret-a", "test-secret-b")}
+        results = iter([pd.DataFrame({"a": [1, 2]}), pd.DataFrame({"n": [2]})] * 3)
+        runners = []
+
+        with patch("src.core.runners.mssql_runner.pd.read_sql", side_effect=lambda *a, **k: next(results)):
+            for secret_name in ("test-secret-a", "test-secret-b", "test-secret-a"):
+                ipe_config = {"secret_name": secret_name}
+                runner = make_ipe_runner(
+                    "TEST_POOL", validation=VALIDATION, secret_name=secret_name,
+                    connection_pool=pipeline._connection_pool_for(ipe_config),
+                    connect=connect[secret_name],
+                )
+                runner.run()
+                runners.append(runner)
+
+        assert runners[0].connection_pool is runners[2].connection_pool
+        assert runners[0].connection_pool is not runners[1].connection_pool
+        assert connect["test-secret-a"].call_count == 1
+        assert connect["test-secret-b"].call_count == 1
+        assert runners[1].connection_pool.stats["reused"] == 0
+
+    def test_pipeline_pool_follows_connection_string(self, monkeypatch):
+        pipeline = ExtractionPipeline({"cutoff_date": "2025-09-30"})
+        ipe_config = {"secret_name": "fake"}
+
+        monkeypatch.setenv("DB_CONNECTION_STRING", "DSN=test-a")
+        pool_a = pipeline._connection_pool_for(ipe_config)
+        monkeypatch.setenv("DB_CONNECTION_STRING", "DSN=test-b")
+        pool_b = pipeline._connection_pool_for(ipe_config)
+
+        assert pool_a is not pool_b
+        assert ExtractionPipeline({"use_connection_pool": False})._connection_pool_for(ipe_config) is None
+
+    def test_retry_replaces_broken_connection(self, make_ipe_runner):
+        pool = ConnectionPool()
+        runner = make_ipe_runner("TEST_POOL", validation=VALIDATION,
+                                 connection_pool=pool, connect=_connect_factory())
+        runner.connection = pool.acquire(runner._get_database_connection)
+        broken = runner.connection
+        calls = []
+
+        def read_sql(query, connection, params=None):
+            calls.append(connection)
+            if len(calls) == 1:
+                raise pyodbc.OperationalError("communication link failure")
+            return pd.DataFrame({"n": [1]})
+
+        with patch("src.core.runners.mssql_runner.pd.read_sql", side_effect=read_sql), \
+                patch("src.core.runners.mssql_runner.time.sleep"):
+            runner._execute_query_with_parameters("SELECT 1", ())
+
+        assert calls[0] is broken
+        assert calls[1] is not broken
+        broken.close.assert_called_once()
+        assert runner.connection is calls[1]
+
+    def test_pool_timeout_raises_connection_error(self, make_ipe_runner):
+        pool = ConnectionPool(max_size=1, acquire_timeout=0.01)
+        pool.acquire(_connect_factory())
+        runner = make_ipe_runner("TEST_POOL", validation=VALIDATION, connection_pool=pool)
+
+        with pytest.raises(IPEConnectionError):
+            runner._acquire_connection()
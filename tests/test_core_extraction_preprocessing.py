@@ -376,6 +376,58 @@ class TestExtractionPipelineLoadAllData:
         assert source_store["IPE_08_ISSUANCE"] == source_store["IPE_08"]
         assert source_store["IPE_08_USAGE"] == source_store["DOC_VOUCHER_USAGE"]
 
+    def test_concurrent_mode_preserves_order_and_aliases(self):
+        """Concurrent extraction should keep required_ipes ordering and IPE_08 aliases."""
+        import threading
+        import time
+
+        params = {
+            "company": "EC_NG",
+            "cutoff_date": "2025-09-30",
+            "id_companies_active": "('EC_NG')",
+        }
+        required = ["CR_03", "IPE_08", "DOC_VOUCHER_USAGE", "CR_05"]
+        delays = {"CR_03": 0.05, "IPE_08": 0.02, "IPE_08_USAGE": 0.0, "CR_05": 0.01}
+        worker_threads = set()
+
+        def fake_run(item_id):
+            worker_threads.add(threading.current_thread().name)
+            time.sleep(delays[item_id])
+            return pd.DataFrame([{"ID_COMPANY": "EC_NG", "item": item_id}]), f"{item_id}.zip"
+
+        progress = []
+
+        def on_progress(item_id, pct, message):
+            progress.append((item_id, pct, threading.current_thread().name))
+
+        with patch("src.core.extraction_pipeline.ExtractionPipeline") as mock_pipeline_class:
+            mock_pipeline = mock_pipeline_class.return_value
+            mock_pipeline.filter_by_country.side_effect = lambda df: df
+            mock_pipeline.last_extraction_source = "live"
+            mock_pipeline.run_extraction_with_evidence.side_effect = lambda item_id: item_id
+
+            with patch("asyncio.run", side_effect=fake_run):
+                data_store, evidence_store, source_store = load_all_data(
+                    params=params,
+                    required_ipes=required,
+                    progress_callback=on_progress,
+                    max_workers=4,
+                )
+
+        assert list(data_store)[:3] == ["CR_03", "IPE_08", "IPE_08_USAGE"]
+        assert data_store["CR_03"]["item"].iloc[0] == "CR_03"
+        assert evidence_store["CR_05"] == "CR_05.zip"
+        assert source_store["IPE_08"] == "Live Database"
+        assert data_store["DOC_VOUCHER_USAGE"] is data_store["IPE_08_USAGE"]
+        assert data_store["IPE_08_ISSUANCE"] is data_store["IPE_08"]
+        assert all(name.startswith("ipe-extract") for name in worker_threads)
+
+        # Progress is reported once per item from the calling thread, ending at 1.0
+        assert sorted(item for item, _, _ in progress) == sorted(["CR_03", "IPE_08", "IPE_08_USAGE", "CR_05"])
+        assert [pct for _, pct, _ in progress] == sorted(pct for _, pct, _ in progress)
+        assert progress[-1][1] == 1.0
+        assert {thread for _, _, thread in progress} == {threading.current_thread().name}
+
 
 # ============================================================================
 # Tests for evidence_locator.py
@@ -0,0 +1,178 @@
+"""
+Tests for the local Arrow dataset cache used by the extraction pipeline.
+"""
+
+import asyncio
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from src.core.dataset_cache import (
+    DatasetCache,
+    build_cache_key,
+    read_csv_cached,
+)
+from src.core.extraction_pipeline import ExtractionPipeline
+from src.core.jdash_loader import load_jdash_data
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return DatasetCache(str(tmp_path / "cache"))
+
+
+@pytest.fixture
+def sample_df():
+    return pd.DataFrame({
+        "id_company": ["EC_NG", "EC_KE"],
+        "amount": [10.5, None],
+        "posting_date": pd.to_datetime(["2025-09-01", "2025-09-30"]),
+    })
+
+
+class TestDatasetCacheKey:
+    """Every key part must change the cache entry."""
+
+    def test_same_inputs_same_key(self):
+        key_a = build_cache_key("IPE_07", sql="SELECT 1", params={"cutoff_date": "2025-09-30"})
+        key_b = build_cache_key("IPE_07", sql="SELECT 1", params={"cutoff_date": "2025-09-30"})
+        assert key_a.digest == key_b.digest
+
+    @pytest.mark.parametrize("changes", [
+        {"item_id": "IPE_08"},
+        {"sql": "SELECT 2"},
+        {"params": {"cutoff_date": "2025-10-31"}},
+        {"contract_hash": "other"},
+    ])
+    def test_each_part_changes_digest(self, changes):
+        base = {"item_id": "IPE_07", "sql": "SELECT 1",
+                "params": {"cutoff_date": "2025-09-30"}, "contract_hash": "abc"}
+        assert build_cache_key(**base).digest != build_cache_key(**{**base, **changes}).digest
+
+    def test_contract_hash_defaults_to_active_contract(self):
+        key = build_cache_key("IPE_07", sql="SELECT 1")
+        assert key.contract_hash != ""
+        assert build_cache_key("NO_SUCH_ITEM", sql="SELECT 1").contract_hash == ""
+
+
+class TestDatasetCache:
+    """Round-trip and configuration of the Arrow cache."""
+
+    def test_put_get_round_trip(self, cache, sample_df):
+        key = build_cache_key("IPE_07", sql="SELECT 1")
+        assert cache.get(key) is None
+
+        path = cache.put(key, sample_df, metadata={"evidence_zip": "/tmp/x.zip"})
+
+        assert path.suffix == ".arrow"
+        pd.testing.assert_frame_equal(cache.get(key), sample_df)
+        assert cache.get_metadata(key)["evidence_zip"] == "/tmp/x.zip"
+
+    def test_none_in_string_columns_stays_none(self, cache):
+        key = build_cache_key("IPE_07", sql="SELECT 1")
+        cache.put(key, pd.DataFrame({"a": ["x", None]}))
+
+        assert cache.get(key)["a"].tolist() == ["x", None]
+
+    def test_unsupported_frame_is_skipped(self, cache):
+        key = build_cache_key("IPE_07", sql="SELECT 1")
+        assert cache.put(key, pd.DataFrame({"a": ["x", 1]})) is None
+        assert cache.get(key) is None
+
+    def test_invalidate_item(self, cache, sample_df):
+        key = build_cache_key("IPE_07", sql="SELECT 1")
+        cache.put(key, sample_df)
+        cache.invalidate("IPE_07")
+        assert cache.get(key) is None
+
+    def test_from_params(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("SOX_DATASET_CACHE_DIR", raising=False)
+        assert DatasetCache.from_params({}) is None
+        assert DatasetCache.from_params({"dataset_cache_dir": str(tmp_path)}).cache_dir == tmp_path
+
+        monkeypatch.setenv("SOX_DATASET_CACHE_DIR", str(tmp_path))
+        assert DatasetCache.from_params({}).cache_dir == tmp_path
+        assert DatasetCache.from_params({"use_dataset_cache": False}) is None
+
+
+class TestReadCsvCached:
+    """CSV sources are parsed once while the file is unchanged."""
+
+    def test_second_read_hits_cache(self, tmp_path, cache):
+        csv_path = tmp_path / "fixture_JDASH.csv"
+        csv_path.write_text("Voucher Id,Amount Used\nV1,10\nV2,20\n")
+
+        first = read_csv_cached(str(csv_path), "JDASH", cache, low_memory=False)
+        with patch("src.core.dataset_cache.pd.read_csv") as mock_read:
+            second = read_csv_cached(str(csv_path), "JDASH", cache, low_memory=False)
+
+        mock_read.assert_not_called()
+        pd.testing.assert_frame_equal(first, second)
+
+    def test_cached_read_keeps_nan_in_string_columns(self, tmp_path, cache):
+        csv_path = tmp_path / "fixture.csv"
+        csv_path.write_text("voucher_id,comment,amount\nV1,ok,10\nV2,,\n,x,30\n")
+
+        uncached = pd.read_csv(csv_path)
+        read_csv_cached(str(csv_path), "JDASH", cache)
+        cached = read_csv_cached(str(csv_path), "JDASH", cache)
+
+        pd.testing.assert_frame_equal(cached, uncached)
+        assert cached["comment"].tolist()[1] is not None
+        for column in ("voucher_id", "comment"):
+            assert cached[column].astype(str).tolist() == uncached[column].astype(str).tolist()
+
+    def test_modified_file_misses_cache(self, tmp_path, cache):
+        csv_path = tmp_path / "fixture.csv"
+        csv_path.write_text("a\n1\n")
+        read_csv_cached(str(csv_path), "JDASH", cache)
+        csv_path.write_text("a\n1\n2\n")
+
+        assert len(read_csv_cached(str(csv_path), "JDASH", cache)) == 2
+
+    def test_jdash_loader_uses_cache(self, tmp_path, cache):
+        csv_path = tmp_path / "jdash.csv"
+        csv_path.write_text("voucher_id,amount_used\nV1,10\n")
+
+        load_jdash_data(str(csv_path), cache=cache)
+        with patch("src.core.dataset_cache.pd.read_csv") as mock_read:
+            df, _ = load_jdash_data(str(csv_path), cache=cache)
+
+        mock_read.assert_not_called()
+        assert list(df.columns) == ["Voucher Id", "Amount Used"]
+
+
+class TestExtractionPipelineCache:
+    """A cache hit takes priority over live SQL extraction."""
+
+    def test_cache_hit_skips_live_extraction(self, tmp_path, sample_df):
+        params = {"cutoff_date": "2025-09-30", "company": "EC_NG",
+                  "dataset_cache_dir": str(tmp_path / "cache")}
+        pipeline = ExtractionPipeline(params)
+
+        with patch("src.core.extraction_pipeline.IPERunner") as mock_runner, \
+                patch("src.core.extraction_pipeline.get_latest_evidence_zip", return_value=None):
+            mock_runner.return_value.run.return_value = sample_df
+            first, _ = asyncio.run(pipeline.run_extraction_with_evidence("IPE_07"))
+            assert pipeline.last_extraction_source == "live"
+
+            second, zip_path = asyncio.run(pipeline.run_extraction_with_evidence("IPE_07"))
+
+        assert mock_runner.return_value.run.call_count == 1
+        assert pipeline.last_extraction_source == "cache"
+        assert zip_path is None
+        pd.testing.assert_frame_equal(second, sample_df)
+
+    def test_cutoff_change_misses_cache(self, tmp_path, sample_df):
+        cache_dir = str(tmp_path / "cache")
+        with patch("src.core.extraction_pipeline.IPERunner") as mock_runner, \
+                patch("src.core.extraction_pipeline.get_latest_evidence_zip", return_value=None):
+            mock_runner.return_value.run.return_value = sample_df
+            for cutoff_date in ("2025-09-30", "2025-10-31"):
+                pipeline = ExtractionPipeline({"cutoff_date": cutoff_date, "company": "EC_NG",
+                                               "dataset_cache_dir": cache_dir})
+                asyncio.run(pipeline.run_extraction_with_evidence("IPE_07"))
+                assert pipeline.last_extraction_source == "live"
+
+        assert mock_runner.return_value.run.call_count == 2
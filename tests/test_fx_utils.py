@@ -224,5 +224,85 @@ def test_fx_converter_real_world_scenario():
     assert ng_amount_usd == pytest.approx(1000.0, rel=1e-6)
 
 
+def test_convert_series_matches_scalar_conversion():
+    """Test that vectorized series conversion matches convert_to_usd element-wise."""
+    cr05_df = pd.DataFrame({
+        'Company_Code': ['JD_GH', 'EC_NG'],
+        'FX_rate': [15.5, 4.0]
+    })
+    
+    converter = FXConverter(cr05_df, default_rate=2.0)
+    
+    amounts = pd.Series([1550.0, None, 100.0, 40.0, float('nan')], index=[5, 6, 7, 8, 9])
+    companies = pd.Series(['JD_GH', 'EC_NG', 'UNKNOWN', None, 'JD_GH'], index=[5, 6, 7, 8, 9])
+    
+    result = converter.convert_series_to_usd(amounts, companies)
+    
+    assert list(result.index) == [5, 6, 7, 8, 9]
+    for idx in amounts.index:
+        expected = converter.convert_to_usd(amounts[idx], companies[idx])
+        assert result[idx] == pytest.approx(expected, rel=1e-9)
+
+
+def test_lookup_rates_flags_missing():
+    """Test that lookup_rates applies the default rate and flags missing companies."""
+    cr05_df = pd.DataFrame({
+        'Company_Code': ['JD_GH'],
+        'FX_rate': [15.5]
+    })
+    
+    converter = FXConverter(cr05_df, default_rate=1.0)
+    
+    rates, missing = converter.lookup_rates(pd.Series(['JD_GH', 'UNKNOWN', None, 'JD_GH']))
+    
+    assert list(rates) == [15.5, 1.0, 1.0, 15.5]
+    assert list(missing) == [False, True, True, False]
+
+
+def test_convert_columns_to_usd():
+    """Test multi-column conversion with fx_rate_used and fx_missing audit fields."""
+    cr05_df = pd.DataFrame({
+        'Company_Code': ['EC_NG'],
+        'FX_rate': [1650.0]
+    })
+    
+    converter = FXConverter(cr05_df)
+    
+    df = pd.DataFrame({
+        'nav_amount_local': [3300.0, 100.0],
+        'tv_amount_local': [1650.0, None],
+        'company_code': ['EC_NG', 'EC_XX'],
+    })
+    
+    result = converter.convert_columns_to_usd(
+        df,
+        {'nav_amount_local': 'nav_amount_usd', 'tv_amount_local': 'tv_amount_usd'},
+        company_code_col='company_code',
+    )
+    
+    assert list(result.columns) == ['nav_amount_usd', 'tv_amount_usd', 'fx_rate_used', 'fx_missing']
+    assert result.loc[0, 'nav_amount_usd'] == pytest.approx(2.0, rel=1e-6)
+    assert result.loc[0, 'tv_amount_usd'] == pytest.approx(1.0, rel=1e-6)
+    assert result.loc[0, 'fx_rate_used'] == 1650.0
+    assert not result.loc[0, 'fx_missing']
+    # Unknown company: default rate applied, rate flagged missing, NaN amount -> 0.0
+    assert result.loc[1, 'nav_amount_usd'] == pytest.approx(100.0, rel=1e-6)
+    assert result.loc[1, 'tv_amount_usd'] == 0.0
+    assert pd.isna(result.loc[1, 'fx_rate_used'])
+    assert result.loc[1, 'fx_missing']
+
+
+def test_convert_columns_to_usd_missing_column():
+    """Test that multi-column conversion validates input columns."""
+    converter = FXConverter(pd.DataFrame({'Company_Code': ['EC_NG'], 'FX_rate': [1650.0]}))
+    
+    with pytest.raises(ValueError, match="missing required columns"):
+        converter.convert_columns_to_usd(
+            pd.DataFrame({'nav_amount_local': [1.0]}),
+            {'nav_amount_local': 'nav_amount_usd'},
+            company_code_col='company_code',
+        )
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
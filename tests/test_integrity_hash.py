@@ -0,0 +1,134 @@
+"""
+Tests for the versioned integrity hash schemes used in evidence packages.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.core.evidence.integrity import (
+    DEFAULT_HASH_ALGORITHM,
+    HASH_ALGORITHM_LEGACY,
+    compute_integrity_hash,
+    get_hasher,
+    verify_integrity_hash,
+)
+from src.core.evidence.manager import EvidenceValidator, IPEEvidenceGenerator
+
+
+@pytest.fixture
+def sample_df():
+    return pd.DataFrame({
+        "id_company": ["EC_NG", "EC_KE", "EC_NG", None],
+        "entry_no": [3, 1, 2, 4],
+        "amount": [10.5, -2.0, np.nan, 1e20],
+        "posting_date": pd.to_datetime(["2025-01-31", "2025-02-01", None, "2025-03-15"]),
+        "flag": [True, False, True, False],
+    })
+
+
+class TestSortedRowDigestHasher:
+    """Tests for the default order-independent scheme."""
+
+    def test_row_order_does_not_matter(self, sample_df):
+        shuffled = sample_df.sample(frac=1, random_state=7)
+        assert compute_integrity_hash(sample_df) == compute_integrity_hash(shuffled)
+
+    def test_chunked_equals_single_pass(self, sample_df):
+        chunks = [sample_df.iloc[2:], sample_df.iloc[:1], sample_df.iloc[1:2]]
+        assert compute_integrity_hash(chunks) == compute_integrity_hash(sample_df)
+
+    def test_detects_value_change(self, sample_df):
+        tampered = sample_df.copy()
+        tampered.loc[0, "amount"] = 10.51
+        assert compute_integrity_hash(tampered) != compute_integrity_hash(sample_df)
+
+    def test_detects_duplicate_row(self, sample_df):
+        duplicated = pd.concat([sample_df, sample_df.iloc[[0]]], ignore_index=True)
+        assert compute_integrity_hash(duplicated) != compute_integrity_hash(sample_df)
+
+    def test_detects_column_rename(self, sample_df):
+        renamed = sample_df.rename(columns={"amount": "amount_lcy"})
+        assert compute_integrity_hash(renamed) != compute_integrity_hash(sample_df)
+
+    def test_null_and_empty_string_differ(self):
+        with_null = pd.DataFrame({"a": [None]}, dtype=object)
+        with_empty = pd.DataFrame({"a": [""]})
+        assert compute_integrity_hash(with_null) != compute_integrity_hash(with_empty)
+
+    def test_stable_across_int_float_round_trip(self):
+        ints = pd.DataFrame({"a": [1, 2, 3]})
+        floats = pd.DataFrame({"a": [1.0, 2.0, 3.0]})
+        assert compute_integrity_hash(ints) == compute_integrity_hash(floats)
+
+    def test_matches_documented_scheme(self):
+        df = pd.DataFrame({"a": ["x", None, "x"], "b": [1.0, 2.5, np.nan]})
+        canonical = pd.DataFrame({"a": ["x", None, "x"], "b": ["1", "2.5", None]}, dtype=object)
+        h1, h2 = (
+            pd.util.hash_pandas_object(canonical, index=False, hash_key=key).to_numpy()
+            for key in ("sox-integrity-k1", "sox-integrity-k2")
+        )
+        order = np.lexsort((h2, h1))
+        expected = hashlib.sha256(
+            f"{DEFAULT_HASH_ALGORITHM}\n".encode("utf-8")
+            + hashlib.sha256(b"1:a1:b").digest()
+            + (3).to_bytes(8, "big")
+            + np.column_stack([h1, h2])[order].astype(">u8").tobytes()
+        ).hexdigest()
+
+        assert compute_integrity_hash(df) == expected
+
+    def test_mismatched_chunk_columns_raise(self):
+        hasher = get_hasher()
+        hasher.update(pd.DataFrame({"a": [1]}))
+        with pytest.raises(ValueError):
+            hasher.update(pd.DataFrame({"b": [1]}))
+
+
+class TestLegacySchemes:
+    """Legacy algorithms remain available for verification."""
+
+    def test_legacy_matches_original_algorithm(self, sample_df):
+        df_sorted = sample_df.sort_values(by=list(sample_df.columns)).reset_index(drop=True)
+        expected = hashlib.sha256(df_sorted.to_csv(index=False).encode("utf-8")).hexdigest()
+        assert compute_integrity_hash(sample_df, HASH_ALGORITHM_LEGACY) == expected
+
+    def test_unknown_algorithm(self):
+        with pytest.raises(ValueError):
+            get_hasher("MD5")
+
+    def test_verify_without_algorithm_uses_legacy(self, sample_df):
+        legacy_hash = compute_integrity_hash(sample_df, HASH_ALGORITHM_LEGACY)
+        assert verify_integrity_hash(sample_df, {"hash_value": legacy_hash})
+
+
+class TestEvidenceIntegration:
+    """Evidence files record the algorithm id and can be verified."""
+
+    def test_generate_records_algorithm(self, tmp_path, sample_df):
+        generator = IPEEvidenceGenerator(str(tmp_path), "IPE_07")
+        hash_value = generator.generate_integrity_hash(sample_df)
+
+        hash_info = json.loads((Path(tmp_path) / "05_integrity_hash.json").read_text())
+        assert hash_info["algorithm"] == DEFAULT_HASH_ALGORITHM
+        assert hash_info["hash_value"] == hash_value
+        assert (Path(tmp_path) / "05_integrity_hash.sha256").read_text() == hash_value
+
+    @pytest.mark.parametrize("algorithm", [HASH_ALGORITHM_LEGACY, DEFAULT_HASH_ALGORITHM])
+    def test_validator_verifies_data(self, tmp_path, sample_df, algorithm):
+        generator = IPEEvidenceGenerator(str(tmp_path), "IPE_07")
+        generator.generate_integrity_hash(sample_df, algorithm=algorithm)
+
+        results = EvidenceValidator.verify_package_integrity(str(tmp_path), data=sample_df)
+        assert results["hash_algorithm"] == algorithm
+        assert results["data_hash_verified"] is True
+
+        tampered = sample_df.copy()
+        tampered.loc[1, "entry_no"] = 99
+        results = EvidenceValidator.verify_package_integrity(str(tmp_path), data=tampered)
+        assert results["data_hash_verified"] is False
+        assert "Data hash mismatch" in results["issues_found"]
@@ -143,6 +143,41 @@ class TestCoerceNumericSeries:
         assert result[0] == 1500.0
         assert result[1] == 0.02
         assert result[2] == 1000000.0
+    
+    def test_missing_and_blank_values_become_nan(self):
+        """Test that None/NaN/NaT/NA and whitespace-only strings become NaN."""
+        s = pd.Series(['1,000', None, np.nan, pd.NaT, pd.NA, '', ' , ', '\t'], dtype=object)
+        result = coerce_numeric_series(s)
+        
+        assert result[0] == 1000.0
+        assert result[1:].isna().all()
+    
+    def test_non_string_objects_converted_with_str(self):
+        """Test that non-string values in mixed columns go through str()."""
+        s = pd.Series([1.5, '2,500', True, None], dtype=object)
+        result = coerce_numeric_series(s)
+        
+        assert result[0] == 1.5
+        assert result[1] == 2500.0
+        assert np.isnan(result[2])  # 'True' is not a number
+        assert np.isnan(result[3])
+    
+    def test_numeric_object_column_fast_path(self):
+        """Test that object columns of numbers (e.g. SQL decimals) are coerced directly."""
+        from decimal import Decimal
+        s = pd.Series([Decimal('1234.50'), None, Decimal('-3')], index=[5, 6, 7], name='amount')
+        result = coerce_numeric_series(s, fillna=0.0)
+        
+        assert result.tolist() == [1234.5, 0.0, -3.0]
+        assert list(result.index) == [5, 6, 7]
+        assert result.name == 'amount'
+    
+    def test_unicode_whitespace_stripped(self):
+        """Test that leading/trailing unicode whitespace is stripped like str.strip()."""
+        s = pd.Series(['\xa01 234\u3000', '\n-5\r'])
+        result = coerce_numeric_series(s)
+        
+        assert result.tolist() == [1234.0, -5.0]
 
 
 class TestCastAmountColumns:
@@ -0,0 +1,108 @@
+"""
+Tests for running the SOX validation queries concurrently on pooled connections.
+"""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+
+from src.core.runners.connection_pool import ConnectionPool
+from src.core.runners.mssql_runner import IPEValidationError
+
+MAIN_QUERY = "SELECT * FROM t WHERE d < ?"
+VALIDATION = {
+    "completeness_query": "SELECT COUNT(*) FROM t WHERE d < ?",
+    "accuracy_positive_query": "SELECT COUNT(*) FROM t WHERE id = 'W1'",
+    "accuracy_negative_query": "SELECT COUNT(*) FROM t WHERE id = 'X'",
+}
+
+
+def _new_connection():
+    """Distinct mock connection for every pooled checkout."""
+    return MagicMock(name="connection")
+
+
+IPE = dict(ipe_id="TEST_PARALLEL", main_query=MAIN_QUERY, validation=VALIDATION,
+           connect=_new_connection)
+
+
+def _fake_read_sql(results, barrier=None):
+    """read_sql returning canned results per query, recording the connection used."""
+    used = {}
+
+    def read_sql(query, connection, params=None):
+        used[query] = (connection, threading.current_thread().name)
+        if barrier is not None and query != MAIN_QUERY:
+            barrier.wait(timeout=5)
+        return results[query]
+
+    return read_sql, used
+
+
+def _results(completeness=2, positive=1, negative=0):
+    return {
+        MAIN_QUERY: pd.DataFrame({"a": [1, 2]}),
+        VALIDATION["completeness_query"]: pd.DataFrame({"n": [completeness]}),
+        VALIDATION["accuracy_positive_query"]: pd.DataFrame({"n": [positive]}),
+        VALIDATION["accuracy_negative_query"]: pd.DataFrame({"n": [negative]}),
+    }
+
+
+class TestParallelValidations:
+    """SOX validations overlap each other and evidence generation."""
+
+    def test_validations_run_concurrently_on_distinct_connections(self, make_ipe_runner):
+        pool = ConnectionPool()
+        runner = make_ipe_runner(connection_pool=pool, **IPE)
+        # All three validations must be in flight at once to pass the barrier
+        read_sql, used = _fake_read_sql(_results(), barrier=threading.Barrier(3))
+
+        with patch("src.core.runners.mssql_runner.pd.read_sql", side_effect=read_sql):
+            runner.run()
+
+        validation_connections = {used[query][0] for query in VALIDATION.values()}
+        assert len(validation_connections) == 3
+        assert all(used[query][1].startswith("sox-validation") for query in VALIDATION.values())
+        assert runner.validation_results["overall_status"] == "SUCCESS"
+        assert list(runner.validation_results)[:3] == [
+            "completeness", "accuracy_positive", "accuracy_negative"
+        ]
+        assert pool.size == 3
+        assert runner.connection is None
+
+    def test_first_failure_in_canonical_order_is_raised(self, make_ipe_runner):
+        runner = make_ipe_runner(connection_pool=ConnectionPool(), **IPE)
+        read_sql, _ = _fake_read_sql(_results(completeness=5, negative=3))
+
+        with patch("src.core.runners.mssql_runner.pd.read_sql", side_effect=read_sql):
+            with pytest.raises(IPEValidationError, match="Completeness"):
+                runner.run()
+
+        assert runner.validation_results["completeness"]["status"] == "FAIL"
+        assert runner.validation_results["accuracy_positive"]["status"] == "PASS"
+        assert runner.validation_results["accuracy_negative"]["status"] == "FAIL"
+        assert runner.validation_results["overall_status"] == "FAILED"
+
+    def test_evidence_generated_alongside_validations(self, make_ipe_runner, tmp_path):
+        runner = make_ipe_runner(connection_pool=ConnectionPool(), **IPE)
+        read_sql, _ = _fake_read_sql(_results())
+
+        with patch("src.core.runners.mssql_runner.pd.read_sql", side_effect=read_sql):
+            runner.run()
+
+        assert runner.validation_results["data_integrity_hash"]
+        assert list((tmp_path / "evidence").rglob("05_integrity_hash.json"))
+
+    @pytest.mark.parametrize("pool,parallel", [(None, True), (ConnectionPool(), False)])
+    def test_sequential_without_pool_or_when_disabled(self, make_ipe_runner, pool, parallel):
+        runner = make_ipe_runner(connection_pool=pool, parallel_validations=parallel, **IPE)
+        read_sql, used = _fake_read_sql(_results())
+
+        with patch("src.core.runners.mssql_runner.pd.read_sql", side_effect=read_sql):
+            runner.run()
+
+        main_thread = threading.current_thread().name
+        assert {thread for _, thread in used.values()} == {main_thread}
+        assert runner.validation_results["overall_status"] == "SUCCESS"
@@ -18,6 +18,7 @@ from src.core.quality_checker import (
     NoNullsCheck,
     DataQualityEngine,
     QualityReport,
+    QualityRule,
 )
 
 
@@ -288,6 +289,27 @@ def test_quality_engine_some_fail():
     assert len(failures) == 3
 
 
+def test_quality_engine_custom_rule_without_profile():
+    """Test DataQualityEngine with a custom rule that only implements check()."""
+
+    class EvenRowCountCheck(QualityRule):
+        def check(self, df):
+            passed = len(df) % 2 == 0
+            return passed, f"{self.get_name()}: {'PASS' if passed else 'FAIL'}"
+
+        def get_name(self):
+            return "EvenRowCountCheck"
+
+    df = pd.DataFrame({"id": [1, 2, 3, 4]})
+    rules = [EvenRowCountCheck(), NoNullsCheck(column_name="id")]
+
+    engine = DataQualityEngine()
+    report = engine.run_checks(df, rules)
+
+    assert report.status == "PASS"
+    assert report.details[0] == "EvenRowCountCheck: PASS"
+
+
 def test_quality_engine_empty_rules():
     """Test DataQualityEngine with no rules."""
     df = pd.DataFrame({"A": [1, 2, 3]})
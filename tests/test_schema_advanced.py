@@ -12,7 +12,8 @@ from pathlib import Path
 import pandas as pd
 import pytest
 
-from src.core.schema import load_contract
+from src.core.schema import clear_cache, get_contract_plan, load_contract
+from src.core.schema.contract_plan import get_plan_cache_stats
 from src.core.schema.contract_registry import ContractRegistry
 from src.core.schema.loaders import (
     load_csv_with_schema,
@@ -380,3 +381,73 @@ class TestRealWorldScenarios:
         # Check both renames were logged
         assert "Customer No_" in report.columns_renamed
         assert "rem_amt_LCY" in report.columns_renamed
+
+
+class TestContractPlanCache:
+    """Test that compiled contract plans are cached per column set."""
+    
+    def test_plan_reused_for_same_columns(self):
+        """Test that the same contract and columns share one plan."""
+        contract = load_contract("IPE_07")
+        columns = ["Customer No_", "rem_amt_LCY", "extra"]
+        
+        plan = get_contract_plan(contract, columns)
+        
+        assert get_contract_plan(contract, pd.Index(columns)) is plan
+        assert get_contract_plan(contract, columns[:2]) is not plan
+        assert plan.rename_map == {"Customer No_": "customer_no", "rem_amt_LCY": "rem_amt_lcy"}
+        assert plan.unknown_columns == ("extra",)
+    
+    def test_plan_cache_cleared_with_contract_cache(self):
+        """Test that clear_cache() also drops compiled plans."""
+        get_contract_plan(load_contract("IPE_07"), ["customer_no"])
+        
+        clear_cache()
+        
+        assert get_plan_cache_stats()["size"] == 0
+    
+    def test_input_dataframe_not_modified(self):
+        """Test that renames and casts are applied to a single copy."""
+        df = pd.DataFrame({
+            "Customer No_": [" C001 "],
+            "rem_amt_LCY": ["1,000.00"],
+        })
+        
+        df_result, report = apply_schema_contract(
+            df, "IPE_07", strict=False, cast=True, track=True
+        )
+        
+        assert list(df.columns) == ["Customer No_", "rem_amt_LCY"]
+        assert df["rem_amt_LCY"][0] == "1,000.00"
+        assert df_result["rem_amt_lcy"][0] == 1000.0
+        assert "rem_amt_lcy" in report.columns_cast
+    
+    def test_repeated_chunks_hit_cache(self):
+        """Test that chunks with the same columns compile the plan once."""
+        clear_cache()
+        chunk = pd.DataFrame({"Customer No_": ["C001"], "rem_amt_LCY": [1.0]})
+        
+        results = [
+            apply_schema_contract(chunk, "IPE_07", strict=False, cast=True, track=False)[0]
+            for _ in range(3)
+        ]
+        
+        stats = get_plan_cache_stats()
+        assert stats["misses"] == 1
+        assert stats["hits"] == 2
+        pd.testing.assert_frame_equal(results[0], results[2])
+    
+    def test_drop_unknown_keeps_input_order(self):
+        """Test that dropping unknown columns keeps known columns in input order."""
+        df = pd.DataFrame({
+            "rem_amt_LCY": [1.0],
+            "extra": ["x"],
+            "Customer No_": ["C001"],
+        })
+        
+        df_result, report = apply_schema_contract(
+            df, "IPE_07", strict=False, cast=False, track=True, drop_unknown=True
+        )
+        
+        assert list(df_result.columns) == ["rem_amt_lcy", "customer_no"]
+        assert report.unknown_columns_kept == ["extra"]
@@ -7,10 +7,14 @@ import pandas as pd
 from datetime import datetime, timedelta
 
 from src.core.quality_checker import (
+    ColumnProfile,
     DTypeCheck,
     DateRangeCheck,
     SemanticValidityCheck,
     DataQualityEngine,
+    NoNullsCheck,
+    RowCountCheck,
+    SamplingConfig,
     build_quality_rules_from_schema
 )
 from src.core.schema import load_contract
@@ -183,3 +187,124 @@ class TestSchemaIntegration:
         # Should pass since data matches contract
         assert report.status == "PASS"
         assert len(report.details) > 0
+
+
+class TestColumnProfiles:
+    """Test that rules on the same column share one profile."""
+    
+    def _rules_and_data(self):
+        df = pd.DataFrame({
+            "amount": ["100.5", "bad", None, "3"],
+            "id": ["A1", "A1", None, "A3"],
+            "posted": ["2025-01-05", "not a date", "2025-03-01", None],
+        })
+        rules = [
+            DTypeCheck(column_name="amount", expected_dtype="float64"),
+            SemanticValidityCheck(column_name="amount", semantic_tag="amount"),
+            SemanticValidityCheck(column_name="id", semantic_tag="id"),
+            NoNullsCheck(column_name="id"),
+            SemanticValidityCheck(column_name="posted", semantic_tag="date"),
+            DateRangeCheck(column_name="posted", min_date=datetime(2025, 2, 1)),
+            DateRangeCheck(column_name="missing", max_date=datetime(2025, 2, 1)),
+            RowCountCheck(min_rows=1),
+        ]
+        return df, rules
+    
+    def test_engine_matches_individual_checks(self):
+        df, rules = self._rules_and_data()
+        
+        report = DataQualityEngine(max_workers=4).run_checks(df, rules)
+        
+        assert report.details == [rule.check(df)[1] for rule in rules]
+        assert report.status == "FAIL"
+    
+    def test_each_column_profiled_once(self, monkeypatch):
+        df, rules = self._rules_and_data()
+        profiled = []
+        original_build = ColumnProfile.build.__func__
+        
+        def counting_build(cls, series, stats):
+            profiled.append((series.name, frozenset(stats)))
+            return original_build(cls, series, stats)
+        
+        monkeypatch.setattr(ColumnProfile, "build", classmethod(counting_build))
+        DataQualityEngine(max_workers=1).run_checks(df, rules)
+        
+        assert sorted(name for name, _ in profiled) == ["amount", "id", "posted"]
+        assert dict(profiled)["id"] == {"nulls", "nunique"}
+    
+    def test_date_profile_min_max(self):
+        profile = ColumnProfile.build(
+            pd.Series(["2025-03-01", "2025-01-05", None], name="posted"), ["dates"]
+        )
+        
+        assert profile.date_min == pd.Timestamp("2025-01-05")
+        assert profile.date_max == pd.Timestamp("2025-03-01")
+        assert len(profile.valid_dates) == 2
+        assert profile.null_count is None
+
+
+class TestSampledChecks:
+    """Test the sampled mode of DataQualityEngine."""
+    
+    SAMPLING = SamplingConfig(sample_size=2_000, confidence=0.999, min_rows=10_000, random_state=7)
+    
+    def _large_df(self, invalid_amount_pct):
+        n = 50_000
+        n_invalid = int(n * invalid_amount_pct)
+        amounts = ["bad"] * n_invalid + [str(i) for i in range(n - n_invalid)]
+        return pd.DataFrame({
+            "amount": amounts,
+            "id": [f"V{i}" for i in range(n)],
+        })
+    
+    def test_clear_pass_decided_on_sample(self):
+        df = self._large_df(0.0)
+        rules = [
+            SemanticValidityCheck(column_name="amount", semantic_tag="amount"),
+            SemanticValidityCheck(column_name="id", semantic_tag="id"),
+            RowCountCheck(min_rows=1),
+        ]
+        
+        report = DataQualityEngine(sampling=self.SAMPLING).run_checks(df, rules)
+        
+        assert report.status == "PASS"
+        assert "sampled 2000 of 50000 rows" in report.details[0]
+        assert report.sampling["decided_on_sample"] == [
+            "SemanticValidityCheck(amount)", "SemanticValidityCheck(id)"
+        ]
+        assert report.sampling["full_scan_fallback"] == []
+        assert report.sampling["random_state"] == 7
+        assert "Sampled: 2000 of 50000 rows" in str(report)
+    
+    def test_near_threshold_falls_back_to_full_scan(self):
+        df = self._large_df(0.05)  # exactly 95% valid: too close to call on a sample
+        rule = SemanticValidityCheck(column_name="amount", semantic_tag="amount")
+        
+        report = DataQualityEngine(sampling=self.SAMPLING).run_checks(df, [rule])
+        
+        assert report.details == [rule.check(df)[1]]
+        assert report.status == "PASS"
+        assert report.sampling["full_scan_fallback"] == ["SemanticValidityCheck(amount)"]
+    
+    def test_failures_come_from_full_scan(self):
+        df = self._large_df(0.5)
+        rule = SemanticValidityCheck(column_name="amount", semantic_tag="amount")
+        
+        report = DataQualityEngine(sampling=self.SAMPLING).run_checks(df, [rule])
+        
+        assert report.status == "FAIL"
+        assert report.details == [rule.check(df)[1]]
+    
+    def test_small_extracts_not_sampled(self):
+        df = self._large_df(0.0).head(5_000)
+        rule = SemanticValidityCheck(column_name="amount", semantic_tag="amount")
+        
+        report = DataQualityEngine(sampling=self.SAMPLING).run_checks(df, [rule])
+        
+        assert report.sampling is None
+        assert report.details == [rule.check(df)[1]]
+    
+    def test_invalid_confidence_rejected(self):
+        with pytest.raises(ValueError):
+            SamplingConfig(confidence=1.0)
@@ -13,7 +13,12 @@ from src.core.schema import (
     load_contract,
     list_available_contracts,
 )
-from src.core.schema.schema_utils import apply_schema_contract, require_columns
+from src.core.schema.models import SchemaField, SemanticTag
+from src.core.schema.schema_utils import (
+    _coerce_by_semantic_tag,
+    apply_schema_contract,
+    require_columns,
+)
 
 
 class TestContractLoading:
@@ -131,6 +136,67 @@ class TestSchemaValidation:
         # Check report shows cast
         assert "amount_used" in report.columns_cast
     
+    def test_apply_schema_with_date_coercion(self):
+        """Test date coercion with contract formats, fallback and invalid values."""
+        df = pd.DataFrame({
+            "Posting Date": [
+                "2025-09-30", "2025-09-30 14:30:00", "31/08/2025",
+                "Sep 1 2025", "not a date", None,
+            ],
+        })
+        
+        df_result, report = apply_schema_contract(
+            df, "CR_03", strict=False, cast=True, track=True
+        )
+        
+        assert df_result["posting_date"].dtype == "datetime64[ns]"
+        assert df_result["posting_date"].tolist()[:4] == [
+            pd.Timestamp("2025-09-30"),
+            pd.Timestamp("2025-09-30"),
+            pd.Timestamp("2025-08-31"),
+            pd.Timestamp("2025-09-01"),
+        ]
+        assert df_result["posting_date"].iloc[4:].isna().all()
+        assert report.total_invalid_coerced == 1
+    
+    def test_ambiguous_slash_date_without_declared_formats(self):
+        """Undeclared fields keep month-first inference for ambiguous dates."""
+        field = SchemaField(name="value_date", required=False, semantic_tag=SemanticTag.DATE)
+        series = pd.Series(["01/02/2024", "2024-03-15", "13/02/2024"])
+        
+        result, invalid_count, _ = _coerce_by_semantic_tag(series, field)
+        
+        assert field.coercion_rules.date_formats == []
+        assert result.tolist() == [
+            pd.Timestamp("2024-01-02"),
+            pd.Timestamp("2024-03-15"),
+            pd.Timestamp("2024-02-13"),
+        ]
+        assert invalid_count == 0
+    
+    def test_ambiguous_slash_date_uses_only_declared_formats(self):
+        """A contract declaring only ISO formats does not parse day-first."""
+        df = pd.DataFrame({"Order Creation Date": ["01/02/2024", "2024-03-15 10:00:00"]})
+        
+        df_result, _ = apply_schema_contract(df, "IPE_10", strict=False, cast=True)
+        
+        assert df_result["order_creation_date"].tolist() == [
+            pd.Timestamp("2024-01-02"),
+            pd.Timestamp("2024-03-15"),
+        ]
+    
+    def test_ambiguous_slash_date_is_day_first_when_declared(self):
+        """A contract declaring %d/%m/%Y parses ambiguous slash dates day-first."""
+        df = pd.DataFrame({"Posting Date": ["01/02/2024", "12/03/2024", "13/02/2024"]})
+        
+        df_result, _ = apply_schema_contract(df, "CR_03", strict=False, cast=True)
+        
+        assert df_result["posting_date"].tolist() == [
+            pd.Timestamp("2024-02-01"),
+            pd.Timestamp("2024-03-12"),
+            pd.Timestamp("2024-02-13"),
+        ]
+    
     def test_strict_mode_missing_required(self):
         """Test that strict mode raises error on missing required columns."""
         df = pd.DataFrame({
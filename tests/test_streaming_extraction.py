@@ -0,0 +1,248 @@
+"""
+Tests for chunked streaming extraction in IPERunner.
+
+Uses a fake DB-API cursor so the streaming path (fetchmany, per-chunk schema
+casting, incremental hash and Parquet spooling) runs without a database.
+"""
+
+import json
+from decimal import Decimal
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+
+from src.core.evidence.integrity import DEFAULT_HASH_ALGORITHM, compute_integrity_hash
+from src.core.evidence.streaming import ChunkedDatasetWriter
+
+
+class FakeCursor:
+    """Minimal DB-API cursor serving rows through fetchmany."""
+
+    def __init__(self, columns, rows):
+        self.description = [(name,) for name in columns]
+        self._rows = list(rows)
+        self.fetch_sizes = []
+        self.closed = False
+
+    def execute(self, query, parameters):
+        self.query = query
+        self.parameters = parameters
+
+    def fetchmany(self, size):
+        self.fetch_sizes.append(size)
+        batch, self._rows = self._rows[:size], self._rows[size:]
+        return batch
+
+    def fetchall(self):
+        batch, self._rows = self._rows, []
+        return batch
+
+    def close(self):
+        self.closed = True
+
+
+class FailingCursor(FakeCursor):
+    """Cursor whose second fetchmany call fails, after one chunk is spooled."""
+
+    def fetchmany(self, size):
+        if self.fetch_sizes:
+            raise RuntimeError("connection lost")
+        return super().fetchmany(size)
+
+
+def _connect(cursor):
+    """_get_database_connection replacement serving the given cursor."""
+    connection = MagicMock()
+    connection.cursor.return_value = cursor
+    return MagicMock(return_value=connection)
+
+
+class TestRunStreaming:
+    """Tests for IPERunner.run_streaming."""
+
+    def test_chunks_are_spooled_and_materialized_on_demand(self, make_ipe_runner):
+        rows = [(f"K{i}", i * 1.5) for i in range(5)]
+        cursor = FakeCursor(["key", "value"], rows)
+        runner = make_ipe_runner("TEST_STREAM", connect=_connect(cursor), chunk_size=2)
+
+        dataset = runner.run_streaming()
+
+        assert cursor.fetch_sizes == [2, 2, 2, 2]
+        assert cursor.closed
+        assert len(dataset) == 5
+        assert len(dataset.part_files) == 3
+        assert runner.extracted_data is None
+
+        df = dataset.to_dataframe()
+        assert df["key"].tolist() == [f"K{i}" for i in range(5)]
+        assert df["value"].tolist() == [i * 1.5 for i in range(5)]
+        assert (df["_ipe_id"] == "TEST_STREAM").all()
+        assert df["_extraction_date"].nunique() == 1
+
+    def test_hash_matches_materialized_dataset(self, make_ipe_runner):
+        rows = [(f"K{i}", float(i)) for i in range(7)]
+        cursor = FakeCursor(["key", "value"], rows)
+        runner = make_ipe_runner("TEST_STREAM", connect=_connect(cursor), chunk_size=3)
+
+        dataset = runner.run_streaming()
+        expected = compute_integrity_hash(dataset.to_dataframe())
+
+        assert dataset.integrity_hash == expected
+        evidence_dir = Path(runner.evidence_generator.evidence_dir)
+        hash_info = json.loads((evidence_dir / "05_integrity_hash.json").read_text())
+        assert hash_info["hash_value"] == expected
+        assert hash_info["data_rows"] == 7
+        assert hash_info["algorithm"] == DEFAULT_HASH_ALGORITHM
+
+    def test_snapshot_written_from_streamed_tail(self, make_ipe_runner):
+        rows = [(f"K{i}", float(i)) for i in range(5)]
+        cursor = FakeCursor(["key", "value"], rows)
+        runner = make_ipe_runner("TEST_STREAM", connect=_connect(cursor), chunk_size=2)
+
+        runner.run_streaming()
+        evidence_dir = Path(runner.evidence_generator.evidence_dir)
+        summary = json.loads((evidence_dir / "04_data_summary.json").read_text())
+
+        assert summary["total_rows"] == 5
+        assert summary["extraction_mode"] == "streamed"
+        assert summary["numeric_statistics"]["value"]["max"] == 4.0
+        assert summary["numeric_statistics"]["value"]["mean"] == 2.0
+
+    def test_schema_contract_applied_per_chunk(self, make_ipe_runner):
+        rows = [("EC_NG", str(i), "1,000.50") for i in range(5)]
+        cursor = FakeCursor(["ID_Company", "Entry No_", "Original Amount"], rows)
+        runner = make_ipe_runner("IPE_07", connect=_connect(cursor), chunk_size=2)
+
+        df = runner.run_streaming().to_dataframe()
+
+        assert {"id_company", "entry_no", "original_amount"} <= set(df.columns)
+        assert df["original_amount"].tolist() == [1000.5] * 5
+        assert runner.schema_report.row_count_before == 5
+        rename_events = [e for e in runner.schema_report.events if e.event_type.value == "rename"]
+        assert len(rename_events) == len({e.before_name for e in rename_events})
+
+    @pytest.mark.filterwarnings("ignore::UserWarning")
+    @pytest.mark.parametrize("chunk_size", [None, 2])
+    def test_decimal_columns_match_read_sql(self, make_ipe_runner, chunk_size):
+        rows = [(f"K{i}", Decimal(f"{i}.25")) for i in range(5)]
+        cursor = FakeCursor(["key", "rate"], rows)
+        runner = make_ipe_runner("TEST_STREAM", connect=_connect(cursor), chunk_size=chunk_size)
+
+        df = runner.run()
+
+        assert df["rate"].dtype == "float64"
+        assert df["rate"].tolist() == [i + 0.25 for i in range(5)]
+        evidence_dir = Path(runner.evidence_generator.evidence_dir)
+        summary = json.loads((evidence_dir / "04_data_summary.json").read_text())
+        assert summary["data_types"]["rate"] == "float64"
+        assert summary["numeric_statistics"]["rate"]["max"] == 4.25
+
+    def test_empty_result_set(self, make_ipe_runner):
+        cursor = FakeCursor(["key", "value"], [])
+        runner = make_ipe_runner("TEST_STREAM", connect=_connect(cursor), chunk_size=2)
+
+        dataset = runner.run_streaming()
+
+        assert len(dataset) == 0
+        assert dataset.to_dataframe().empty
+        assert "key" in dataset.columns
+
+    def test_run_with_chunk_size_returns_dataframe(self, make_ipe_runner):
+        rows = [(f"K{i}", float(i)) for i in range(3)]
+        cursor = FakeCursor(["key", "value"], rows)
+        runner = make_ipe_runner("TEST_STREAM", connect=_connect(cursor), chunk_size=2)
+
+        df = runner.run()
+
+        assert isinstance(df, pd.DataFrame)
+        assert len(df) == 3
+        assert runner.get_validation_summary()["extracted_rows"] == 3
+
+    def test_run_with_chunk_size_removes_spool(self, make_ipe_runner):
+        rows = [(f"K{i}", float(i)) for i in range(5)]
+        cursor = FakeCursor(["key", "value"], rows)
+        runner = make_ipe_runner("TEST_STREAM", connect=_connect(cursor), chunk_size=2)
+
+        df = runner.run()
+
+        assert len(df) == 5
+        assert runner.streamed_dataset.part_files == []
+        assert not runner.streamed_dataset.data_dir.exists()
+
+    def test_context_manager_removes_spool(self, make_ipe_runner):
+        rows = [(f"K{i}", float(i)) for i in range(5)]
+        cursor = FakeCursor(["key", "value"], rows)
+        runner = make_ipe_runner("TEST_STREAM", connect=_connect(cursor), chunk_size=2)
+
+        with runner.run_streaming() as dataset:
+            data_dir = dataset.data_dir
+            assert len(list(data_dir.glob("part-*.parquet"))) == 3
+            assert len(dataset.to_dataframe()) == 5
+
+        assert not data_dir.exists()
+
+    def test_failed_extraction_removes_partial_spool(self, make_ipe_runner):
+        rows = [(f"K{i}", float(i)) for i in range(5)]
+        cursor = FailingCursor(["key", "value"], rows)
+        runner = make_ipe_runner("TEST_STREAM", connect=_connect(cursor), chunk_size=2)
+
+        with pytest.raises(Exception, match="connection lost"):
+            runner.run_streaming()
+
+        evidence_dir = Path(runner.evidence_generator.evidence_dir)
+        data_dir = evidence_dir.parent / f"{evidence_dir.name}_data"
+        assert cursor.fetch_sizes == [2]
+        assert cursor.closed
+        assert not data_dir.exists()
+        assert runner.streamed_dataset is None
+
+    def test_invalid_chunk_size(self, make_ipe_runner):
+        with pytest.raises(ValueError):
+            make_ipe_runner("TEST_STREAM", connect=_connect(FakeCursor([], [])), chunk_size=-1)
+
+
+class TestChunkedDatasetWriter:
+    """Tests for the chunk spooler."""
+
+    def test_tail_spans_chunks(self, tmp_path):
+        writer = ChunkedDatasetWriter(tmp_path / "data", tail_rows=3)
+        writer.write(pd.DataFrame({"a": [1, 2]}))
+        writer.write(pd.DataFrame({"a": [3, 4]}))
+
+        assert writer.tail(3)["a"].tolist() == [2, 3, 4]
+        assert writer.row_count == 4
+
+    def test_mixed_object_column_is_stored_as_string(self, tmp_path, caplog):
+        writer = ChunkedDatasetWriter(tmp_path / "data")
+        with caplog.at_level("WARNING"):
+            writer.write(pd.DataFrame({"a": ["x", 1, None], "b": ["p", "q", "r"]}))
+
+        df = writer.close().to_dataframe()
+        assert df["a"].tolist()[:2] == ["x", "1"]
+        assert pd.isna(df["a"].iloc[2])
+        assert df["b"].tolist() == ["p", "q", "r"]
+        assert writer.stringified_columns == ["a"]
+        assert any("['a']" in r.message for r in caplog.records if r.levelname == "WARNING")
+
+    def test_stringified_columns_recorded_in_summary(self, make_ipe_runner):
+        rows = [("K1", "x"), ("K2", 5)]
+        cursor = FakeCursor(["key", "mixed"], rows)
+        runner = make_ipe_runner("TEST_STREAM", connect=_connect(cursor), chunk_size=2)
+
+        runner.run_streaming()
+        evidence_dir = Path(runner.evidence_generator.evidence_dir)
+        summary = json.loads((evidence_dir / "04_data_summary.json").read_text())
+
+        assert summary["stringified_columns"] == ["mixed"]
+
+    def test_discard_removes_part_files(self, tmp_path):
+        writer = ChunkedDatasetWriter(tmp_path / "data")
+        writer.write(pd.DataFrame({"a": [1, 2]}))
+        assert (tmp_path / "data" / "part-00000.parquet").exists()
+
+        writer.discard()
+
+        assert not (tmp_path / "data").exists()
+        assert writer.part_files == []
@@ -4,10 +4,15 @@ Unit Tests for Threshold Catalog System.
 Tests YAML loading, hashing, precedence resolution, and fallback behavior.
 """
 
+import itertools
 import os
+import shutil
+import threading
 import pytest
 from pathlib import Path
 
+import pandas as pd
+
 from src.core.reconciliation.thresholds import (
     ThresholdType,
     ThresholdScope,
@@ -22,6 +27,9 @@ from src.core.reconciliation.thresholds import (
     resolve_line_item_threshold,
     get_fallback_threshold,
     clear_cache,
+    get_cache_stats,
+    ThresholdIndex,
+    get_threshold_index,
 )
 
 
@@ -256,6 +264,51 @@ class TestThresholdRegistry:
         assert contract1 is contract2
         assert hash1 == hash2
     
+    def test_cache_stats_count_hits_and_misses(self):
+        """Repeated lookups parse the contract once."""
+        for _ in range(5):
+            get_contract("EG")
+        
+        stats = get_cache_stats()
+        assert stats["misses"] == 1
+        assert stats["hits"] == 4
+        assert stats["size"] == 1
+    
+    def test_modified_contract_file_is_reloaded(self, tmp_path, monkeypatch):
+        """Editing a contract file misses the cache and changes the hash."""
+        from src.core.reconciliation.thresholds import registry
+        
+        contract_file = tmp_path / "DEFAULT.yaml"
+        shutil.copy(registry.get_contracts_dir() / "DEFAULT.yaml", contract_file)
+        monkeypatch.setattr(registry, "get_contracts_dir", lambda: tmp_path)
+        
+        contract1, hash1 = get_contract("DEFAULT")
+        assert get_contract("DEFAULT")[0] is contract1
+        
+        contract_file.write_text(contract_file.read_text() + "\n# edited\n")
+        contract2, hash2 = get_contract("DEFAULT")
+        
+        assert contract2 is not contract1
+        assert hash2 != hash1
+        assert get_cache_stats()["misses"] == 2
+        assert get_cache_stats()["size"] == 1
+    
+    def test_concurrent_lookups_parse_once(self):
+        """Threads share one cached contract."""
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(get_contract("EG")))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert get_cache_stats()["misses"] == 1
+        assert len(results) == 8
+        assert all(result[0] is results[0][0] for result in results)
+    
     def test_version_pinning_env_var(self):
         """Test version pinning via environment variable."""
         # Set environment variable
@@ -394,5 +447,76 @@ class TestThresholdIntegration:
         assert line_item.value_usd > 0
 
 
+class TestThresholdIndex:
+    """The compiled index must resolve exactly like resolve_threshold."""
+    
+    def test_resolve_frame_matches_resolve_threshold(self):
+        """Every key combination resolves to the same threshold and metadata."""
+        keys = pd.DataFrame(
+            list(itertools.product(
+                ["EG", "NG", "XX", None],
+                ["18412", "99999", None, ""],
+                ["Issuance", "Usage", None],
+                ["refund", "apology", None],
+                list(ThresholdType),
+            )),
+            columns=["country_code", "gl_account", "category", "voucher_type", "threshold_type"],
+        )
+        
+        resolved = get_threshold_index().resolve_frame(keys)
+        
+        assert list(resolved.index) == list(keys.index)
+        for idx, key in keys.iterrows():
+            expected = resolve_threshold(
+                key["country_code"], key["threshold_type"],
+                key["gl_account"], key["category"], key["voucher_type"],
+            ).to_dict()
+            actual = resolved.loc[idx]
+            for col in resolved.columns:
+                assert actual[col] == expected[col], (idx, col)
+    
+    def test_resolve_single_key(self):
+        """resolve() returns a ResolvedThreshold like resolve_threshold."""
+        index = get_threshold_index()
+        assert index.resolve("EG", ThresholdType.BUCKET_USD, gl_account="18412") == resolve_threshold(
+            "EG", ThresholdType.BUCKET_USD, gl_account="18412"
+        )
+    
+    def test_resolve_frame_keeps_index_and_accepts_values(self):
+        """threshold_type may be given as its string value; index is preserved."""
+        keys = pd.DataFrame({
+            "country_code": ["EG", "EG"],
+            "gl_account": ["18412", "18412"],
+            "category": [None, None],
+            "voucher_type": [None, None],
+            "threshold_type": ["BUCKET_USD", ThresholdType.BUCKET_USD],
+        }, index=[10, 20])
+        
+        resolved = get_threshold_index().resolve_frame(keys)
+        
+        assert list(resolved.index) == [10, 20]
+        assert resolved["value_usd"].nunique() == 1
+    
+    def test_empty_and_invalid_keys(self):
+        """Empty keys give an empty frame; missing columns raise."""
+        index = get_threshold_index()
+        empty = pd.DataFrame(columns=["country_code", "gl_account", "category", "voucher_type", "threshold_type"])
+        assert index.resolve_frame(empty).empty
+        with pytest.raises(ValueError):
+            index.resolve_frame(pd.DataFrame({"country_code": ["EG"]}))
+    
+    def test_unloaded_contracts_fall_back(self):
+        """An index without contracts resolves every key to the fallback."""
+        resolved = ThresholdIndex({}).resolve("EG", ThresholdType.BUCKET_USD)
+        assert resolved == get_fallback_threshold(ThresholdType.BUCKET_USD, "EG")
+    
+    def test_index_cached_and_cleared(self):
+        """get_threshold_index is cached until clear_cache()."""
+        index = get_threshold_index()
+        assert get_threshold_index() is index
+        clear_cache()
+        assert get_threshold_index() is not index
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -260,3 +260,68 @@ class TestBackwardCompatibility:
             result1 = classifier_lookup(voucher_no, doc_no, ipe_08_df, doc_voucher_usage_df)
             result2 = usage_lookup(voucher_no, doc_no, ipe_08_df, doc_voucher_usage_df)
             assert result1 == result2, f"Implementations differ for ({voucher_no}, {doc_no})"
+
+
+class TestVoucherTypeIndex:
+    """Tests for the hash-indexed VoucherTypeIndex"""
+
+    @pytest.fixture
+    def tv_frames(self):
+        ipe_08_df = pd.DataFrame({
+            "id": ["V001", " V002", "V003", "V001"],
+            "business_use": ["refund", "apology", "store_credit", "jforce"],
+            "Transaction_No": ["TRX-IPE-1", "TRX-IPE-2", None, "TRX-IPE-3"],
+        })
+        doc_voucher_usage_df = pd.DataFrame({
+            "id": [101, 102, "V001"],
+            "business_use": ["jforce", "", "apology"],
+            "Transaction_No": ["TRX001", " TRX002 ", "TRX003"],
+        })
+        return ipe_08_df, doc_voucher_usage_df
+
+    CASES = [
+        ("V001", "DOC123"),     # IPE_08 id (first occurrence wins)
+        ("V002", "DOC123"),     # IPE_08 id with whitespace
+        ("101", "DOC123"),      # Usage id, numeric in TV file
+        ("102", "TRX001"),      # Usage id with empty business_use
+        ("", "TRX001"),         # Usage Transaction_No fallback
+        ("V999", "TRX002"),     # Empty business_use skipped on fallback
+        (None, "TRX-IPE-2"),    # IPE_08 Transaction_No fallback
+        ("V999", "NOPE"),       # No match
+        ("", ""),               # Nothing to look up
+    ]
+
+    def test_lookup_matches_lookup_voucher_type(self, tv_frames):
+        """Test that index lookups match the scan-based lookup_voucher_type"""
+        from src.core.reconciliation.voucher_classification.voucher_utils import VoucherTypeIndex
+
+        ipe_08_df, doc_voucher_usage_df = tv_frames
+        index = VoucherTypeIndex(ipe_08_df, doc_voucher_usage_df)
+
+        for voucher_no, doc_no in self.CASES:
+            expected = lookup_voucher_type(voucher_no, doc_no, ipe_08_df, doc_voucher_usage_df)
+            assert index.lookup(voucher_no, doc_no) == expected, f"Mismatch for ({voucher_no}, {doc_no})"
+
+    def test_lookup_many_matches_scalar_lookup(self, tv_frames):
+        """Test that the batched lookup gives the same results as per-pair lookups"""
+        from src.core.reconciliation.voucher_classification.voucher_utils import VoucherTypeIndex
+
+        ipe_08_df, doc_voucher_usage_df = tv_frames
+        index = VoucherTypeIndex(ipe_08_df, doc_voucher_usage_df)
+
+        voucher_nos = pd.Series([v for v, _ in self.CASES], index=[10, 11, 12, 13, 14, 15, 16, 17, 17])
+        doc_nos = pd.Series([d for _, d in self.CASES], index=voucher_nos.index)
+        result = index.lookup_many(voucher_nos, doc_nos)
+
+        assert list(result.index) == list(voucher_nos.index)
+        expected = [index.lookup(v, d) for v, d in self.CASES]
+        assert result.tolist() == expected
+
+    def test_empty_and_missing_sources(self):
+        """Test that missing TV files or columns resolve to None"""
+        from src.core.reconciliation.voucher_classification.voucher_utils import VoucherTypeIndex
+
+        index = VoucherTypeIndex(None, pd.DataFrame({"id": ["V101"], "Transaction_No": ["TRX001"]}))
+        assert index.lookup("V101", "TRX001") is None
+        result = index.lookup_many(pd.Series(["V101"]), pd.Series(["TRX001"]))
+        assert result.tolist() == [None]